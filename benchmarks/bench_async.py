@@ -0,0 +1,58 @@
+"""
+Benchmark of `date_calc.aio.AsyncDateCalculator`: the lag of the event loop, measured by a
+1 ms ticker, while concurrent bulk requests run, compared with calling the batch API directly
+in a coroutine, which blocks the loop for the whole request.
+
+Usage:
+    poetry run python benchmarks/bench_async.py
+"""
+import asyncio
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from date_calc.aio import AsyncDateCalculator
+from date_calc.utils.date_calculator import DateCalculator
+
+STARTS = np.arange(2_000_000) % 700_000 + 100_000
+
+
+async def measure(requests) -> tuple[float, float, float]:
+    """Run the requests concurrently; return the elapsed time and the p99 and maximum lag of the loop."""
+    lags: list[float] = []
+
+    async def ticker() -> None:
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(0.001)
+            lags.append(time.perf_counter() - start - 0.001)
+
+    task = asyncio.create_task(ticker())
+    await asyncio.sleep(0.01)
+    start = time.perf_counter()
+    await asyncio.gather(*requests())
+    elapsed = time.perf_counter() - start
+    await asyncio.sleep(0.005)  # let the ticker record its last lag
+    task.cancel()
+    lags.sort()
+    return elapsed, lags[int(len(lags) * 0.99)], lags[-1]
+
+
+def main() -> None:
+    async def blocking(_):
+        return DateCalculator.new_date_with_interval_of_days_batch(initial_dates=STARTS, intervals=5, type_of_days="business")
+
+    facades = {"inline (blocking)": None, "thread executor": AsyncDateCalculator()}
+    with ProcessPoolExecutor() as executor:
+        facades["process executor"] = AsyncDateCalculator(executor)
+        for name, facade in facades.items():
+            call = blocking if facade is None else lambda f: f.new_date_with_interval_of_days_batch(
+                initial_dates=STARTS, intervals=5, type_of_days="business"
+            )
+            elapsed, p99, worst = asyncio.run(measure(lambda: [call(facade) for _ in range(4)]))
+            print(f"{name:<18} 4 x {len(STARTS):,} dates in {elapsed:5.2f} s   loop lag p99 {p99 * 1e3:7.2f} ms   max {worst * 1e3:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Benchmark of `dtcalc batch` throughput against the number of worker processes.
+
+Generates a CSV batch of mixed calc/diff rows, runs it with 1, 2, 4, ... workers up to the
+number of CPUs, checks that every run writes the same output, and prints rows per second
+and the speedup over a single process.
+
+Usage:
+    poetry run python benchmarks/bench_batch_workers.py [ROWS]
+"""
+import hashlib
+import os
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+from date_calc.runner import DefaultRunner
+
+
+def write_rows(path: Path, rows: int) -> None:
+    """Write a CSV batch with `rows` rows, half business-day offsets and half differences."""
+    start = date(2020, 1, 1)
+    with open(path, "w", encoding="utf-8", newline="") as file:
+        file.write("operation,date,end_date,interval,type_of_days\n")
+        for i in range(rows):
+            day = start + timedelta(days=i % 3000)
+            if i % 2:
+                file.write(f"calc,{day:%d-%m-%Y},,{i % 120 - 60},business\n")
+            else:
+                file.write(f"diff,{day:%d-%m-%Y},{day + timedelta(days=i % 400):%d-%m-%Y},,business\n")
+
+
+def main() -> None:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+    cpus = os.cpu_count() or 1
+    counts = sorted({1, cpus} | {2 ** n for n in range(1, cpus.bit_length()) if 2 ** n <= cpus})
+
+    with tempfile.TemporaryDirectory() as folder:
+        source, output = Path(folder) / "rows.csv", Path(folder) / "out.csv"
+        write_rows(source, rows)
+        print(f"{rows:,} rows, {source.stat().st_size / 2 ** 20:,.0f} MiB, {cpus} CPU(s)")
+
+        baseline = digest = None
+        for workers in counts:
+            started = time.perf_counter()
+            DefaultRunner().batch(source, output, workers=workers)
+            elapsed = time.perf_counter() - started
+
+            current = hashlib.sha256(output.read_bytes()).hexdigest()
+            assert digest in (None, current), "outputs differ between worker counts"
+            digest = current
+            baseline = baseline or elapsed
+            print(f"{workers:>3} worker(s): {elapsed:7.2f} s | {rows / elapsed:12,.0f} rows/s | x{baseline / elapsed:5.2f}")
+
+
+if __name__ == "__main__":
+    main()
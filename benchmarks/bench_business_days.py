@@ -0,0 +1,44 @@
+"""
+Benchmark of `DateCalculator.business_days` (closed form) against the day-by-day loop
+it replaced.
+
+Usage:
+    poetry run python benchmarks/bench_business_days.py
+"""
+import timeit
+from datetime import date, timedelta
+
+from date_calc.utils.date_calculator import DateCalculator
+
+
+def business_days_by_loop(initial_date: date, final_date: date) -> int:
+    """Previous implementation: walks the range one day at a time."""
+    business_days = 0
+    while initial_date < final_date:
+        if initial_date.weekday() < 5:
+            business_days += 1
+        initial_date += timedelta(days=1)
+    return business_days
+
+
+def main() -> None:
+    initial_date = date(2025, 1, 1)
+    for years in (1, 10, 30):
+        final_date = initial_date + timedelta(days=365 * years)
+        assert business_days_by_loop(initial_date, final_date) == DateCalculator.business_days(
+            initial_date=initial_date, final_date=final_date
+        )
+
+        number = 20 if years > 1 else 200
+        loop = min(timeit.repeat(lambda: business_days_by_loop(initial_date, final_date), number=number, repeat=3)) / number
+        number = 200_000
+        fast = min(timeit.repeat(
+            lambda: DateCalculator.business_days(initial_date=initial_date, final_date=final_date),
+            number=number, repeat=3,
+        )) / number
+
+        print(f"{years:>3} year(s): loop {loop * 1e6:10.2f} us | closed form {fast * 1e6:6.3f} us | x{loop / fast:,.0f}")
+
+
+if __name__ == "__main__":
+    main()
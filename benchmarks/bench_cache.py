@@ -0,0 +1,37 @@
+"""
+Benchmark of `CachedDateCalculator.business_days`: a cache hit against a miss (a direct
+`DateCalculator.business_days` call), for the default calendar and one with 400 holidays.
+
+The calendar is part of every cache key, so a hit must not rehash its holidays.
+
+Usage:
+    poetry run python benchmarks/bench_cache.py
+"""
+import timeit
+from datetime import date, timedelta
+
+from date_calc.utils.business_calendar import BusinessCalendar, DEFAULT_CALENDAR
+from date_calc.utils.cache import CachedDateCalculator
+from date_calc.utils.date_calculator import DateCalculator
+
+
+def main() -> None:
+    initial_date, final_date = date(2025, 1, 1), date(2026, 6, 30)
+    holidays = BusinessCalendar(date(2000, 1, 3) + timedelta(days=7 * week) for week in range(400))
+    number = 200_000
+    for label, calendar in (("default", DEFAULT_CALENDAR), ("400 holidays", holidays)):
+        cached = CachedDateCalculator()
+        cached.business_days(initial_date=initial_date, final_date=final_date, calendar=calendar)
+        hit = min(timeit.repeat(
+            lambda: cached.business_days(initial_date=initial_date, final_date=final_date, calendar=calendar),
+            number=number, repeat=3,
+        )) / number
+        miss = min(timeit.repeat(
+            lambda: DateCalculator.business_days(initial_date=initial_date, final_date=final_date, calendar=calendar),
+            number=number, repeat=3,
+        )) / number
+        print(f"{label:>12}: hit {hit * 1e6:6.3f} us | miss {miss * 1e6:6.3f} us | x{miss / hit:,.2f}")
+
+
+if __name__ == "__main__":
+    main()
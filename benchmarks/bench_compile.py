@@ -0,0 +1,48 @@
+"""
+Benchmark of `dtcalc compile` on a large translation tree: a cold build with 1 worker and
+with every CPU, and an incremental run on the unchanged tree.
+
+Usage:
+    poetry run python benchmarks/bench_compile.py [LANGUAGES] [MESSAGES]
+"""
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+from date_calc.translate.compile import MANIFEST_NAME, compile_po_2_mo
+
+
+def make_tree(root: Path, languages: int, messages: int) -> None:
+    entries = "".join(f'msgid "Message number {n}"\nmsgstr "Mensagem número {n}"\n\n' for n in range(messages))
+    for number in range(languages):
+        folder = root.joinpath(f"l{number:03d}_XX", "LC_MESSAGES")
+        folder.mkdir(parents=True)
+        folder.joinpath("app.po").write_text(
+            'msgid ""\nmsgstr ""\n"Content-Type: text/plain; charset=UTF-8\\n"\n\n' + entries, encoding="utf-8"
+        )
+
+
+def clean(root: Path) -> None:
+    for mo_file in root.rglob("*.mo"):
+        mo_file.unlink()
+    root.joinpath(MANIFEST_NAME).unlink(missing_ok=True)
+
+
+def main() -> None:
+    languages = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+    messages = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    root = Path(tempfile.mkdtemp())
+    make_tree(root, languages, messages)
+    print(f"{languages} .po files of {messages} messages, {os.cpu_count()} CPUs")
+
+    for workers in sorted({1, os.cpu_count() or 1}):
+        clean(root)
+        summary = compile_po_2_mo(root, workers)
+        print(f"cold, {workers:>2} workers: {summary.compiled} compiled in {summary.seconds:.2f} s")
+    summary = compile_po_2_mo(root)
+    print(f"unchanged tree:    {summary.skipped} skipped in {summary.seconds * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
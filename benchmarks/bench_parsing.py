@@ -0,0 +1,43 @@
+"""
+Benchmark of `date_calc.utils.parsing` against `datetime.strptime` and `dateutil.parser.parse`.
+
+Parses a stream of DD-MM-YYYY dates twice: all distinct (no memo hits) and drawn from one
+year of dates (the usual case for batch files, mostly memo hits).
+
+Usage:
+    poetry run python benchmarks/bench_parsing.py
+"""
+import random
+import timeit
+from datetime import date, datetime, timedelta
+
+from dateutil.parser import parse as dateutil_parse
+
+from date_calc.utils.parsing import PARSERS, DateParser
+
+
+def main() -> None:
+    start = date(1900, 1, 1)
+    distinct = [(start + timedelta(days=i)).strftime("%d-%m-%Y") for i in range(50_000)]
+    random.seed(1)
+    repeated = [random.choice(distinct[:365]) for _ in range(50_000)]
+
+    candidates = {
+        "dateutil.parser.parse": lambda values: [dateutil_parse(v, dayfirst=True).date() for v in values],
+        "datetime.strptime": lambda values: [datetime.strptime(v, "%d-%m-%Y").date() for v in values],
+        "fixed-format parser": lambda values: list(map(PARSERS["DD-MM-YYYY"], values)),
+        "DateParser (memoized)": lambda values: list(map(DateParser(), values)),
+    }
+
+    for label, values in (("distinct", distinct), ("repeated", repeated)):
+        expected = candidates["datetime.strptime"](values)
+        print(f"{len(values):,} {label} dates")
+        for name, parse in candidates.items():
+            assert parse(values) == expected, name
+            number = 1 if name.startswith("dateutil") else 5
+            seconds = min(timeit.repeat(lambda: parse(values), number=number, repeat=3)) / number
+            print(f"  {name:<24} {seconds / len(values) * 1e9:9.0f} ns/date")
+
+
+if __name__ == "__main__":
+    main()
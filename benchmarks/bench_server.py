@@ -0,0 +1,64 @@
+"""
+Benchmark of the `serve` daemon: per-query latency over the Unix socket, with concurrent
+clients, and pipelined throughput, against the start-up of one `dtcalc calc` process.
+
+Usage:
+    poetry run python benchmarks/bench_server.py
+"""
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from date_calc.client import DateCalcClient
+
+QUERY = {"operation": "calc", "date": "06-10-2025", "interval": 25, "type_of_days": "business"}
+
+
+def latencies(socket_path: Path, clients: int, queries: int) -> list[float]:
+    results: list[float] = []
+
+    def run() -> None:
+        with DateCalcClient(socket_path) as client:
+            for _ in range(queries):
+                start = time.perf_counter()
+                client.query(QUERY)
+                results.append(time.perf_counter() - start)
+
+    threads = [threading.Thread(target=run) for _ in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return sorted(results)
+
+
+def main() -> None:
+    socket_path = Path(tempfile.mkdtemp()) / "dtcalc.sock"
+    daemon = subprocess.Popen([sys.executable, "-c", "from date_calc.__main__ import main; main()", "serve", "--socket", str(socket_path)])
+    try:
+        while not socket_path.exists():
+            time.sleep(0.05)
+        for clients in (1, 4, 16):
+            values = latencies(socket_path, clients, 2000)
+            p50, p99 = statistics.median(values), values[int(len(values) * 0.99)]
+            print(f"{clients:>2} clients: p50 {p50 * 1e6:7.0f} us   p99 {p99 * 1e6:7.0f} us")
+
+        with DateCalcClient(socket_path) as client:
+            start = time.perf_counter()
+            count = sum(1 for _ in client.query_many([QUERY] * 100_000))
+            print(f"pipelined: {count / (time.perf_counter() - start):,.0f} queries/s")
+
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", "from date_calc.__main__ import main; main()", "calc", "06-10-2025", "25"], check=True, capture_output=True)
+        print(f"one dtcalc process: {(time.perf_counter() - start) * 1e3:.0f} ms")
+    finally:
+        daemon.terminate()
+        daemon.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,36 +1,63 @@
-import logging
-
-from pathlib import Path
-ICON_PATH: Path = Path(__file__).parent.joinpath("assets")
-
-
-import ttkbootstrap as ttk
-type TkContainer = ttk.Window | ttk.Frame | ttk.Labelframe | ttk.Toplevel
-
-
-from rich.traceback import install
-try:
-    install(show_locals=True)
-    logging.info("Rich traceback installed successfully.")
-except Exception as e:
-    logging.warning(f"Failed to install rich traceback: {e}")
-
-from date_calc.config import get_settings
-settings = get_settings()
-
-from date_calc.config import config_locale_app
-config_locale_app()
-
-# using gettext
-import gettext
-from date_calc.translate import translate_with_gettext
-try:
-    _translate = translate_with_gettext(lang='pt_BR')
-    _translate.install()
-    t = _translate.gettext
-except FileNotFoundError as e:
-    logging.warning(f"Translation files not found. Using NullTranslations. Error: {e}")
-    t = gettext.NullTranslations().gettext
-except Exception as e:
-    logging.warning(f"Error loading translations: {e}")
-    t = gettext.NullTranslations().gettext
\ No newline at end of file
+# Importing date_calc has no side effects: no I/O, no imports beyond the standard library
+# modules of the submodule being imported, and no change to global state (locale, gettext,
+# sys.excepthook), so that the calculation core is cheap to import in workers. The GUI
+# toolkit, the settings, the translations and the assets path are loaded on first access to
+# `TkContainer`, `settings`, `t` and `ICON_PATH` (see `__getattr__`); the entry points call
+# `install_excepthook`.
+
+
+def install_excepthook() -> None:
+    """Print the uncaught exceptions of the process with rich; called by the entry points."""
+    import sys
+    sys.excepthook = _rich_excepthook
+
+
+def _rich_excepthook(exc_type, exc_value, traceback) -> None:
+    """Print uncaught exceptions with rich; rich is only imported when one happens."""
+    import sys
+    try:
+        from rich.console import Console
+        from rich.traceback import Traceback
+        Console(stderr=True).print(Traceback.from_exception(exc_type, exc_value, traceback, show_locals=True))
+    except Exception as e:
+        import logging
+        logging.warning(f"Failed to print rich traceback: {e}")
+        sys.__excepthook__(exc_type, exc_value, traceback)
+
+
+def _load_translations():
+    """Configure the locale and return the gettext function of the shared pt_BR catalog."""
+    import gettext
+    import logging
+    from date_calc.config import config_locale_app
+    from date_calc.translate import translate_with_gettext
+
+    config_locale_app()
+    try:
+        return translate_with_gettext(lang='pt_BR').gettext
+    except FileNotFoundError as e:
+        logging.warning(f"Translation files not found. Using NullTranslations. Error: {e}")
+        return gettext.NullTranslations().gettext
+    except Exception as e:
+        logging.warning(f"Error loading translations: {e}")
+        return gettext.NullTranslations().gettext
+
+
+def __getattr__(name: str):
+    if name == "ICON_PATH":
+        from pathlib import Path
+        value = Path(__file__).parent.joinpath("assets")
+    elif name == "TkContainer":
+        import ttkbootstrap as ttk
+        type TkContainer = ttk.Window | ttk.Frame | ttk.Labelframe | ttk.Toplevel
+        value = TkContainer
+    elif name == "settings":
+        from date_calc.config import get_settings
+        value = get_settings()
+    elif name == "t":
+        value = _load_translations()
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
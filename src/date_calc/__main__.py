@@ -1,26 +1,86 @@
+import os
+import sys
 from datetime import datetime
+from typing import Any
 
+from date_calc import install_excepthook
 from date_calc.cli import create_parser
+from date_calc.output import JsonRecordWriter, open_writer
 from date_calc.runner import DefaultRunner
 
 
+def _write_record(record: dict[str, Any], output_format: str) -> None:
+    """Write the record of a calc/diff command to stdout; a JSON record is a single object."""
+    if output_format == "json":
+        writer = JsonRecordWriter(sys.stdout, record, array=False)
+    else:
+        writer = open_writer(output_format, sys.stdout, record)
+    with writer:
+        writer.write(record)
+    if record["error"]:
+        sys.exit(1)
+
+
 def main():
+    install_excepthook()
     parser = create_parser()
     args = parser.parse_args()
     runner = DefaultRunner()
+    if args.command in ('calc', 'diff') and (socket_path := args.socket or os.environ.get('DTCALC_SOCKET')):
+        from date_calc.client import RemoteRunner
+
+        runner = RemoteRunner.connect(socket_path) or runner
 
     if args.command == 'calc':
-        
+        if args.format != 'text':
+            _write_record(runner.sum_record(args.date, args.interval), args.format)
+            return
+
         result = getattr(runner, 'sum')(args.date, args.interval)
 
         print(f"Resulting date: {result}")
 
     elif args.command == 'diff':
-        days = runner.diff(args.start, args.end)
+        if args.matrix:
+            if args.start or args.end:
+                parser.error("diff: give either two dates or --matrix, not both")
+            try:
+                runner.diff_matrix(*args.matrix, 'csv' if args.format == 'text' else args.format, args.type_of_days)
+            except (ImportError, OSError, ValueError) as e:  # ImportError: NumPy is missing
+                print(e, file=sys.stderr)
+                sys.exit(1)
+            return
+        if args.end is None:
+            parser.error("diff: the following arguments are required: start, end (or --matrix)")
+
+        if args.format != 'text':
+            _write_record(runner.diff_record(args.start, args.end, args.type_of_days), args.format)
+            return
+
+        days = runner.diff(args.start, args.end, args.type_of_days)
         print(f"Difference in days: {days}")
 
+    elif args.command == 'batch':
+        summary = runner.batch(args.input, args.output, args.input_format, args.workers, args.format)
+        if summary.errors:
+            print(f"{summary.errors} of {summary.rows} rows failed.", file=sys.stderr)
+            sys.exit(1)
+
+    elif args.command == 'serve':
+        if args.socket is None and args.http is None:
+            from date_calc.client import default_socket_path
+
+            args.socket = default_socket_path()
+        try:
+            runner.serve(args.socket, args.http, args.host)
+        except OSError as e:
+            print(f"dtcalc serve: {e}", file=sys.stderr)
+            sys.exit(1)
+
     elif args.command == 'compile':
-        runner.compile_translations(args.path)
+        summary = runner.compile_translations(args.path, args.workers, args.force)
+        if summary.failed:
+            sys.exit(1)
 
     elif args.command in ['iter', 'initialize', 'init', 'iterative', 'ini']:
         runner.enter_interactive_mode()
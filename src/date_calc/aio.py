@@ -0,0 +1,239 @@
+"""
+This module provides `AsyncDateCalculator`, an asyncio facade of `DateCalculator` for
+async services (aiohttp, FastAPI, ...).
+
+Scalar calls are run inline: they are a few arithmetic operations and bisections in the
+calendar's holiday index, cheaper than a round trip through an executor. Bulk calls (the
+`*_batch` methods and `business_day_list`) are sent to an executor, split into chunks of
+`chunk_size` dates. At most `max_pending` chunks, of all requests, are in the executor at a
+time, and chunks wait for a slot in arrival order, so a very large request is interleaved
+with the others instead of monopolising the executor, and the event loop itself only slices
+the inputs. Results are joined in the executor too.
+
+Latency: with the default thread executor, the event loop stays responsive while bulk calls
+run; tests/test_aio.py checks the lag of a 1 ms ticker while millions of dates are processed,
+and benchmarks/bench_async.py reports it. A `ProcessPoolExecutor` avoids contention for the
+GIL, at the cost of copying the chunks to the workers.
+"""
+
+import asyncio
+import os
+from concurrent.futures import Executor
+from datetime import date, datetime
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Literal
+
+from date_calc.utils.business_calendar import BaseBusinessCalendar, DEFAULT_CALENDAR, RollConvention, Weekmask
+from date_calc.utils.date_calculator import DateCalculator
+from date_calc.utils.date_column import DateColumn
+
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike, NDArray
+
+_CHUNK_SIZE = 65_536
+
+
+class AsyncDateCalculator:
+    """
+    Asyncio facade of `DateCalculator`; see the module documentation.
+
+    Args:
+        executor (Executor, optional): Where bulk calls run. Defaults to the event loop's
+            default executor (a thread pool).
+        max_pending (int, optional): The maximum number of chunks in the executor at a time.
+            Defaults to the number of CPUs.
+        chunk_size (int, optional): The number of dates per chunk. Defaults to 65536.
+
+    Raises:
+        ValueError: If `max_pending` or `chunk_size` is not positive.
+
+    Example:
+        >>> calculator = AsyncDateCalculator()
+        >>> await calculator.business_days(initial_date=date(2025, 1, 1), final_date=date(2025, 2, 1))
+        23
+        >>> await calculator.add_days_batch(numpy.arange(738000, 748000), 30)
+        array([738030, ..., 748029])
+    """
+
+    def __init__(self, executor: Executor | None = None, max_pending: int | None = None, chunk_size: int = _CHUNK_SIZE) -> None:
+        max_pending = max_pending or os.cpu_count() or 1
+        if max_pending < 1 or chunk_size < 1:
+            raise ValueError(f"max_pending and chunk_size must be positive, got {max_pending} and {chunk_size}.")
+        self.executor = executor
+        self.chunk_size = chunk_size
+        self._slots = asyncio.Semaphore(max_pending)
+
+    # Scalar calls, run inline
+
+    async def add_days(self, start_date: datetime, days: int) -> date:
+        """See `DateCalculator.add_days`."""
+        return DateCalculator.add_days(start_date, days)
+
+    async def date_difference(self, start_date: date, end_date: date) -> int:
+        """See `DateCalculator.date_difference`."""
+        return DateCalculator.date_difference(start_date, end_date)
+
+    async def business_days(self, **kwargs: Any) -> int:
+        """See `DateCalculator.business_days`."""
+        return DateCalculator.business_days(**kwargs)
+
+    async def new_date_with_interval_of_days(self, **kwargs: Any) -> date:
+        """See `DateCalculator.new_date_with_interval_of_days`."""
+        return DateCalculator.new_date_with_interval_of_days(**kwargs)
+
+    async def add_months(self, initial_date: date, months: int, **kwargs: Any) -> date:
+        """See `DateCalculator.add_months`."""
+        return DateCalculator.add_months(initial_date, months, **kwargs)
+
+    async def add_years(self, initial_date: date, years: int, **kwargs: Any) -> date:
+        """See `DateCalculator.add_years`."""
+        return DateCalculator.add_years(initial_date, years, **kwargs)
+
+    # Bulk calls, run in the executor by chunks
+
+    async def add_days_batch(self, start_dates: "ArrayLike", days: "ArrayLike") -> "NDArray":
+        """See `DateCalculator.add_days_batch`."""
+        return await self._map(DateCalculator.add_days_batch, start_dates, days)
+
+    async def date_difference_batch(self, start_dates: "ArrayLike", end_dates: "ArrayLike") -> "NDArray":
+        """See `DateCalculator.date_difference_batch`."""
+        return await self._map(DateCalculator.date_difference_batch, start_dates, end_dates)
+
+    async def business_days_batch(
+            self,
+            *,
+            initial_dates: "ArrayLike",
+            final_dates: "ArrayLike",
+            calendar: BaseBusinessCalendar = DEFAULT_CALENDAR,
+            weekmask: Weekmask | None = None
+        ) -> "NDArray":
+        """See `DateCalculator.business_days_batch`."""
+        return await self._map(
+            _business_days_batch, initial_dates, final_dates, calendar=calendar, weekmask=weekmask
+        )
+
+    async def new_date_with_interval_of_days_batch(
+            self,
+            *,
+            initial_dates: "ArrayLike",
+            intervals: "ArrayLike",
+            type_of_days: Literal["business", "consecutive"],
+            calendar: BaseBusinessCalendar = DEFAULT_CALENDAR,
+            weekmask: Weekmask | None = None
+        ) -> "NDArray":
+        """See `DateCalculator.new_date_with_interval_of_days_batch`."""
+        return await self._map(
+            _new_date_with_interval_of_days_batch, initial_dates, intervals,
+            type_of_days=type_of_days, calendar=calendar, weekmask=weekmask,
+        )
+
+    async def add_months_batch(
+            self,
+            start_dates: "ArrayLike",
+            months: "ArrayLike",
+            *,
+            roll: RollConvention | None = None,
+            end_of_month: bool = False,
+            calendar: BaseBusinessCalendar = DEFAULT_CALENDAR
+        ) -> "NDArray":
+        """See `DateCalculator.add_months_batch`."""
+        return await self._map(
+            DateCalculator.add_months_batch, start_dates, months, roll=roll, end_of_month=end_of_month, calendar=calendar
+        )
+
+    async def add_years_batch(
+            self,
+            start_dates: "ArrayLike",
+            years: "ArrayLike",
+            *,
+            roll: RollConvention | None = None,
+            end_of_month: bool = False,
+            calendar: BaseBusinessCalendar = DEFAULT_CALENDAR
+        ) -> "NDArray":
+        """See `DateCalculator.add_years_batch`."""
+        return await self._map(
+            DateCalculator.add_years_batch, start_dates, years, roll=roll, end_of_month=end_of_month, calendar=calendar
+        )
+
+    async def business_day_list(
+            self,
+            initial_date: date,
+            final_date: date,
+            step: int = 1,
+            *,
+            calendar: BaseBusinessCalendar = DEFAULT_CALENDAR
+        ) -> list[date]:
+        """
+        The business days between two dates, as a list; see `DateCalculator.iter_business_days`.
+
+        Args:
+            initial_date (date): The starting date (inclusive).
+            final_date (date): The ending date (exclusive).
+            step (int, optional): Take every `step`-th business day. Defaults to 1.
+            calendar (BaseBusinessCalendar, optional): The business-day calendar.
+
+        Returns:
+            list[date]: The business days, in order.
+
+        Raises:
+            ValueError: If `step` is zero.
+        """
+        numbers = calendar.business_day_numbers(initial_date, final_date, step)
+        size = self.chunk_size
+        parts = await asyncio.gather(*(
+            self._submit(_business_days_of, numbers[start:start + size], calendar)
+            for start in range(0, len(numbers), size)
+        ))
+        return [day for part in parts for day in part]
+
+    async def _map(self, function: Callable[..., Any], dates: Any, values: Any, **kwargs: Any) -> Any:
+        """Apply a batch function by chunks; the arguments as long as the longest are chunked, the others broadcast."""
+        function = partial(function, **kwargs)
+        size = self.chunk_size
+        count = max(_length(dates), _length(values))
+        if count <= size:
+            return await self._submit(function, dates, values)
+        arguments = [(argument, _length(argument) == count) for argument in (dates, values)]
+        parts = await asyncio.gather(*(
+            self._submit(function, *(argument[start:start + size] if chunked else argument for argument, chunked in arguments))
+            for start in range(0, count, size)
+        ))
+        return await self._submit(_concatenate, parts)
+
+    async def _submit(self, function: Callable[..., Any], *args: Any) -> Any:
+        """Run a function in the executor, once one of the `max_pending` slots is free."""
+        async with self._slots:
+            return await asyncio.get_running_loop().run_in_executor(self.executor, function, *args)
+
+
+# Module-level functions, so that the calls can be pickled for a ProcessPoolExecutor
+
+def _business_days_batch(initial_dates, final_dates, **kwargs):
+    return DateCalculator.business_days_batch(initial_dates=initial_dates, final_dates=final_dates, **kwargs)
+
+
+def _new_date_with_interval_of_days_batch(initial_dates, intervals, **kwargs):
+    return DateCalculator.new_date_with_interval_of_days_batch(initial_dates=initial_dates, intervals=intervals, **kwargs)
+
+
+def _business_days_of(numbers: range, calendar: BaseBusinessCalendar) -> list[date]:
+    nth_business_day = calendar.nth_business_day
+    return [date.fromordinal(nth_business_day(n)) for n in numbers]
+
+
+def _length(argument: Any) -> int:
+    """The number of elements of an argument, 0 for a scalar (which is broadcast)."""
+    try:
+        return len(argument) if not isinstance(argument, (str, bytes)) else 0
+    except TypeError:  # a scalar, or a 0-d array
+        return 0
+
+
+def _concatenate(parts: list[Any]) -> Any:
+    if isinstance(parts[0], DateColumn):
+        return DateColumn.from_buffer(b"".join(part.ordinals for part in parts))
+    import numpy as np
+    return np.concatenate(parts)
+
+
+__all__ = ['AsyncDateCalculator']
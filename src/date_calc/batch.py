@@ -0,0 +1,314 @@
+"""
+This module provides the streaming engine of the `batch` command.
+
+Calculation rows are read one at a time from CSV or NDJSON, evaluated with `DateCalculator`
+and written out as soon as they are computed, so memory use does not depend on the size of
+the input. Each row has the fields:
+
+    operation     "calc" (date + interval) or "diff" (end_date - date)
+    date          the start date (DD-MM-YYYY, DD/MM/YYYY, YYYY-MM-DD or "today")
+    end_date      the end date, for "diff"
+    interval      the number of days, for "calc"
+    type_of_days  "consecutive" (default) or "business"
+
+A CSV input starts with a header naming these fields, in any order. Every output row repeats
+the input row and adds `result` and `error`; a row that cannot be evaluated gets a structured
+`error` (see `date_calc.output`) instead of stopping the batch. Results are written as CSV,
+NDJSON or a JSON array, by default in the input format.
+"""
+
+import csv
+import io
+import json
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import date
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Literal, Mapping, NamedTuple, TextIO, TypeAlias
+
+from date_calc.output import OutputFormat, RecordWriter, error_record, open_writer
+from date_calc.utils.business_calendar import BaseBusinessCalendar, DEFAULT_CALENDAR
+from date_calc.utils.date_calculator import DateCalculator
+from date_calc.utils.parsing import DateParser, parse_date
+
+BatchFormat: TypeAlias = Literal["csv", "ndjson"]
+Row: TypeAlias = Mapping[str, Any]
+
+FIELDS: tuple[str, ...] = ("operation", "date", "end_date", "interval", "type_of_days")
+RESULT_FIELDS: tuple[str, ...] = ("result", "error")
+
+_SUFFIX_FORMATS: dict[str, BatchFormat] = {".csv": "csv", ".ndjson": "ndjson", ".jsonl": "ndjson"}
+_CHUNK_SIZE = 1 << 20
+
+# set once in each worker process by `_init_worker`
+_worker_calendar: BaseBusinessCalendar = DEFAULT_CALENDAR
+
+
+class BatchSummary(NamedTuple):
+    """The number of rows processed by a batch, and how many of them failed."""
+
+    rows: int
+    errors: int
+
+
+def detect_format(path: Path | str) -> BatchFormat:
+    """
+    Guess the format of a batch file from its suffix: ".ndjson" and ".jsonl" are NDJSON,
+    anything else (including stdin, "-") is CSV.
+
+    Args:
+        path (Path | str): The batch file.
+
+    Returns:
+        BatchFormat: "csv" or "ndjson".
+    """
+    return _SUFFIX_FORMATS.get(Path(path).suffix.lower(), "csv")
+
+
+def format_date(value: date) -> str:
+    """Format a date as DD-MM-YYYY, the format used by the CLI."""
+    return f"{value.day:02d}-{value.month:02d}-{value.year:04d}"
+
+
+def evaluate(
+        row: Row,
+        calendar: BaseBusinessCalendar = DEFAULT_CALENDAR,
+        parse: Callable[[str], date] = parse_date
+    ) -> str | int:
+    """
+    Evaluate one batch row.
+
+    Args:
+        row (Row): The row fields; see the module documentation.
+        calendar (BaseBusinessCalendar, optional): The calendar for "business" days.
+        parse (Callable[[str], date], optional): The date parser; batches use one
+            `DateParser` per stream, so the date format is detected once.
+
+    Returns:
+        str | int: The result: a DD-MM-YYYY date for "calc", the number of days (an int, as in
+            `diff -f json`) for "diff". The CSV output writes both as text.
+
+    Raises:
+        ValueError: If the row is invalid.
+    """
+    operation = row.get("operation")
+    type_of_days = row.get("type_of_days") or "consecutive"
+    if type_of_days not in ("consecutive", "business"):
+        raise ValueError(f"Invalid type of days: '{type_of_days}'. Use 'consecutive' or 'business'.")
+
+    if operation == "calc":
+        start, interval = row.get("date"), row.get("interval")
+        if not start or interval in (None, ""):
+            raise ValueError("'calc' needs a date and an interval.")
+        return format_date(DateCalculator.new_date_with_interval_of_days(
+            initial_date=parse(start), interval=int(interval),
+            type_of_days=type_of_days, calendar=calendar,
+        ))
+
+    if operation == "diff":
+        start, end = row.get("date"), row.get("end_date")
+        if not start or not end:
+            raise ValueError("'diff' needs a date and an end date.")
+        if type_of_days == "business":
+            return DateCalculator.business_days(
+                initial_date=parse(start), final_date=parse(end), calendar=calendar
+            )
+        return DateCalculator.date_difference(parse(start), parse(end))
+
+    raise ValueError(f"Invalid operation: '{operation}'. Use 'calc' or 'diff'.")
+
+
+def read_ndjson(lines: Iterable[str]) -> Iterator[dict[str, Any]]:
+    """
+    Lazily read NDJSON batch rows, one JSON object per line; blank lines are skipped.
+    A line that is not a JSON object is yielded as a row with an invalid operation,
+    so that it is reported in the output instead of stopping the batch.
+
+    Args:
+        lines (Iterable[str]): The NDJSON lines, e.g. an open file.
+
+    Yields:
+        dict[str, Any]: The fields of each row.
+    """
+    loads = json.loads
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            row = loads(line)
+        except ValueError:
+            row = None
+        yield row if isinstance(row, dict) else {"operation": None, "date": line.rstrip("\n")}
+
+
+def run_batch(
+        source: TextIO,
+        destination: TextIO,
+        input_format: BatchFormat = "csv",
+        calendar: BaseBusinessCalendar = DEFAULT_CALENDAR,
+        output_format: OutputFormat | None = None
+    ) -> BatchSummary:
+    """
+    Evaluate every row of `source` and write the results to `destination`.
+
+    Rows are streamed: only one row is held in memory at a time, and results are written
+    through the (buffered) destination without flushing after each row.
+
+    Args:
+        source (TextIO): The batch rows, CSV with a header or NDJSON.
+        destination (TextIO): Where the result rows are written.
+        input_format (BatchFormat, optional): "csv" or "ndjson". Defaults to "csv".
+        calendar (BaseBusinessCalendar, optional): The calendar for "business" days.
+        output_format (OutputFormat, optional): "csv", "ndjson" or "json". Defaults to the input format.
+
+    Returns:
+        BatchSummary: The number of rows processed and of rows with errors.
+
+    Raises:
+        ValueError: If a format is unknown.
+    """
+    rows, fields = _read_rows(source, input_format)
+    if fields is None:
+        return BatchSummary(0, 0)
+    with open_writer(output_format or input_format, destination, fields) as writer:
+        return _evaluate_rows(rows, writer, calendar)
+
+
+def _read_rows(source: Iterable[str], input_format: BatchFormat) -> tuple[Iterator[dict[str, Any]], list[str] | None]:
+    """
+    Open a stream of batch rows; return the rows and the fields of the results (None for an
+    empty CSV input). The CSV header is read here.
+    """
+    if input_format == "csv":
+        reader = csv.reader(source)
+        header = next(reader, None)
+        if header is None:
+            return iter(()), None
+        header = [name.strip() for name in header]
+        return _read_csv(reader, header), header + list(RESULT_FIELDS)
+    if input_format == "ndjson":
+        return read_ndjson(source), list(FIELDS + RESULT_FIELDS)
+    raise ValueError(f"Invalid batch format: '{input_format}'. Use 'csv' or 'ndjson'.")
+
+
+def _read_csv(reader: Iterator[list[str]], header: list[str]) -> Iterator[dict[str, Any]]:
+    """Lazily read the CSV rows following the header; blank lines are skipped."""
+    for values in reader:
+        if values:
+            yield dict(zip(header, values))
+
+
+def _evaluate_rows(rows: Iterable[dict[str, Any]], writer: RecordWriter, calendar: BaseBusinessCalendar) -> BatchSummary:
+    """Evaluate the rows and write them with their `result` and `error` fields."""
+    write = writer.write
+    parse = DateParser()
+    count = errors = 0
+    for row in rows:
+        count += 1
+        try:
+            row["result"], row["error"] = evaluate(row, calendar, parse), None
+        except (ValueError, TypeError, OverflowError) as e:
+            errors += 1
+            row["result"], row["error"] = None, error_record(e)
+        write(row)
+    return BatchSummary(count, errors)
+
+
+def run_batch_parallel(
+        source: TextIO,
+        destination: TextIO,
+        input_format: BatchFormat = "csv",
+        calendar: BaseBusinessCalendar = DEFAULT_CALENDAR,
+        workers: int | None = None,
+        chunk_size: int = _CHUNK_SIZE,
+        output_format: OutputFormat | None = None
+    ) -> BatchSummary:
+    """
+    Same as `run_batch`, with the rows evaluated by a pool of worker processes.
+
+    The input is read in chunks of whole lines (about `chunk_size` characters each), which
+    are evaluated and rendered by the workers and written back in input order. At most two
+    chunks per worker are in flight, so memory use stays bounded whatever the size of the
+    input. The calendar is sent to each worker once, when it starts; a file-backed
+    `BusinessDayIndex` is memory-mapped by each worker rather than copied. Field values
+    must not contain line breaks.
+
+    Args:
+        source (TextIO): The batch rows, CSV with a header or NDJSON.
+        destination (TextIO): Where the result rows are written.
+        input_format (BatchFormat, optional): "csv" or "ndjson". Defaults to "csv".
+        calendar (BaseBusinessCalendar, optional): The calendar for "business" days.
+        workers (int, optional): The number of worker processes. Defaults to the number of CPUs.
+        chunk_size (int, optional): The approximate size of a chunk, in characters. Defaults to 1 MiB.
+        output_format (OutputFormat, optional): "csv", "ndjson" or "json". Defaults to the input format.
+
+    Returns:
+        BatchSummary: The number of rows processed and of rows with errors.
+
+    Raises:
+        ValueError: If a format is unknown or `workers` is not positive.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"The number of workers must be positive, got {workers}.")
+    if workers == 1:
+        return run_batch(source, destination, input_format, calendar, output_format)
+
+    output_format = output_format or input_format
+    _, fields = _read_rows(iter(source.readline, ""), input_format)
+    if fields is None:
+        return BatchSummary(0, 0)
+    header = fields[:-len(RESULT_FIELDS)] if input_format == "csv" else None
+
+    count = errors = 0
+    pending: deque[Future[tuple[str, BatchSummary]]] = deque()
+    with open_writer(output_format, destination, fields) as writer:
+
+        def write_oldest() -> None:
+            nonlocal count, errors
+            output, summary = pending.popleft().result()
+            writer.write_fragment(output)
+            count += summary.rows
+            errors += summary.errors
+
+        with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(calendar,)) as pool:
+            while chunk := source.readlines(chunk_size):
+                pending.append(pool.submit(_run_chunk, "".join(chunk), input_format, output_format, header))
+                if len(pending) >= 2 * workers:
+                    write_oldest()
+            while pending:
+                write_oldest()
+    return BatchSummary(count, errors)
+
+
+def _init_worker(calendar: BaseBusinessCalendar) -> None:
+    """Keep the calendar of the batch in the worker process."""
+    global _worker_calendar
+    _worker_calendar = calendar
+
+
+def _run_chunk(
+        text: str,
+        input_format: BatchFormat,
+        output_format: OutputFormat,
+        header: list[str] | None
+    ) -> tuple[str, BatchSummary]:
+    """Evaluate a chunk of rows (CSV without its header) in a worker process; return the rendered results and the summary."""
+    output = io.StringIO()
+    # split on "\n" only, like the reader of the chunks; str.splitlines would also split values
+    # on \x1c-\x1e, \x85, \u2028 and \u2029
+    lines = io.StringIO(text, newline="\n")
+    if header is None:
+        rows, fields = read_ndjson(lines), list(FIELDS + RESULT_FIELDS)
+    else:
+        rows, fields = _read_csv(csv.reader(lines), header), header + list(RESULT_FIELDS)
+    with open_writer(output_format, output, fields, fragment=True) as writer:
+        summary = _evaluate_rows(rows, writer, _worker_calendar)
+    return output.getvalue(), summary
+
+
+__all__ = [
+    'BatchFormat', 'BatchSummary', 'FIELDS', 'RESULT_FIELDS',
+    'detect_format', 'format_date', 'evaluate', 'read_ndjson', 'run_batch', 'run_batch_parallel',
+]
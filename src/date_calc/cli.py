@@ -1,15 +1,22 @@
 import argparse
 import textwrap
-import rich_argparse
 
 from pathlib import Path
 
 from datetime import datetime, timedelta
 from date_calc.translate.translate import _DEFAULT_LOCALES_PATH
+from date_calc.utils.parsing import parse_date
+
+def _rich_help_formatter(prog: str, **kwargs) -> argparse.HelpFormatter:
+    """Create the help formatter; rich_argparse is imported on first use, and rich only when help is rendered."""
+    from rich_argparse import RawDescriptionRichHelpFormatter
+    return RawDescriptionRichHelpFormatter(prog, **kwargs)
 
 def valid_date(s: str) -> datetime:
+    """Parse a DD-MM-YYYY date (DD/MM/YYYY, YYYY-MM-DD and 'today', 'now' or '.' are also accepted)."""
     try:
-        return datetime.strptime(s, '%d-%m-%Y')
+        day = parse_date(s)
+        return datetime(day.year, day.month, day.day)
     except ValueError:
         msg = f"Invalid date: '{s}'. Use DD-MM-YYYY."
         raise argparse.ArgumentTypeError(msg)
@@ -22,6 +29,26 @@ def int_to_timedelta(days: str) -> timedelta:
         msg = f"'Days' parameter provided({days}), cannot be converted to timedelta. Please provide a valid value."
         raise argparse.ArgumentTypeError(msg)
 
+def _number_of_workers(value: str) -> int:
+    """Parse a number of workers: a positive integer, or 0 for the number of CPUs."""
+    try:
+        number = int(value)
+    except ValueError:
+        number = -1
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"Invalid number of workers: '{value}'. Use a positive integer or 0.")
+    return number
+
+def _port(value: str) -> int:
+    """Parse a TCP port number."""
+    try:
+        port = int(value)
+    except ValueError:
+        port = -1
+    if not 0 <= port <= 65535:
+        raise argparse.ArgumentTypeError(f"Invalid port: '{value}'. Use a number from 0 to 65535.")
+    return port
+
 def _validate_path_to_locales_folder(p: str) -> Path:
     path = Path(p).resolve()
     if not path.exists() or not path.is_dir():
@@ -40,15 +67,16 @@ def create_parser() -> argparse.ArgumentParser:
             Performs operations between dates and dates and day ranges.
             This package uses the datetime library, native to Python, to perform operations/calculations between dates.
         """),
-        formatter_class=rich_argparse.RawDescriptionRichHelpFormatter
+        formatter_class=_rich_help_formatter
     )
 
-    subparsers = parser.add_subparsers(dest='command', required=True)
+    # an explicit prog keeps argparse from building a (rich) help formatter to compute it
+    subparsers = parser.add_subparsers(dest='command', required=True, prog=parser.usage % {'prog': parser.prog})
 
     ####### Action SubParser
     calc_parser = subparsers.add_parser(
         'calc',
-        usage='%(prog)s [<DATE>] [<DAYS | INTERVAL OF DAYS>]',
+        usage='%(prog)s [<DATE>] [<DAYS | INTERVAL OF DAYS>] [--format {text,json,ndjson,csv}]',
         description=textwrap.dedent("""
             Performs calculations with a specific date and a range of days.
             This command operates by receiving the date ([<DATE>] -> dd-mm-yyyy) and
@@ -56,7 +84,7 @@ def create_parser() -> argparse.ArgumentParser:
             or subtraction (sub) between the date and the number of days entered.
         """),
         help='Performs sum and difference operations between a date and a range of days.',
-        formatter_class=rich_argparse.RawDescriptionRichHelpFormatter
+        formatter_class=_rich_help_formatter
     )
     calc_parser.set_defaults(command='calc')
 
@@ -74,43 +102,170 @@ def create_parser() -> argparse.ArgumentParser:
         help='Number of days to add or subtract.'
     )
 
+    calc_parser.add_argument(
+        '-f', '--format',
+        choices=['text', 'json', 'ndjson', 'csv'],
+        default='text',
+        help='Output format: text, or a record in json, ndjson or csv (default: text)'
+    )
+
+    calc_parser.add_argument(
+        '--socket',
+        metavar='PATH',
+        default=None,
+        help='Ask the `serve` daemon listening on this socket, computing locally if it is not running (default: $DTCALC_SOCKET)'
+    )
+
     ####### Diff parser
     diff_parser = subparsers.add_parser(
         'diff',
-        usage='%(prog)s [<START_DATE>] [<END_DATE>]',
+        usage='%(prog)s [<START_DATE> <END_DATE> | --matrix <STARTS_FILE> <ENDS_FILE>] [--type-of-days {consecutive,business}] [--format {text,json,ndjson,csv}]',
         description=textwrap.dedent("""
             Calculates the difference in days between two dates.
             This command receives two dates ([<START_DATE>] and [<END_DATE>]) in the format dd-mm-yyyy,
             and returns the difference in days between them.
             It reports errors if the dates are the same or the initial date is less than the final date.
+            With --matrix, it computes the differences between every date of one file and every date of another.
         """),
         help='Calculates the difference between two dates.',
-        formatter_class=rich_argparse.RawDescriptionRichHelpFormatter
+        formatter_class=_rich_help_formatter
     )
     diff_parser.set_defaults(command='diff')
 
     diff_parser.add_argument(
         'start',
+        nargs='?',
         type=valid_date,
         help='Start date (DD-MM-YYYY)'
     )
 
     diff_parser.add_argument(
         'end',
+        nargs='?',
         type=valid_date,
         help='End date (DD-MM-YYYY)'
     )
 
+    diff_parser.add_argument(
+        '-t', '--type-of-days',
+        choices=['consecutive', 'business'],
+        default='consecutive',
+        help='Count consecutive or business days (default: consecutive)'
+    )
+
+    diff_parser.add_argument(
+        '--matrix',
+        nargs=2,
+        metavar=('STARTS_FILE', 'ENDS_FILE'),
+        default=None,
+        help='Instead of two dates, write the matrix of differences between every date of STARTS_FILE '
+             'and every date of ENDS_FILE (one date per line), one row per start date, in csv (default), ndjson or json'
+    )
+
+    diff_parser.add_argument(
+        '-f', '--format',
+        choices=['text', 'json', 'ndjson', 'csv'],
+        default='text',
+        help='Output format: text, or a record in json, ndjson or csv (default: text)'
+    )
+
+    diff_parser.add_argument(
+        '--socket',
+        metavar='PATH',
+        default=None,
+        help='Ask the `serve` daemon listening on this socket, computing locally if it is not running (default: $DTCALC_SOCKET)'
+    )
+
+    ####### Batch parser
+    batch_parser = subparsers.add_parser(
+        'batch',
+        usage='%(prog)s [<INPUT>] [--output <OUTPUT>] [--input-format {csv,ndjson}] [--format {csv,ndjson,json}] [--workers N]',
+        description=textwrap.dedent("""
+            Evaluates many calculations in one run, streaming rows from a CSV or NDJSON file (or stdin).
+            Each row has the fields operation ("calc" or "diff"), date, end_date, interval and
+            type_of_days ("consecutive" or "business"); CSV files start with a header naming them.
+            Results are written as they are computed, in the input format or the one given by --format,
+            with the fields result and error (error_code and error_message in CSV).
+        """),
+        help='Evaluates calculations streamed from a CSV or NDJSON file.',
+        formatter_class=_rich_help_formatter
+    )
+    batch_parser.set_defaults(command='batch')
+    batch_parser.add_argument(
+        'input',
+        nargs='?',
+        default='-',
+        help='Input file (default: stdin)'
+    )
+    batch_parser.add_argument(
+        '-o', '--output',
+        default='-',
+        help='Output file (default: stdout)'
+    )
+    batch_parser.add_argument(
+        '--input-format',
+        choices=['csv', 'ndjson'],
+        default=None,
+        help='Input format (default: from the file suffix, .ndjson/.jsonl or csv)'
+    )
+    batch_parser.add_argument(
+        '-f', '--format',
+        choices=['csv', 'ndjson', 'json'],
+        default=None,
+        help='Output format (default: the input format)'
+    )
+    batch_parser.add_argument(
+        '-w', '--workers',
+        type=_number_of_workers,
+        default=1,
+        help='Number of worker processes; 0 uses every CPU (default: 1)'
+    )
+
+    ####### Serve parser
+    serve_parser = subparsers.add_parser(
+        'serve',
+        usage='%(prog)s [--socket <PATH>] [--http <PORT>] [--host <HOST>]',
+        description=textwrap.dedent("""
+            Runs a daemon answering calc, diff and business-day queries, so callers do not pay
+            the start-up of dtcalc on every calculation.
+            Queries are NDJSON lines on a Unix domain socket (used by `dtcalc calc/diff --socket`),
+            or JSON over localhost HTTP: `POST /` with a query, or `GET /calc?date=...&interval=...`.
+        """),
+        help='Runs a daemon answering queries over a Unix socket or localhost HTTP.',
+        formatter_class=_rich_help_formatter
+    )
+    serve_parser.set_defaults(command='serve')
+    serve_parser.add_argument(
+        '--socket',
+        metavar='PATH',
+        default=None,
+        help='Unix domain socket to listen on (default: $DTCALC_SOCKET or dtcalc.sock in $XDG_RUNTIME_DIR, unless --http is given)'
+    )
+    serve_parser.add_argument(
+        '--http',
+        metavar='PORT',
+        type=_port,
+        default=None,
+        help='Also (or only, without --socket) answer HTTP on this port'
+    )
+    serve_parser.add_argument(
+        '--host',
+        default='127.0.0.1',
+        help='Address of the HTTP endpoint (default: 127.0.0.1)'
+    )
+
     ####### Compile .po -> .mo parser
     compile_parser = subparsers.add_parser(
         'compile',
-        usage='%(prog)s compile [<PATH_TO_LOCALES_FOLDER>]',
+        usage='%(prog)s compile [--path <PATH_TO_LOCALES_FOLDER>] [--workers N] [--force]',
         description=textwrap.dedent("""
             Compiles .po files to .mo files for localization.
             This command searches for all .po files in the locales directory and compiles them into .mo files.
+            Files whose .mo file is newer, or whose content is unchanged since their last compilation,
+            are skipped; the others are compiled in parallel.
         """),
         help='Compiles .po files to .mo files for localization.',
-        formatter_class=rich_argparse.RawDescriptionRichHelpFormatter
+        formatter_class=_rich_help_formatter
     )
     compile_parser.set_defaults(command='compile')
     compile_parser.add_argument(
@@ -119,6 +274,17 @@ def create_parser() -> argparse.ArgumentParser:
         default= _DEFAULT_LOCALES_PATH,
         help=f'Path to the locales folder (default: {_DEFAULT_LOCALES_PATH.as_posix()})'
     )
+    compile_parser.add_argument(
+        '-w', '--workers',
+        type=_number_of_workers,
+        default=0,
+        help='Number of worker processes; 0 uses every CPU when there are enough stale files (default: 0)'
+    )
+    compile_parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Compile every .po file, even the up-to-date ones'
+    )
 
     ####### Init/interative parser
     iter_parser = subparsers.add_parser(
@@ -131,7 +297,7 @@ def create_parser() -> argparse.ArgumentParser:
             eliminating the need to run the application multiple times from the command line.
         """),
         help="Enters interactive mode.",
-        formatter_class=rich_argparse.RawDescriptionRichHelpFormatter
+        formatter_class=_rich_help_formatter
     )
     iter_parser.set_defaults(command='iter')
 
@@ -0,0 +1,162 @@
+"""
+This module provides the thin client of the `serve` daemon (see `date_calc.server`).
+
+`DateCalcClient` sends queries over the daemon's Unix domain socket, one at a time or
+pipelined, and `RemoteRunner` is a `DefaultRunner` whose calc/diff are answered by the
+daemon, so `dtcalc calc` and `dtcalc diff` skip the calendar lookups when a daemon is
+running. Besides `socket` and `json`, the module imports `date_calc.runner` (for
+`DefaultRunner`, and with it the calculator and the formatter), which the CLI has already
+loaded; it does not import the server, asyncio or the settings.
+"""
+
+import json
+import os
+import socket
+from datetime import datetime, timedelta
+from itertools import islice
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from date_calc.exceptions import CalculationError
+from date_calc.runner import DefaultRunner
+from date_calc.utils.formatting import DEFAULT_LANGUAGE, DateFormatter, Language
+
+_format_date = DateFormatter('%d-%m-%Y')
+
+
+def default_socket_path() -> Path:
+    """The socket of the daemon: $DTCALC_SOCKET, or dtcalc.sock in $XDG_RUNTIME_DIR or the temporary directory."""
+    if path := os.environ.get("DTCALC_SOCKET"):
+        return Path(path)
+    from tempfile import gettempdir
+    return Path(os.environ.get("XDG_RUNTIME_DIR") or gettempdir()) / "dtcalc.sock"
+
+
+class DateCalcClient:
+    """
+    A connection to the `serve` daemon.
+
+    Args:
+        socket_path (Path | str, optional): The socket of the daemon. Defaults to `default_socket_path()`.
+        timeout (float, optional): The timeout of the connection and of each answer, in seconds. Defaults to 5.
+
+    Raises:
+        OSError: If the daemon is not reachable.
+
+    Example:
+        >>> with DateCalcClient() as client:
+        ...     client.query({"operation": "diff", "date": "01-01-2025", "end_date": "01-02-2025"})["result"]
+        31
+    """
+
+    def __init__(self, socket_path: Path | str | None = None, timeout: float = 5.0) -> None:
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            self._socket.settimeout(timeout)
+            self._socket.connect(os.fspath(socket_path or default_socket_path()))
+        except OSError:
+            self._socket.close()
+            raise
+        self._reader = self._socket.makefile("rb")
+
+    def __enter__(self) -> "DateCalcClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the connection."""
+        self._reader.close()
+        self._socket.close()
+
+    def query(self, query: dict[str, Any]) -> dict[str, Any]:
+        """
+        Send one query and wait for its answer.
+
+        Args:
+            query (dict[str, Any]): The query; see `date_calc.server`.
+
+        Returns:
+            dict[str, Any]: The answer, with a "result" and an "error".
+
+        Raises:
+            ConnectionError: If the daemon closed the connection.
+        """
+        self._socket.sendall(json.dumps(query).encode() + b"\n")
+        return self._read_answer()
+
+    def query_many(self, queries: Iterable[dict[str, Any]], window: int = 256) -> Iterator[dict[str, Any]]:
+        """
+        Pipeline queries: send them `window` at a time, without waiting for each answer.
+
+        Args:
+            queries (Iterable[dict[str, Any]]): The queries.
+            window (int, optional): The number of queries in flight. Defaults to 256.
+
+        Yields:
+            dict[str, Any]: The answers, in the order of the queries.
+        """
+        queries = iter(queries)
+        while batch := list(islice(queries, window)):
+            self._socket.sendall(b"".join(json.dumps(query).encode() + b"\n" for query in batch))
+            for _ in batch:
+                yield self._read_answer()
+
+    def _read_answer(self) -> dict[str, Any]:
+        line = self._reader.readline()
+        if not line:
+            raise ConnectionError("The daemon closed the connection.")
+        return json.loads(line)
+
+
+class RemoteRunner(DefaultRunner):
+    """
+    A `DefaultRunner` whose calc and diff are answered by the `serve` daemon.
+
+    Args:
+        client (DateCalcClient): The connection to the daemon.
+        language (Language, optional): The language of the local formatting. Defaults to "pt_BR".
+    """
+
+    def __init__(self, client: DateCalcClient, language: Language = DEFAULT_LANGUAGE) -> None:
+        super().__init__(language)
+        self.client = client
+
+    @classmethod
+    def connect(cls, socket_path: Path | str | None = None, timeout: float = 5.0) -> "RemoteRunner | None":
+        """Connect to the daemon; None if it is not running."""
+        try:
+            return cls(DateCalcClient(socket_path, timeout))
+        except OSError:
+            return None
+
+    def sum(self, date: datetime, days: timedelta, type_of_days: str = "consecutive") -> str:
+        record = self.sum_record(date, days, type_of_days)
+        if record["error"]:
+            raise CalculationError(record["error"]["code"], record["error"]["message"])
+        return f"{record['result']} -> {record['weekday']}"
+
+    def diff(self, start: datetime, end: datetime, type_of_days: str = "consecutive") -> str:
+        record = self.diff_record(start, end, type_of_days)
+        return record["error"]["message"] if record["error"] else str(record["result"])
+
+    def diff_days(self, start: datetime, end: datetime, type_of_days: str = "consecutive") -> int:
+        record = self.diff_record(start, end, type_of_days)
+        if record["error"]:
+            raise CalculationError(record["error"]["code"], record["error"]["message"])
+        return record["result"]
+
+    def sum_record(self, date: datetime, days: timedelta, type_of_days: str = "consecutive") -> dict[str, Any]:
+        return self._query(operation="calc", date=_format_date(date), interval=days.days, type_of_days=type_of_days)
+
+    def diff_record(self, start: datetime, end: datetime, type_of_days: str = "consecutive") -> dict[str, Any]:
+        return self._query(operation="diff", date=_format_date(start), end_date=_format_date(end), type_of_days=type_of_days)
+
+    def _query(self, **query: Any) -> dict[str, Any]:
+        record = self.client.query(query)
+        record.pop("id", None)
+        return record
+
+
+__all__ = ['DateCalcClient', 'RemoteRunner', 'default_socket_path']
@@ -1,20 +1,74 @@
+from __future__ import annotations
+
+import json
 import locale
+import os
 import sys
 import logging
-import zoneinfo
-import pytz
+import threading
 from pathlib import Path
-from typing import Optional, cast
+from typing import TYPE_CHECKING, Any, Iterator, Mapping, Optional, final
 
-from dynaconf import Dynaconf, Validator, ValidationError, LazySettings
 from date_calc.exceptions import ConfigurationError
 
+# dynaconf and zoneinfo are imported when the settings are first loaded, not with this module
+if TYPE_CHECKING:
+    from dynaconf import Dynaconf, LazySettings
+
 logger = logging.getLogger(__name__)
 
 _CONFIG_INSTANCE: Optional[LazySettings] = None
+_SNAPSHOT: Optional[SettingsSnapshot] = None
+_LOCK = threading.Lock()
 _ROOT_PATH = Path(__file__).parents[1].resolve()
 _SETTINGS_PATH = _ROOT_PATH.joinpath("settings.toml")
 
+_ENVVAR_PREFIX = "DTC"
+# variables that change what Dynaconf loads: the prefixed settings and the environment switch
+_ENVVAR_KEYS = (f"{_ENVVAR_PREFIX}_", "ENV_FOR_DYNACONF", "SETTINGS_FILE_FOR_DYNACONF")
+_SNAPSHOT_VERSION = 2
+
+
+@final
+class SettingsSnapshot(Mapping[str, Any]):
+    """
+    Cópia imutável das configurações validadas do ambiente atual.
+
+    As chaves não diferenciam maiúsculas de minúsculas e também podem ser lidas como
+    atributos, como no Dynaconf: `settings.LOG_LEVEL`, `settings["log_level"]`,
+    `settings.get("TIMEZONE")`.
+    """
+
+    __slots__ = ("_values", "current_env")
+
+    def __init__(self, values: Mapping[str, Any], current_env: str) -> None:
+        object.__setattr__(self, "_values", {key.upper(): value for key, value in values.items()})
+        object.__setattr__(self, "current_env", current_env)
+
+    def __getitem__(self, key: str) -> Any:
+        return self._values[key.upper()]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self._values[name.upper()]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._values!r}, current_env={self.current_env!r})"
+
 def config_locale_app():
     """Configura o locale para português do Brasil com fallback."""
     locales_to_try = []
@@ -32,7 +86,7 @@ def config_locale_app():
             return
         except locale.Error:
             continue
-    msg = "Não foi possível configurar locale específico, usando padrão do sistema {%s}".format(locale.getdefaultlocale())
+    msg = "Não foi possível configurar locale específico, usando padrão do sistema {}".format(locale.getlocale())
     logger.warning(msg)
 
 def _validate_path(path: Path | str) -> Path:
@@ -46,93 +100,206 @@ def _validate_path(path: Path | str) -> Path:
         raise FileNotFoundError(f"The specified path does not exist: {path}")
     return abs_path
 
-def _validate_timezone(tz: str) -> zoneinfo.ZoneInfo:
-    """Validates whether the timezone string is valid."""
-    try:
-        msg = "Validating timezone: %s".format(tz)
-        logger.debug(msg)
-        return zoneinfo.ZoneInfo(tz)
-    except zoneinfo.ZoneInfoNotFoundError as e:
-        try:
-            return zoneinfo.ZoneInfo(pytz.timezone(tz).zone)  # Tentativa de fallback com pytz
-        
-        except (ImportError, pytz.UnknownTimeZoneError):
-            raise ValueError(f"Timezone inválido: {tz}") from e
+def _validate_timezone(tz: str) -> str:
+    """Validates whether the timezone string is valid (kept as a string, so the settings snapshot stays JSON)."""
+    from date_calc.utils.clock import get_zone
+
+    logger.debug("Validating timezone: %s", tz)
+    get_zone(tz)
+    return tz
 
-def _create_dynaconf_instance() -> Dynaconf:
+def _create_dynaconf_instance(settings_path: Path = _SETTINGS_PATH) -> Dynaconf:
     """Create dynaconf instance"""
-    msg = ("Carregando configurações de: %s", _SETTINGS_PATH)
+    from dynaconf import Dynaconf, Validator
+
+    msg = ("Carregando configurações de: %s", settings_path)
     logger.debug(*msg)
     
-    if not _SETTINGS_PATH.exists():
-        msg = f"Arquivo não encontrado: {_SETTINGS_PATH}"
+    if not settings_path.exists():
+        msg = f"Arquivo não encontrado: {settings_path}"
         raise FileNotFoundError(msg)
     
     return Dynaconf(
-        settings_files=[_SETTINGS_PATH],
-        envvar_prefix="DTC",
+        settings_files=[settings_path],
+        envvar_prefix=_ENVVAR_PREFIX,
         environments=True,
         default_env='default',
         merge_enabled=True,
         validators=[
             Validator("DEFAULT_LOCALES_PATH", must_exist=True, cast=lambda v: _validate_path(v)),
             Validator("ICON_PATH", must_exist=True, cast=lambda v: _validate_path(v)),
-            # Validator("TIMEZONE", must_exist=True, cast=_validate_timezone),
+            Validator("TIMEZONE", must_exist=True, cast=_validate_timezone),
         ],
     )
 
 def load_config() -> None:
-    """Carrega configurações (singleton)."""
+    """Carrega configurações com o Dynaconf (singleton, seguro entre threads)."""
     global _CONFIG_INSTANCE
     
     if _CONFIG_INSTANCE is not None:
         return
+
+    with _LOCK:
+        if _CONFIG_INSTANCE is None:
+            _CONFIG_INSTANCE = _load_dynaconf()
+
+def _load_dynaconf(settings_path: Path = _SETTINGS_PATH, quiet: bool = False) -> Dynaconf:
+    """Cria e valida a instância do Dynaconf; com `quiet`, as falhas são registradas só em nível DEBUG, sem traceback."""
+    import zoneinfo
+    from dynaconf import ValidationError
     
     try:
-        _CONFIG_INSTANCE = _create_dynaconf_instance()
-        _CONFIG_INSTANCE.validators.validate() # type: ignore
+        instance = _create_dynaconf_instance(settings_path)
+        instance.validators.validate() # type: ignore
         logger.info("✅ Configurações carregadas com sucesso")
+        return instance
         
     except ValidationError as e:
-        logger.exception(
-            "Validação de configuração falhou", 
-            extra={
-                'original_error': str(e.__cause__),
-                'error_type': type(e.__cause__).__name__
-            }
-        )
+        _log_failure("Validação de configuração falhou", e, quiet)
         raise ConfigurationError(f"Configuração inválida: {e}") from e
     
     except zoneinfo.ZoneInfoNotFoundError as e:
-        logger.exception(
-            "Timezone inválida especificada",
-            extra={
-                'original_error': str(e.__cause__),
-                'error_type': type(e.__cause__).__name__
-            }
-        )
+        _log_failure("Timezone inválida especificada", e, quiet)
         raise ConfigurationError(f"Timezone inválida especificada: {e}") from e
     
     except Exception as e:
-        logger.exception(
-            "Erro inesperado ao carregar configurações",
-            extra={
-                'original_error': str(e.__cause__),
-                'error_type': type(e.__cause__).__name__
-            }
-        )
+        _log_failure("Erro inesperado ao carregar configurações", e, quiet)
         raise ConfigurationError(f"Falha ao carregar configurações: {e}") from e
 
-def get_settings() -> LazySettings:
-    """Retorna instância das configurações."""
-    if _CONFIG_INSTANCE is None:
-        load_config()
+def _log_failure(message: str, error: Exception, quiet: bool) -> None:
+    if quiet:
+        logger.debug("%s: %s", message, error)
+        return
+    logger.exception(
+        message,
+        extra={
+            'original_error': str(error.__cause__),
+            'error_type': type(error.__cause__).__name__
+        }
+    )
+
+def get_settings(quiet: bool = False) -> SettingsSnapshot:
+    """
+    Retorna as configurações (snapshot imutável, carregado uma vez por processo, seguro entre threads).
+
+    Args:
+        quiet (bool, optional): Não registra o traceback de uma falha e reutiliza a falha
+            gravada no snapshot (ver `load_settings_snapshot`). Defaults to False.
+
+    Raises:
+        ConfigurationError: Se as configurações forem inválidas.
+    """
+    global _SNAPSHOT
+
+    if _SNAPSHOT is None:
+        with _LOCK:
+            if _SNAPSHOT is None:
+                _SNAPSHOT = load_settings_snapshot(_SETTINGS_PATH, quiet=quiet)
+    return _SNAPSHOT
+
+def load_settings_snapshot(
+        settings_path: Path = _SETTINGS_PATH, cache_path: Path | None = None, quiet: bool = False
+    ) -> SettingsSnapshot:
+    """
+    Carrega as configurações do snapshot em disco, ou do Dynaconf quando ele está desatualizado.
+
+    O snapshot é identificado pelo caminho, mtime e tamanho do arquivo de configurações e
+    pelas variáveis de ambiente lidas pelo Dynaconf (DTC_*, ENV_FOR_DYNACONF); se algum
+    deles mudar, as configurações são carregadas e validadas de novo e o snapshot é regravado.
+
+    Uma falha também é gravada no snapshot: as cargas com `quiet` a repetem sem carregar o
+    Dynaconf de novo, enquanto as demais tentam outra vez (a causa pode ter sido corrigida
+    fora do arquivo, p.ex. uma pasta criada) e registram o traceback.
+
+    Args:
+        settings_path (Path, optional): O arquivo de configurações. Defaults to settings.toml.
+        cache_path (Path, optional): O arquivo do snapshot. Defaults to `snapshot_path()`.
+        quiet (bool, optional): Falhas sem traceback, e a falha gravada é reutilizada. Defaults to False.
+
+    Returns:
+        SettingsSnapshot: As configurações do ambiente atual.
+
+    Raises:
+        ConfigurationError: Se as configurações forem inválidas.
+    """
+    cache_path = cache_path or snapshot_path()
+    try:
+        key = _snapshot_key(settings_path)
+    except OSError:
+        key = None  # no settings file: the full load reports it
 
-    cast(LazySettings, _CONFIG_INSTANCE)  # Garantia para o type checker
-    return _CONFIG_INSTANCE # type: ignore
+    data = _read_snapshot(cache_path, key) if key is not None else None
+    if data is not None:
+        if "error" not in data:
+            return SettingsSnapshot(data["values"], data["env"])
+        if quiet:
+            raise ConfigurationError(data["error"])
+
+    try:
+        instance = _load_dynaconf(settings_path, quiet=quiet)
+    except ConfigurationError as e:
+        if key is not None:
+            _write_snapshot(cache_path, {"version": _SNAPSHOT_VERSION, "key": key, "error": str(e)})
+        raise
+    snapshot = SettingsSnapshot(instance.as_dict(), instance.current_env)
+    if key is not None:
+        _write_snapshot(cache_path, {"version": _SNAPSHOT_VERSION, "key": key, "env": snapshot.current_env, "values": dict(snapshot)})
+    return snapshot
+
+def snapshot_path() -> Path:
+    """O arquivo do snapshot: settings.json em $DTCALC_CACHE_DIR, ou em dtcalc/ no cache do usuário."""
+    if cache_dir := os.environ.get("DTCALC_CACHE_DIR"):
+        return Path(cache_dir).joinpath("settings.json")
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home().joinpath(".cache")
+    return Path(cache_home).joinpath("dtcalc", "settings.json")
+
+def _snapshot_key(settings_path: Path) -> list[Any]:
+    """Identifica a versão do arquivo de configurações e das variáveis de ambiente (comparável com o JSON lido)."""
+    stat = settings_path.stat()
+    environment = sorted([k, v] for k, v in os.environ.items() if k.startswith(_ENVVAR_KEYS))
+    return [os.path.abspath(settings_path), stat.st_mtime_ns, stat.st_size, environment]
+
+def _read_snapshot(cache_path: Path, key: list[Any]) -> Optional[dict[str, Any]]:
+    """Lê o snapshot gravado com a chave `key` (configurações ou falha); None se ausente, inválido ou de outra chave."""
+    try:
+        data = json.loads(cache_path.read_bytes(), object_hook=_decode_value)
+        if data["version"] == _SNAPSHOT_VERSION and data["key"] == key and ("error" in data or "values" in data):
+            return data
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, Path):
+        return {"__path__": str(value)}
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def _decode_value(obj: dict[str, Any]) -> Any:
+    return Path(obj["__path__"]) if obj.keys() == {"__path__"} else obj
+
+def _write_snapshot(cache_path: Path, data: dict[str, Any]) -> None:
+    """Grava o snapshot atomicamente (arquivo temporário + rename); falhas só são registradas."""
+    import tempfile
+
+    try:
+        text = json.dumps(data, default=_encode_value)
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=cache_path.parent, prefix=".settings-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                file.write(text)
+            os.replace(temp_path, cache_path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+    except (OSError, TypeError) as e:
+        logger.debug("Snapshot das configurações não gravado: %s", e)
 
 def get_root_path() -> Path:
     """Getter seguro para o root path (se realmente necessário)."""
     return _ROOT_PATH
 
-__all__ = ['get_settings', 'get_root_path', 'config_locale_app', 'load_config']
\ No newline at end of file
+__all__ = [
+    'SettingsSnapshot', 'get_settings', 'get_root_path', 'config_locale_app', 'load_config',
+    'load_settings_snapshot', 'snapshot_path',
+]
\ No newline at end of file
@@ -5,6 +5,8 @@ from tkinter import StringVar
 import ttkbootstrap as ttk
 from ttkbootstrap.widgets import DateEntry
 
+from date_calc.utils.parsing import parse_date
+
 
 class DateVar(StringVar):
     """A specialized Tkinter variable for date handling.
@@ -40,8 +42,14 @@ class DateVar(StringVar):
             date | None: The date object corresponding to current value or None
                 if the value cannot be converted to a valid date.
         """
+        value = self.get()
+        try:
+            return parse_date(value)
+        except ValueError:
+            pass
+        # free-form input, e.g. "17 out 2025", is left to dateutil
         try:
-            return dateparse(self.get(), dayfirst=True).date()
+            return dateparse(value, dayfirst=True).date()
         except Exception:
             return None
 
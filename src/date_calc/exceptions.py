@@ -1,4 +1,11 @@
 # Exception customizada para configuração
 class ConfigurationError(Exception):
     """Exceção para erros de configuração."""
-    pass
\ No newline at end of file
+    pass
+
+class CalculationError(ValueError):
+    """Exceção para cálculos inválidos; `code` identifica o erro nas saídas estruturadas."""
+
+    def __init__(self, code: str, message: str) -> None:
+        super().__init__(message)
+        self.code = code
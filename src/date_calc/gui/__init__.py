@@ -1,6 +1,8 @@
 def main():
+    from date_calc import install_excepthook
     from date_calc.gui.twindow import TWindow
-    
+
+    install_excepthook()
     window = TWindow()
     window.mainloop()
 
@@ -12,6 +12,9 @@ from ttkbootstrap.constants import INFO, DANGER, PRIMARY
 from date_calc import TkContainer, ICON_PATH, t
 from date_calc.gui.frame_date_difference import ConfigureGridLayout
 from date_calc.utils.date_calculator import DateCalculator
+from date_calc.utils.formatting import DateFormatter
+
+_format_long_date = DateFormatter("%A, %d de %B de %Y", "pt_BR")
 
 @final
 class FrameDateWithInterval(ttk.Labelframe, ConfigureGridLayout):
@@ -101,7 +104,7 @@ class FrameDateWithInterval(ttk.Labelframe, ConfigureGridLayout):
 
         self.result_var = ttk.StringVar(
             name="date_with_interval_response", 
-            value=date.today().replace(day=1).strftime("%A, %d de %B de %Y").capitalize()
+            value=_format_long_date(date.today().replace(day=1)).capitalize()
         )
         ttk.Label(frame, textvariable=self.result_var).pack(side="left", padx=(5, 0))
 
@@ -143,4 +146,4 @@ class FrameDateWithInterval(ttk.Labelframe, ConfigureGridLayout):
                 interval=days,
                 type_of_days=type_of_days # type: ignore
             )
-            self.result_var.set(new_date.strftime("%A, %d de %B de %Y").capitalize())
+            self.result_var.set(_format_long_date(new_date).capitalize())
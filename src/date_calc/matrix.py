@@ -0,0 +1,114 @@
+"""
+This module provides the matrix mode of the `diff` command: the differences between every
+date of one file and every date of another, e.g. invoice dates against payment dates.
+
+Each file holds one date per line (or CSV rows, of which the first column is used); blank
+lines are skipped. A first line whose first column has no digits (a column name, such as
+"date") is taken as a header and reported; any other line that is not a date, the first
+one included, is an error. The matrix is
+computed with `DateCalculator.iter_difference_matrix` and written block by block, one row
+per start date:
+
+    csv      a header "date,<end date>,<end date>,..." and, per start date, "<start date>,<days>,..."
+    ndjson   {"date": "<start date>", "differences": [<days>, ...]} per line, in the order of the end dates
+    json     an array of the ndjson objects
+"""
+
+import csv
+from datetime import date
+from typing import Callable, Iterable, Literal, TextIO
+
+from date_calc.output import OutputFormat, open_writer
+from date_calc.utils.business_calendar import BaseBusinessCalendar, DEFAULT_CALENDAR
+from date_calc.utils.date_calculator import DateCalculator
+from date_calc.utils.formatting import DateFormatter
+from date_calc.utils.parsing import DateParser
+
+_BLOCK_CELLS = 1 << 20
+
+_format_date = DateFormatter('%d-%m-%Y')
+
+
+def read_dates(
+        lines: Iterable[str],
+        name: str = "<input>",
+        on_header: Callable[[str], None] | None = None
+    ) -> list[date]:
+    """
+    Read a file of dates; see the module documentation.
+
+    Args:
+        lines (Iterable[str]): The lines, e.g. an open file.
+        name (str, optional): The name of the file, for error messages.
+        on_header (Callable[[str], None], optional): Called with the header line, if one is skipped.
+
+    Returns:
+        list[date]: The dates, in file order.
+
+    Raises:
+        ValueError: If a line (other than the header) is not a valid date.
+    """
+    parse = DateParser()
+    dates = []
+    for number, line in enumerate(lines, 1):
+        value = line.split(",", 1)[0].strip().strip('"')
+        if not value:
+            continue
+        try:
+            dates.append(parse(value))
+        except ValueError as e:
+            if dates or number > 1 or any(char.isdigit() for char in value):
+                raise ValueError(f"{name}, line {number}: {e}") from None
+            if on_header is not None:
+                on_header(line.rstrip("\r\n"))
+    return dates
+
+
+def write_matrix(
+        start_dates: list[date],
+        end_dates: list[date],
+        destination: TextIO,
+        type_of_days: Literal["business", "consecutive"] = "consecutive",
+        output_format: OutputFormat = "csv",
+        calendar: BaseBusinessCalendar = DEFAULT_CALENDAR
+    ) -> tuple[int, int]:
+    """
+    Write the difference matrix of two lists of dates, streaming it by blocks of rows.
+
+    Args:
+        start_dates (list[date]): The N start dates, one row each.
+        end_dates (list[date]): The M end dates, one column each.
+        destination (TextIO): Where the matrix is written.
+        type_of_days (str, optional): "consecutive" or "business". Defaults to "consecutive".
+        output_format (OutputFormat, optional): "csv", "ndjson" or "json". Defaults to "csv".
+        calendar (BaseBusinessCalendar, optional): The calendar for "business" days.
+
+    Returns:
+        tuple[int, int]: The shape of the matrix, (N, M).
+
+    Raises:
+        ValueError: If `type_of_days` or the format is invalid.
+    """
+    # through `vectorized`, whose ImportError tells how to install NumPy
+    from date_calc.utils.vectorized import np
+
+    starts = np.fromiter(map(date.toordinal, start_dates), dtype=np.int64, count=len(start_dates))
+    ends = np.fromiter(map(date.toordinal, end_dates), dtype=np.int64, count=len(end_dates))
+    labels = [_format_date(day) for day in start_dates]
+    blocks = DateCalculator.iter_difference_matrix(
+        starts, ends, type_of_days, block_rows=max(1, _BLOCK_CELLS // max(1, len(ends))), calendar=calendar
+    )
+    rows = (row for block in blocks for row in block.tolist())
+
+    if output_format == "csv":
+        writer = csv.writer(destination, lineterminator="\n")
+        writer.writerow(["date", *map(_format_date, end_dates)])
+        writer.writerows([label, *row] for label, row in zip(labels, rows))
+    else:
+        with open_writer(output_format, destination, ("date", "differences")) as records:
+            for label, row in zip(labels, rows):
+                records.write({"date": label, "differences": row})
+    return len(start_dates), len(end_dates)
+
+
+__all__ = ['read_dates', 'write_matrix']
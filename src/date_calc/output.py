@@ -0,0 +1,180 @@
+"""
+This module provides the machine-readable output of the CLI: writers that render result
+records as CSV, NDJSON or JSON.
+
+A record is a mapping of field names to values. Its "error" field is None or a structured
+error, `{"code": ..., "message": ...}` (see `error_record`); CSV writes it as the two columns
+`error_code` and `error_message`. Writers only call `write` on their stream, never `print`
+or `flush`, so output is buffered by the stream.
+"""
+
+import csv
+import json
+from abc import ABC, abstractmethod
+from operator import itemgetter
+from typing import Any, Iterable, Literal, Mapping, TextIO, TypeAlias
+
+from date_calc.exceptions import CalculationError
+
+OutputFormat: TypeAlias = Literal["json", "ndjson", "csv"]
+Record: TypeAlias = Mapping[str, Any]
+
+OUTPUT_FORMATS: tuple[str, ...] = ("json", "ndjson", "csv")
+
+
+def error_record(error: Exception) -> dict[str, str]:
+    """
+    Describe an exception as a structured error.
+
+    Args:
+        error (Exception): The error. A `CalculationError` keeps its code; other
+            `ValueError`s are "invalid_value", `OverflowError`s "out_of_range".
+
+    Returns:
+        dict[str, str]: The error code and message.
+    """
+    if isinstance(error, CalculationError):
+        code = error.code
+    elif isinstance(error, OverflowError):
+        code = "out_of_range"
+    else:
+        code = "invalid_value"
+    return {"code": code, "message": str(error)}
+
+
+class RecordWriter(ABC):
+    """
+    Base class of the writers: renders records on a text stream.
+
+    Writers are context managers; leaving the context calls `close`, which completes the
+    document (e.g. the closing bracket of a JSON array) but does not close the stream.
+
+    Args:
+        stream (TextIO): Where the records are written.
+        fields (Iterable[str]): The fields of the records, in output order.
+        fragment (bool, optional): Write a part of a larger document, without the CSV
+            header or the JSON brackets, e.g. the chunk of a parallel batch. Defaults to False.
+    """
+
+    def __init__(self, stream: TextIO, fields: Iterable[str], fragment: bool = False) -> None:
+        self.stream = stream
+        self.fields = list(fields)
+        self.fragment = fragment
+
+    def __enter__(self) -> "RecordWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @abstractmethod
+    def write(self, record: Record) -> None:
+        """Write one record."""
+
+    def write_fragment(self, text: str) -> None:
+        """Write the output of a `fragment` writer of the same format, e.g. a chunk rendered by a worker."""
+        self.stream.write(text)
+
+    def close(self) -> None:
+        """Complete the document."""
+
+
+class CsvRecordWriter(RecordWriter):
+    """Writes records as CSV rows, with a header row unless `fragment`."""
+
+    def __init__(self, stream: TextIO, fields: Iterable[str], fragment: bool = False) -> None:
+        super().__init__(stream, fields, fragment)
+        self._writerow = csv.writer(stream, lineterminator="\n").writerow
+        self._values = [name for name in self.fields if name != "error"]
+        getter = itemgetter(*self._values) if self._values else lambda record: ()
+        # itemgetter of a single key returns the value itself rather than a tuple
+        self._getter = getter if len(self._values) != 1 else lambda record: (getter(record),)
+        self._with_error = "error" in self.fields
+        if not fragment:
+            self._writerow(self._values + ["error_code", "error_message"] if self._with_error else self._values)
+
+    def write(self, record: Record) -> None:
+        try:
+            values = list(self._getter(record))
+        except KeyError:  # a record without some of the fields
+            values = [record.get(name, "") for name in self._values]
+        if self._with_error:
+            error = record.get("error")
+            values += (error["code"], error["message"]) if error else ("", "")
+        self._writerow(values)
+
+
+class NdjsonRecordWriter(RecordWriter):
+    """Writes one JSON object per line."""
+
+    def write(self, record: Record) -> None:
+        self.stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+class JsonRecordWriter(RecordWriter):
+    """
+    Writes the records as a JSON array, one element per line; with `array=False`, writes a
+    single record as a JSON object.
+    """
+
+    def __init__(self, stream: TextIO, fields: Iterable[str], fragment: bool = False, array: bool = True) -> None:
+        super().__init__(stream, fields, fragment)
+        self.array = array
+        self._count = 0
+
+    def write(self, record: Record) -> None:
+        text = json.dumps(record, ensure_ascii=False)
+        if not self.array:
+            if self._count:
+                raise ValueError("A JSON object holds a single record; use array=True.")
+            self.stream.write(text + "\n")
+        elif self._count:
+            self.stream.write(",\n" + text)
+        else:
+            self.stream.write(text if self.fragment else "[\n" + text)
+        self._count += 1
+
+    def write_fragment(self, text: str) -> None:
+        if text:
+            self.stream.write((",\n" if self._count else "[\n") + text)
+            self._count += 1
+
+    def close(self) -> None:
+        if self.array and not self.fragment:
+            self.stream.write("\n]\n" if self._count else "[]\n")
+
+
+_WRITERS: dict[str, type[RecordWriter]] = {
+    "json": JsonRecordWriter,
+    "ndjson": NdjsonRecordWriter,
+    "csv": CsvRecordWriter,
+}
+
+
+def open_writer(output_format: OutputFormat, stream: TextIO, fields: Iterable[str], fragment: bool = False) -> RecordWriter:
+    """
+    Create the writer of an output format.
+
+    Args:
+        output_format (OutputFormat): "json", "ndjson" or "csv".
+        stream (TextIO): Where the records are written.
+        fields (Iterable[str]): The fields of the records, in output order.
+        fragment (bool, optional): Write a part of a larger document. Defaults to False.
+
+    Returns:
+        RecordWriter: The writer.
+
+    Raises:
+        ValueError: If the format is unknown.
+    """
+    try:
+        writer = _WRITERS[output_format]
+    except KeyError:
+        raise ValueError(f"Invalid output format: '{output_format}'. Use one of {', '.join(OUTPUT_FORMATS)}.") from None
+    return writer(stream, fields, fragment)
+
+
+__all__ = [
+    'OUTPUT_FORMATS', 'OutputFormat', 'Record', 'RecordWriter', 'CsvRecordWriter', 'NdjsonRecordWriter',
+    'JsonRecordWriter', 'error_record', 'open_writer',
+]
@@ -0,0 +1,132 @@
+"""
+This module provides the interactive mode of the CLI (`dtcalc iter`): a shell that reads one
+command per line, so settings, translations and calendars are loaded once and every query
+after the first is answered without the start-up cost of a new `dtcalc` process.
+
+Commands:
+    calc DATE DAYS [business|consecutive]
+    diff START_DATE END_DATE [business|consecutive]
+    help [COMMAND]
+    quit | exit   (or end of input)
+
+Lines can also be piped: `printf 'calc 01-01-2025 30\\n' | dtcalc iter`.
+"""
+
+import argparse
+import cmd
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, TextIO
+
+from date_calc.cli import int_to_timedelta, valid_date
+
+if TYPE_CHECKING:
+    from date_calc.runner import DefaultRunner
+
+HISTORY_FILE: Path = Path.home() / ".dtcalc_history"
+HISTORY_LENGTH = 1000
+
+_TYPES_OF_DAYS = ("consecutive", "business")
+
+
+class DateCalcShell(cmd.Cmd):
+    """
+    A line-oriented shell over `DefaultRunner`.
+
+    When input is a terminal, the shell shows a prompt and keeps a readline history in
+    `HISTORY_FILE`; otherwise (piped input) it reads the lines silently, one result per line.
+
+    Args:
+        runner (DefaultRunner): Performs the calculations.
+        stdin (TextIO, optional): The input. Defaults to `sys.stdin`.
+        stdout (TextIO, optional): The output. Defaults to `sys.stdout`.
+    """
+
+    intro = "dtcalc interactive mode. Type 'help' for the commands, 'quit' to leave."
+    prompt = "dtcalc> "
+
+    def __init__(self, runner: "DefaultRunner", stdin: TextIO | None = None, stdout: TextIO | None = None) -> None:
+        super().__init__(stdin=stdin, stdout=stdout)
+        self.runner = runner
+        self.interactive = (stdin or sys.stdin).isatty()
+        if not self.interactive:
+            self.use_rawinput = False
+            self.intro = None
+            self.prompt = ""
+
+    def preloop(self) -> None:
+        if self.interactive:
+            _load_history()
+
+    def postloop(self) -> None:
+        if self.interactive:
+            _save_history()
+
+    def emptyline(self) -> bool:
+        return False
+
+    def default(self, line: str) -> bool:
+        self._print(f"Unknown command: '{line.split()[0]}'. Type 'help' for the commands.")
+        return False
+
+    def do_calc(self, arg: str) -> None:
+        """calc DATE DAYS [business|consecutive]: add (or subtract) DAYS days to DATE (DD-MM-YYYY)."""
+        try:
+            date, days, type_of_days = self._arguments(arg, "calc DATE DAYS [business|consecutive]")
+            interval = int_to_timedelta(days)
+            self._print(f"Resulting date: {self.runner.sum(valid_date(date), interval, type_of_days)}")
+        except (argparse.ArgumentTypeError, ValueError, OverflowError) as e:
+            self._print(str(e))
+
+    def do_diff(self, arg: str) -> None:
+        """diff START_DATE END_DATE [business|consecutive]: count the days between two dates (DD-MM-YYYY)."""
+        try:
+            start, end, type_of_days = self._arguments(arg, "diff START_DATE END_DATE [business|consecutive]")
+            self._print(f"Difference in days: {self.runner.diff(valid_date(start), valid_date(end), type_of_days)}")
+        except (argparse.ArgumentTypeError, ValueError) as e:
+            self._print(str(e))
+
+    def do_quit(self, arg: str) -> bool:
+        """quit: leave the interactive mode."""
+        return True
+
+    do_exit = do_quit
+
+    def do_EOF(self, arg: str) -> bool:
+        if self.interactive:
+            self._print("")
+        return True
+
+    def _arguments(self, arg: str, usage: str) -> tuple[str, str, str]:
+        """Split the arguments of calc/diff: two values and an optional type of days."""
+        values = arg.split()
+        if len(values) == 2:
+            values.append("consecutive")
+        if len(values) != 3 or values[2] not in _TYPES_OF_DAYS:
+            raise ValueError(f"Usage: {usage}")
+        return values[0], values[1], values[2]
+
+    def _print(self, text: str) -> None:
+        # flushed per line, so that a program driving the shell through a pipe gets each answer at once
+        self.stdout.write(text + "\n")
+        self.stdout.flush()
+
+
+def _load_history() -> None:
+    try:
+        import readline
+        readline.set_history_length(HISTORY_LENGTH)
+        readline.read_history_file(HISTORY_FILE)
+    except (ImportError, OSError):
+        pass
+
+
+def _save_history() -> None:
+    try:
+        import readline
+        readline.write_history_file(HISTORY_FILE)
+    except (ImportError, OSError):
+        pass
+
+
+__all__ = ['DateCalcShell', 'HISTORY_FILE']
@@ -1,24 +1,153 @@
+import sys
+from contextlib import ExitStack
 from datetime import datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TextIO
+
+from date_calc.exceptions import CalculationError
+from date_calc.output import error_record
+from date_calc.utils.date_calculator import DateCalculator
+from date_calc.utils.formatting import DEFAULT_LANGUAGE, DateFormatter, Language
+
+if TYPE_CHECKING:
+    from date_calc.batch import BatchSummary
+    from date_calc.translate.compile import CompileSummary
+
+_BUFFER_SIZE = 1 << 20
+_format_date = DateFormatter('%d-%m-%Y')
 
 class DefaultRunner:
 
-    def sum(self, date: datetime, days: timedelta) -> str:
-        result = date + days
-        return result.strftime('%d-%m-%Y -> %A')
+    def __init__(self, language: Language = DEFAULT_LANGUAGE) -> None:
+        self._format_sum = DateFormatter('%d-%m-%Y -> %A', language)
+        self._format_weekday = DateFormatter('%A', language)
+
+    def sum(self, date: datetime, days: timedelta, type_of_days: str = "consecutive") -> str:
+        return self._format_sum(self._add(date, days, type_of_days))
 
-    def diff(self, start: datetime, end: datetime) -> str:
+    def diff(self, start: datetime, end: datetime, type_of_days: str = "consecutive") -> str:
+        try:
+            return str(self.diff_days(start, end, type_of_days))
+        except CalculationError as e:
+            return str(e)
+
+    def diff_days(self, start: datetime, end: datetime, type_of_days: str = "consecutive") -> int:
         result = end - start
         if result.days < 0:
-            return "Start date must be before end date."
+            raise CalculationError("start_after_end", "Start date must be before end date.")
         elif result.days == 0:
-            return "The dates are the same."
+            raise CalculationError("same_dates", "The dates are the same.")
+        elif type_of_days == "business":
+            return DateCalculator.business_days(initial_date=start, final_date=end)
         else:
-            return str(result.days)
+            return result.days
+
+    def sum_record(self, date: datetime, days: timedelta, type_of_days: str = "consecutive") -> dict[str, Any]:
+        """The result of `sum` as a record for the structured outputs (see `date_calc.output`)."""
+        record: dict[str, Any] = {
+            "command": "calc", "date": _format_date(date), "interval": days.days,
+            "type_of_days": type_of_days, "result": None, "weekday": None, "error": None,
+        }
+        try:
+            result = self._add(date, days, type_of_days)
+            record["result"], record["weekday"] = _format_date(result), self._format_weekday(result)
+        except (ValueError, OverflowError) as e:
+            record["error"] = error_record(e)
+        return record
+
+    def diff_record(self, start: datetime, end: datetime, type_of_days: str = "consecutive") -> dict[str, Any]:
+        """The result of `diff` as a record for the structured outputs (see `date_calc.output`)."""
+        record: dict[str, Any] = {
+            "command": "diff", "start": _format_date(start), "end": _format_date(end),
+            "type_of_days": type_of_days, "result": None, "error": None,
+        }
+        try:
+            record["result"] = self.diff_days(start, end, type_of_days)
+        except ValueError as e:
+            record["error"] = error_record(e)
+        return record
+
+    @staticmethod
+    def _add(date: datetime, days: timedelta, type_of_days: str) -> datetime:
+        if type_of_days == "business":
+            return DateCalculator.new_date_with_interval_of_days(
+                initial_date=date, interval=days.days, type_of_days="business"
+            )
+        return date + days
     
-    def enter_interactive_mode(self) -> None:
-        print("Mode under development.")
+    def enter_interactive_mode(self, stdin: TextIO | None = None, stdout: TextIO | None = None) -> None:
+        from date_calc.repl import DateCalcShell
+
+        try:
+            DateCalcShell(self, stdin, stdout).cmdloop()
+        except KeyboardInterrupt:
+            print()
     
-    def compile_translations(self, path: str) -> None:
+    def batch(
+            self,
+            source: Path | str,
+            output: Path | str = "-",
+            input_format: str | None = None,
+            workers: int = 1,
+            output_format: str | None = None
+        ) -> "BatchSummary":
+        from date_calc.batch import detect_format, run_batch_parallel
+
+        input_format = input_format or detect_format(source)
+        with ExitStack() as stack:
+            if str(source) == "-":
+                reader = sys.stdin
+            else:
+                reader = stack.enter_context(open(source, encoding="utf-8", newline="", buffering=_BUFFER_SIZE))
+            if str(output) == "-":
+                writer = sys.stdout
+            else:
+                writer = stack.enter_context(open(output, "w", encoding="utf-8", newline="", buffering=_BUFFER_SIZE))
+            return run_batch_parallel(reader, writer, input_format, workers=workers, output_format=output_format)
+
+    def diff_matrix(
+            self,
+            starts: Path | str,
+            ends: Path | str,
+            output_format: str = "csv",
+            type_of_days: str = "consecutive",
+            destination: TextIO | None = None
+        ) -> tuple[int, int]:
+        from date_calc.matrix import read_dates, write_matrix
+
+        dates = []
+        for path in (starts, ends):
+            with open(path, encoding="utf-8", newline="") as lines:
+                dates.append(read_dates(
+                    lines, str(path), lambda line: print(f"{path}: skipped the header line {line!r}", file=sys.stderr)
+                ))
+        return write_matrix(*dates, destination or sys.stdout, type_of_days, output_format)
+
+    def serve(self, socket_path: Path | str | None = None, http_port: int | None = None, http_host: str = "127.0.0.1") -> None:
+        from date_calc.server import run_server
+
+        run_server(socket_path, http_port, http_host)
+
+    def compile_translations(
+            self,
+            path: Path | str,
+            workers: int | None = None,
+            force: bool = False,
+            destination: TextIO | None = None
+        ) -> "CompileSummary":
         from date_calc.translate.compile import compile_po_2_mo
-        
-        compile_po_2_mo(path)
\ No newline at end of file
+
+        destination = destination or sys.stdout
+        summary = compile_po_2_mo(path, workers, force)
+        for result in summary.results:
+            line = f"{result.status:<9} {result.po_file.relative_to(path).as_posix()}"
+            if result.status != "skipped":
+                line += f"  {result.seconds * 1000:.1f} ms"
+            if result.error:
+                line += f"  {result.error}"
+            print(line, file=destination)
+        print(
+            f"{summary.compiled} compiled, {summary.skipped} skipped, {summary.failed} failed in {summary.seconds:.2f} s",
+            file=destination
+        )
+        return summary
\ No newline at end of file
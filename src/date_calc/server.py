@@ -0,0 +1,299 @@
+"""
+This module provides the daemon of the `serve` command: an asyncio server that answers
+date queries over a Unix domain socket or localhost HTTP, so that callers do not pay the
+start-up of the interpreter and of the calendars on every calculation.
+
+A query is a JSON object with an optional "id", echoed in the answer, and the fields:
+
+    operation        "calc", "diff" or "is_business_day"
+    date             the (start) date (DD-MM-YYYY, DD/MM/YYYY, YYYY-MM-DD or "today")
+    end_date         the end date, for "diff"
+    interval         the number of days, for "calc"
+    type_of_days     "consecutive" (default) or "business", for "calc" and "diff"
+
+The answers of "calc" and "diff" are the records of `DefaultRunner.sum_record` and
+`DefaultRunner.diff_record`; every answer has a "result" and a structured "error" (see
+`date_calc.output`).
+
+Business days are those of `DEFAULT_CALENDAR` (Monday to Friday, no holidays), as in the
+CLI: "calc" and "diff" go through the runner, which uses it, and "is_business_day" asks it
+directly. A query cannot choose another calendar or weekmask.
+
+Over the Unix socket, queries and answers are NDJSON lines. A client may pipeline: send
+many queries without waiting, and read the answers, which come in the same order. Over
+HTTP, a query is the JSON body of a `POST /` or the parameters of a `GET /<operation>?...`,
+on keep-alive connections, which may also be pipelined. All clients share one event loop:
+queries are answered inline, as they take microseconds.
+"""
+
+import asyncio
+import errno
+import json
+import os
+import signal
+import socket
+from datetime import timedelta
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qsl, urlsplit
+
+from date_calc.output import error_record
+from date_calc.runner import DefaultRunner
+from date_calc.utils.business_calendar import DEFAULT_CALENDAR
+from date_calc.utils.parsing import DateParser
+
+OPERATIONS: tuple[str, ...] = ("calc", "diff", "is_business_day")
+
+_MAX_LINE = 1 << 16
+_WARM_UP: tuple[dict[str, Any], ...] = (
+    {"operation": "calc", "date": "01-01-2025", "interval": 1, "type_of_days": "business"},
+    {"operation": "diff", "date": "01-01-2025", "end_date": "02-01-2025", "type_of_days": "business"},
+)
+_HTTP_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 413: "Content Too Large"}
+
+
+def answer(query: Any, runner: DefaultRunner, parse: DateParser) -> dict[str, Any]:
+    """
+    Answer one query.
+
+    Args:
+        query (Any): The decoded JSON query; see the module documentation.
+        runner (DefaultRunner): The runner evaluating "calc" and "diff".
+        parse (DateParser): The date parser of the connection.
+
+    Returns:
+        dict[str, Any]: The answer, with the "id" of the query, a "result" and an "error".
+    """
+    if not isinstance(query, dict):
+        return {"id": None, "result": None, "error": {"code": "invalid_query", "message": "A query must be a JSON object."}}
+    try:
+        record = _evaluate(query, runner, parse)
+    except (ValueError, TypeError, OverflowError) as e:
+        record = {"result": None, "error": error_record(e)}
+    return {"id": query.get("id"), **record}
+
+
+def _evaluate(query: dict[str, Any], runner: DefaultRunner, parse: DateParser) -> dict[str, Any]:
+    operation = query.get("operation")
+    if operation not in OPERATIONS:
+        raise ValueError(f"Invalid operation: '{operation}'. Use one of {', '.join(OPERATIONS)}.")
+    if not query.get("date"):
+        raise ValueError(f"'{operation}' needs a date.")
+    start = parse(query["date"])
+    if operation == "is_business_day":
+        return {"result": DEFAULT_CALENDAR.is_business_day(start), "error": None}
+
+    type_of_days = query.get("type_of_days") or "consecutive"
+    if type_of_days not in ("consecutive", "business"):
+        raise ValueError(f"Invalid type of days: '{type_of_days}'. Use 'consecutive' or 'business'.")
+    if operation == "calc":
+        if query.get("interval") in (None, ""):
+            raise ValueError("'calc' needs a date and an interval.")
+        return runner.sum_record(start, timedelta(days=int(query["interval"])), type_of_days)
+    if not query.get("end_date"):
+        raise ValueError("'diff' needs a date and an end date.")
+    return runner.diff_record(start, parse(query["end_date"]), type_of_days)
+
+
+def _dumps(answer: dict[str, Any]) -> bytes:
+    return json.dumps(answer, ensure_ascii=False).encode() + b"\n"
+
+
+class _QueryProtocol(asyncio.Protocol):
+    """
+    Answers the NDJSON queries of a socket connection, in order.
+
+    Every query complete in a received chunk is answered at once, and the answers of a chunk
+    (all the queries a client pipelined) go out in a single write. Reading pauses while the
+    client does not read its answers.
+    """
+
+    def __init__(self, runner: DefaultRunner) -> None:
+        self.runner = runner
+        self.parse = DateParser()
+        self.transport: asyncio.Transport | None = None
+        self.pending = b""
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self.transport = transport
+
+    def data_received(self, data: bytes) -> None:
+        *lines, self.pending = (self.pending + data).split(b"\n")
+        answers = []
+        for line in lines:
+            if line.strip():
+                try:
+                    query = json.loads(line)
+                except ValueError:
+                    query = None
+                answers.append(_dumps(answer(query, self.runner, self.parse)))
+        if answers:
+            self.transport.write(b"".join(answers))
+        if len(self.pending) > _MAX_LINE:
+            self.transport.write(_dumps({"id": None, "result": None, "error": {"code": "invalid_query", "message": "The query is too large."}}))
+            self.transport.close()
+
+    def pause_writing(self) -> None:
+        self.transport.pause_reading()
+
+    def resume_writing(self) -> None:
+        self.transport.resume_reading()
+
+
+class DateCalcServer:
+    """
+    The `serve` daemon.
+
+    Args:
+        socket_path (Path | str, optional): The Unix domain socket to listen on.
+        http_port (int, optional): The localhost TCP port of the HTTP endpoint.
+        http_host (str, optional): The address of the HTTP endpoint. Defaults to "127.0.0.1".
+        runner (DefaultRunner, optional): The runner evaluating the queries.
+
+    Raises:
+        ValueError: If neither a socket nor a port is given.
+    """
+
+    def __init__(
+            self,
+            socket_path: Path | str | None = None,
+            http_port: int | None = None,
+            http_host: str = "127.0.0.1",
+            runner: DefaultRunner | None = None
+        ) -> None:
+        if socket_path is None and http_port is None:
+            raise ValueError("The server needs a socket path or an HTTP port.")
+        self.socket_path = Path(socket_path) if socket_path is not None else None
+        self.http_port = http_port
+        self.http_host = http_host
+        self.runner = runner or DefaultRunner()
+        self._servers: list[asyncio.Server] = []
+
+    async def start(self) -> None:
+        """
+        Warm the runner up and start listening.
+
+        Raises:
+            OSError: If another daemon is answering on the socket (errno EADDRINUSE), or
+                the socket or port cannot be opened.
+        """
+        parse = DateParser()
+        for query in _WARM_UP:
+            answer(query, self.runner, parse)
+        loop = asyncio.get_running_loop()
+        if self.socket_path is not None:
+            if self.socket_path.is_socket():
+                _remove_stale_socket(self.socket_path)
+            self._servers.append(await loop.create_unix_server(lambda: _QueryProtocol(self.runner), self.socket_path))
+        if self.http_port is not None:
+            self._servers.append(await asyncio.start_server(self._handle_http, self.http_host, self.http_port, limit=_MAX_LINE))
+
+    @property
+    def http_address(self) -> tuple[str, int] | None:
+        """The (host, port) of the HTTP endpoint, once started; useful with port 0."""
+        for server in self._servers:
+            for sock in server.sockets:
+                if sock.family in (socket.AF_INET, socket.AF_INET6):
+                    return sock.getsockname()[:2]
+        return None
+
+    async def close(self) -> None:
+        """Stop listening and remove the socket file."""
+        for server in self._servers:
+            server.close()
+            await server.wait_closed()
+        self._servers.clear()
+        if self.socket_path is not None and self.socket_path.is_socket():
+            self.socket_path.unlink()
+
+    async def serve_forever(self) -> None:
+        """Start the server and answer queries until cancelled, SIGINT or SIGTERM."""
+        await self.start()
+        loop = asyncio.get_running_loop()
+        stop = loop.create_future()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(signum, stop.cancel)
+            except (NotImplementedError, RuntimeError):  # not the main thread, or not supported
+                pass
+        try:
+            await stop
+        except asyncio.CancelledError:
+            pass
+        finally:
+            await self.close()
+
+    async def _handle_http(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Answer the HTTP/1.1 requests of a connection, in order."""
+        parse = DateParser()
+        try:
+            while request_line := await reader.readline():
+                if not request_line.strip():
+                    continue
+                method, target, version = request_line.decode("latin-1").split(maxsplit=2)
+                headers = {}
+                while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers.get("content-length", 0))
+                if length > _MAX_LINE:
+                    self._write_http(writer, 413, {"error": {"code": "invalid_query", "message": "The query is too large."}}, False)
+                    break
+                body = await reader.readexactly(length)
+                status, payload = self._http_answer(method, target, body, parse)
+                keep_alive = version.strip() == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+                self._write_http(writer, status, payload, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    def _http_answer(self, method: str, target: str, body: bytes, parse: DateParser) -> tuple[int, dict[str, Any]]:
+        url = urlsplit(target)
+        if method == "POST" and url.path == "/":
+            try:
+                query = json.loads(body)
+            except ValueError:
+                query = None
+        elif method == "GET" and url.path.strip("/") in OPERATIONS:
+            query = {"operation": url.path.strip("/"), **dict(parse_qsl(url.query))}
+        elif method not in ("GET", "POST"):
+            return 405, {"error": {"code": "invalid_query", "message": f"Method not allowed: {method}."}}
+        else:
+            return 404, {"error": {"code": "invalid_query", "message": f"Not found: {url.path}."}}
+        result = answer(query, self.runner, parse)
+        return (400 if result["error"] else 200), result
+
+    @staticmethod
+    def _write_http(writer: asyncio.StreamWriter, status: int, payload: dict[str, Any], keep_alive: bool) -> None:
+        body = _dumps(payload)
+        writer.write(
+            f"HTTP/1.1 {status} {_HTTP_REASONS[status]}\r\n"
+            f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode("latin-1") + body
+        )
+
+
+def _remove_stale_socket(path: Path) -> None:
+    """Remove a socket file left behind by a daemon that did not stop cleanly; refuse if a daemon still answers on it."""
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.settimeout(1.0)
+        probe.connect(os.fspath(path))
+    except ConnectionRefusedError:
+        path.unlink(missing_ok=True)
+        return
+    finally:
+        probe.close()
+    raise OSError(errno.EADDRINUSE, "Another dtcalc daemon is already listening on this socket", os.fspath(path))
+
+
+def run_server(socket_path: Path | str | None = None, http_port: int | None = None, http_host: str = "127.0.0.1") -> None:
+    """Run the daemon until interrupted; see `DateCalcServer`."""
+    asyncio.run(DateCalcServer(socket_path, http_port, http_host).serve_forever())
+
+
+__all__ = ['OPERATIONS', 'DateCalcServer', 'answer', 'run_server']
@@ -1,4 +1,10 @@
-from date_calc.translate.translate import translate_with_gettext
-from .compile import compile_po_2_mo
+from date_calc.translate.translate import CATALOGS, CatalogRegistry, translate_with_gettext
 
-__all__ = ['translate_with_gettext', 'compile_po_2_mo']
\ No newline at end of file
+def __getattr__(name: str):
+    # compile_po_2_mo needs polib, which only the `compile` command uses
+    if name == 'compile_po_2_mo':
+        from .compile import compile_po_2_mo
+        return compile_po_2_mo
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+__all__ = ['CATALOGS', 'CatalogRegistry', 'translate_with_gettext', 'compile_po_2_mo']
@@ -1,15 +1,115 @@
-from gettext import GNUTranslations
+"""
+This module provides the gettext catalogs of the application.
+
+`CatalogRegistry` loads the `.mo` catalog of each language once, the first time it is asked
+for, and shares it: the catalog is parsed into gettext's dictionary, so a lookup is a dict
+access with no file I/O. Nothing is installed globally (no `bindtextdomain`, `textdomain`
+or `install`), so a process may serve several languages at once, handing each request the
+translator of its language:
+
+    >>> _ = CATALOGS.gettext('en_US')
+    >>> _("Calculate")
+    'Calculate'
+
+Languages without a catalog get `NullTranslations`, which returns the (English) source
+strings.
+"""
+import threading
 from pathlib import Path
-from typing import Literal
+from typing import TYPE_CHECKING, Callable
+
+from date_calc.utils.formatting import DEFAULT_LANGUAGE, Language
+
+if TYPE_CHECKING:
+    from gettext import GNUTranslations, NullTranslations
 
 _DEFAULT_LOCALES_PATH: Path = Path(__file__).parents[1].joinpath('locale')
 DEFAULT_LOCALES_PATH: str = _DEFAULT_LOCALES_PATH.as_posix()
+DEFAULT_DOMAIN: str = 'app'
+
+
+class CatalogRegistry:
+    """
+    The shared gettext catalogs of a locale folder, one per language, loaded on first use.
+
+    The catalogs are read-only once loaded, so they may be used by any number of threads.
+
+    Args:
+        localedir (Path | str, optional): The locale folder. Defaults to the package's.
+        domain (str, optional): The gettext domain. Defaults to "app".
+    """
+
+    def __init__(self, localedir: Path | str = _DEFAULT_LOCALES_PATH, domain: str = DEFAULT_DOMAIN) -> None:
+        self.localedir = Path(localedir)
+        self.domain = domain
+        self._catalogs: dict[str, 'NullTranslations'] = {}
+        self._lock = threading.Lock()
+
+    def get(self, lang: Language | str = DEFAULT_LANGUAGE, fallback: bool = True) -> 'NullTranslations':
+        """
+        The catalog of a language.
+
+        Args:
+            lang (Language | str, optional): The language, e.g. "pt_BR". Defaults to "pt_BR".
+            fallback (bool, optional): Return `NullTranslations` if the language has no catalog.
+                Defaults to True.
+
+        Returns:
+            NullTranslations: The shared catalog (a `GNUTranslations` when the file exists).
 
-def translate_with_gettext(lang: Literal['pt_BR', 'en_US']) -> GNUTranslations:
+        Raises:
+            FileNotFoundError: If the language has no catalog and `fallback` is False.
+        """
+        catalog = self._catalogs.get(lang)
+        if catalog is None:
+            with self._lock:
+                if lang not in self._catalogs:
+                    self._catalogs[lang] = self._load(lang)
+                catalog = self._catalogs[lang]
+        if not fallback and not hasattr(catalog, '_catalog'):  # a NullTranslations
+            raise FileNotFoundError(f"No translation file found for domain '{self.domain}' and language '{lang}'.")
+        return catalog
+
+    def gettext(self, lang: Language | str = DEFAULT_LANGUAGE) -> Callable[[str], str]:
+        """The `gettext` function of a language's catalog."""
+        return self.get(lang).gettext
+
+    def clear(self) -> None:
+        """Forget the loaded catalogs, e.g. after the `.mo` files are recompiled."""
+        with self._lock:
+            self._catalogs.clear()
+
+    def _load(self, lang: str) -> 'NullTranslations':
+        import gettext
+
+        path = gettext.find(self.domain, self.localedir, [lang])
+        if path is None:
+            return gettext.NullTranslations()
+        return _read_catalog(Path(path))
+
+
+def _read_catalog(path: Path) -> 'GNUTranslations':
+    """Parse a `.mo` file."""
     import gettext
-    gettext.bindtextdomain('app', localedir=DEFAULT_LOCALES_PATH)
-    gettext.textdomain('app')
 
-    translate = gettext.translation('app', localedir=DEFAULT_LOCALES_PATH, languages=[lang])
-    
-    return translate
+    with open(path, 'rb') as file:
+        return gettext.GNUTranslations(file)
+
+
+CATALOGS = CatalogRegistry()
+
+
+def translate_with_gettext(lang: Language) -> 'GNUTranslations':
+    """
+    The shared catalog of a language, from `CATALOGS`.
+
+    Args:
+        lang (Language): "pt_BR" or "en_US".
+
+    Returns:
+        GNUTranslations: The catalog.
+
+    Raises:
+        FileNotFoundError: If the language has no catalog.
+    """
+    return CATALOGS.get(lang, fallback=False)  # type: ignore[return-value]
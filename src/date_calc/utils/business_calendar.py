@@ -0,0 +1,447 @@
+"""
+This module provides the BusinessCalendar class, which defines which days count as
+business days for `DateCalculator`: the working days of a weekmask (Monday to Friday
+by default), except for a table of holidays.
+
+Dates are handled as proleptic Gregorian ordinals (`date.toordinal()`); ordinal 1 is a Monday,
+so the weekday of an ordinal is `(ordinal - 1) % 7`.
+"""
+
+from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right
+from datetime import date, timedelta
+from functools import lru_cache, partial
+from typing import Iterable, Literal, NamedTuple, TypeAlias, final, get_args
+
+Weekmask: TypeAlias = int | str | Iterable[str]
+RollConvention: TypeAlias = Literal["following", "modified_following", "preceding", "modified_preceding"]
+ROLL_CONVENTIONS: tuple[str, ...] = get_args(RollConvention)
+
+MONDAY_TO_FRIDAY: int = 0b0011111
+"""Default weekmask. Bit n set means weekday n (Monday = 0) is a working day."""
+
+_DAY_NAMES: tuple[str, ...] = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+
+
+class WeekTable(NamedTuple):
+    """Lookup tables of a weekmask, used to count and locate working days in O(1)."""
+
+    mask: int
+    per_week: int
+    """Working days in a week."""
+    before: tuple[int, ...]
+    """Working days of the week before each weekday (8 entries)."""
+    weekdays: tuple[int, ...]
+    """The working weekdays, in order."""
+
+    def days_before(self, ordinal: int) -> int:
+        """Count the working weekdays before the given ordinal, starting from ordinal 1."""
+        weeks, weekday = divmod(ordinal - 1, 7)
+        return weeks * self.per_week + self.before[weekday]
+
+    def nth_day(self, index: int) -> int:
+        """Return the ordinal of the working weekday preceded by exactly `index` of them."""
+        weeks, position = divmod(index, self.per_week)
+        return weeks * 7 + self.weekdays[position] + 1
+
+    def is_working(self, weekday: int) -> bool:
+        """Check whether a weekday (Monday = 0) is a working day."""
+        return bool(self.mask >> weekday & 1)
+
+
+def parse_weekmask(weekmask: Weekmask) -> int:
+    """
+    Convert a weekmask to its 7-bit integer form (bit n set: weekday n, Monday = 0, works).
+
+    Args:
+        weekmask (Weekmask): An integer bitmask, a string of seven '0'/'1' characters from
+            Monday to Sunday (e.g. "1111110"), or day names, as a string or an iterable
+            (e.g. "Sun Mon Tue Wed Thu").
+
+    Returns:
+        int: The integer weekmask.
+
+    Raises:
+        ValueError: If the weekmask is malformed or has no working day.
+    """
+    if isinstance(weekmask, bool):
+        raise ValueError(f"Invalid weekmask: {weekmask!r}.")
+
+    if isinstance(weekmask, int):
+        mask = weekmask
+    elif isinstance(weekmask, str) and len(weekmask) == 7 and set(weekmask) <= {"0", "1"}:
+        mask = sum(1 << weekday for weekday, flag in enumerate(weekmask) if flag == "1")
+    else:
+        names = weekmask.replace(",", " ").split() if isinstance(weekmask, str) else list(weekmask)
+        try:
+            mask = sum({1 << _DAY_NAMES.index(name.strip().lower()[:3]) for name in names})
+        except (AttributeError, ValueError):
+            raise ValueError(f"Invalid weekmask: {weekmask!r}. Use day names such as 'Mon Tue Wed Thu Fri'.") from None
+
+    if not 0 < mask < 0b10000000:
+        raise ValueError(f"Invalid weekmask: {weekmask!r}. It must have between one and seven working days.")
+    return mask
+
+
+@lru_cache(maxsize=128)
+def week_table(mask: int) -> WeekTable:
+    """
+    Return the lookup tables of an integer weekmask, computed once per mask.
+
+    Args:
+        mask (int): A weekmask as returned by `parse_weekmask`.
+
+    Returns:
+        WeekTable: The tables of the weekmask.
+    """
+    weekdays = tuple(weekday for weekday in range(7) if mask >> weekday & 1)
+    before = tuple(sum(1 for weekday in weekdays if weekday < day) for day in range(8))
+    return WeekTable(mask, len(weekdays), before, weekdays)
+
+
+class BaseBusinessCalendar(ABC):
+    """
+    Business-day arithmetic shared by the calendar types accepted by `DateCalculator`.
+
+    Subclasses define the business-day numbering of dates through `business_days_before`
+    and its inverse `nth_business_day`; counting and offsetting are derived from them.
+    """
+
+    __slots__ = ()
+
+    @property
+    @abstractmethod
+    def weekmask(self) -> int:
+        """The integer weekmask of the calendar."""
+        ...
+
+    @abstractmethod
+    def business_days_before(self, ordinal: int) -> int:
+        """Count the business days before the given ordinal, starting from ordinal 1."""
+        ...
+
+    @abstractmethod
+    def nth_business_day(self, index: int) -> int:
+        """Return the ordinal of the business day preceded by exactly `index` business days."""
+        ...
+
+    @abstractmethod
+    def is_business_day(self, day: date) -> bool:
+        """Check whether a date is a business day in this calendar."""
+        ...
+
+    @abstractmethod
+    def with_weekmask(self, weekmask: Weekmask) -> "BaseBusinessCalendar":
+        """Return the same calendar with another weekmask."""
+        ...
+
+    def business_days_between(self, initial_date: date, final_date: date) -> int:
+        """
+        Count the business days from `initial_date` up to, but not including, `final_date`.
+
+        Args:
+            initial_date (date): The starting date (inclusive).
+            final_date (date): The ending date (exclusive).
+
+        Returns:
+            int: The number of business days in the range, or 0 when
+                `initial_date` is not before `final_date`.
+        """
+        if initial_date >= final_date:
+            return 0
+        return self.business_days_before(final_date.toordinal()) - self.business_days_before(initial_date.toordinal())
+
+    def business_day_numbers(self, initial_date: date, final_date: date, step: int = 1) -> range:
+        """
+        Return the numbers (see `nth_business_day`) of the business days between two dates,
+        following the conventions of `range`: with a positive step, the business days from
+        `initial_date` up to, but not including, `final_date`; with a negative step, those from
+        `initial_date` down to, but not including, `final_date`.
+
+        Args:
+            initial_date (date): The starting date (inclusive).
+            final_date (date): The ending date (exclusive).
+            step (int, optional): Take every `step`-th business day. Defaults to 1.
+
+        Returns:
+            range: The business-day numbers, in iteration order.
+
+        Raises:
+            ValueError: If `step` is zero.
+        """
+        if step == 0:
+            raise ValueError("The step must not be zero.")
+        if step > 0:
+            start = self.business_days_before(initial_date.toordinal())
+            stop = self.business_days_before(final_date.toordinal())
+        else:
+            start = self.business_days_before(initial_date.toordinal() + 1) - 1
+            stop = self.business_days_before(final_date.toordinal() + 1) - 1
+        return range(start, stop, step)
+
+    def roll(self, day: date, convention: RollConvention) -> date:
+        """
+        Adjust a date that is not a business day to a business day.
+
+        Conventions:
+            - "following": the first business day on or after the date;
+            - "preceding": the last business day on or before the date;
+            - "modified_following": "following", unless it falls in the next month,
+              in which case "preceding";
+            - "modified_preceding": "preceding", unless it falls in the previous month,
+              in which case "following".
+
+        Args:
+            day (date): The date to adjust.
+            convention (RollConvention): The roll convention.
+
+        Returns:
+            date: The adjusted date, of the same type as `day`.
+
+        Raises:
+            ValueError: If the convention is unknown.
+        """
+        if convention not in ROLL_CONVENTIONS:
+            raise ValueError(f"Invalid roll convention: {convention!r}. Use one of {', '.join(ROLL_CONVENTIONS)}.")
+
+        ordinal = day.toordinal()
+        following = self.nth_business_day(self.business_days_before(ordinal))
+        if following == ordinal:
+            return day
+
+        preceding = self.nth_business_day(self.business_days_before(ordinal + 1) - 1)
+        if convention == "following":
+            rolled = following
+        elif convention == "preceding":
+            rolled = preceding
+        elif convention == "modified_following":
+            rolled = following if date.fromordinal(following).month == day.month else preceding
+        else:
+            rolled = preceding if date.fromordinal(preceding).month == day.month else following
+        return day + timedelta(days=rolled - ordinal)
+
+    def add_business_days(self, initial_date: date, interval: int) -> date:
+        """
+        Move a date by a number of business days, forward or backward.
+
+        A start that is not a business day is first normalised to the business day before
+        it (moving forward) or after it (moving backward). A start that is neither a working
+        weekday nor the day right after one (a Sunday, in a Monday-to-Friday week) also
+        costs one extra step, as `DateCalculator` has always done.
+
+        Args:
+            initial_date (date): The starting date.
+            interval (int): The number of business days to move; negative moves backward.
+
+        Returns:
+            date: The resulting date, of the same type as `initial_date`.
+        """
+        if interval == 0:
+            return initial_date
+
+        steps = abs(interval)
+        weekday = initial_date.weekday()
+        if not self.weekmask >> weekday & 1 and not self.weekmask >> (weekday - 1) % 7 & 1:
+            steps += 1
+
+        ordinal = initial_date.toordinal()
+        if interval > 0:
+            index = self.business_days_before(ordinal + 1) - 1 + steps
+        else:
+            index = self.business_days_before(ordinal) - steps
+        return initial_date + timedelta(days=self.nth_business_day(index) - ordinal)
+
+
+@final
+class BusinessCalendar(BaseBusinessCalendar):
+    """
+    An immutable business-day calendar: the working days of a weekmask, minus a table of holidays.
+
+    The weekmask is turned into per-mask lookup tables (`week_table`), and the holidays are
+    kept as a sorted tuple of ordinals, together with the number of business days that
+    precede each one, so counting and offsetting cost O(log H) with `bisect` instead of
+    a scan of the holiday list, whatever the weekmask.
+
+    Args:
+        holidays (Iterable[date]): Dates that are not business days. Repeated dates
+            are merged; holidays on non-working weekdays have no effect.
+        name (str, optional): A label for the calendar. Defaults to "default".
+        weekmask (Weekmask, optional): The working days of the week, see `parse_weekmask`.
+            Defaults to Monday to Friday.
+    """
+
+    __slots__ = ("_name", "_table", "_all_holidays", "_holidays", "_holiday_ranks", "_hash")
+
+    def __init__(
+            self,
+            holidays: Iterable[date] = (),
+            *,
+            name: str = "default",
+            weekmask: Weekmask = MONDAY_TO_FRIDAY
+        ) -> None:
+        table = week_table(parse_weekmask(weekmask))
+        all_holidays = tuple(sorted({day.toordinal() for day in holidays}))
+        ordinals = tuple(o for o in all_holidays if table.is_working((o - 1) % 7))
+        object.__setattr__(self, "_name", name)
+        object.__setattr__(self, "_table", table)
+        object.__setattr__(self, "_all_holidays", all_holidays)
+        object.__setattr__(self, "_holidays", ordinals)
+        # business days (holidays excluded) before each holiday, non-decreasing
+        object.__setattr__(
+            self, "_holiday_ranks", tuple(table.days_before(o) - i for i, o in enumerate(ordinals))
+        )
+        # computed once: calendars are part of cache keys, and a tuple rehashes its items on every call
+        object.__setattr__(self, "_hash", hash((table.mask, ordinals)))
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, BusinessCalendar):
+            return NotImplemented
+        return self._table.mask == other._table.mask and self._holidays == other._holidays
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(name={self._name!r}, "
+            f"weekmask={self.weekmask_string!r}, holidays={len(self._holidays)})"
+        )
+
+    def __reduce__(self):
+        # rebuilt through __init__, since attributes cannot be set on an instance
+        holidays = tuple(date.fromordinal(o) for o in self._all_holidays)
+        return (partial(BusinessCalendar, name=self._name, weekmask=self._table.mask), (holidays,))
+
+    @property
+    def name(self) -> str:
+        """The label of the calendar."""
+        return self._name
+
+    @property
+    def weekmask(self) -> int:
+        """The integer weekmask of the calendar (bit n set: weekday n, Monday = 0, works)."""
+        return self._table.mask
+
+    @property
+    def weekmask_string(self) -> str:
+        """The weekmask as seven '0'/'1' characters, from Monday to Sunday."""
+        return "".join("1" if self._table.is_working(weekday) else "0" for weekday in range(7))
+
+    @property
+    def week_table(self) -> WeekTable:
+        """The lookup tables of the weekmask."""
+        return self._table
+
+    @property
+    def holidays(self) -> tuple[date, ...]:
+        """The holidays that fall on working weekdays, in ascending order."""
+        return tuple(date.fromordinal(o) for o in self._holidays)
+
+    @property
+    def holiday_ordinals(self) -> tuple[int, ...]:
+        """The ordinals of the holidays that fall on working weekdays, in ascending order."""
+        return self._holidays
+
+    @property
+    def all_holiday_ordinals(self) -> tuple[int, ...]:
+        """The ordinals of every holiday, including those on non-working weekdays, in ascending order."""
+        return self._all_holidays
+
+    @property
+    def holiday_ranks(self) -> tuple[int, ...]:
+        """For each holiday, the number of business days before it (non-decreasing)."""
+        return self._holiday_ranks
+
+    def with_holidays(self, holidays: Iterable[date], *, name: str | None = None) -> "BusinessCalendar":
+        """
+        Return a new calendar with the given holidays added to this one,
+        e.g. local holidays on top of the national calendar.
+
+        Args:
+            holidays (Iterable[date]): The additional holidays.
+            name (str, optional): The label of the new calendar. Defaults to this calendar's name.
+
+        Returns:
+            BusinessCalendar: The combined calendar.
+        """
+        combined = [date.fromordinal(o) for o in self._all_holidays]
+        combined.extend(holidays)
+        return BusinessCalendar(combined, name=self._name if name is None else name, weekmask=self.weekmask)
+
+    def with_weekmask(self, weekmask: Weekmask) -> "BusinessCalendar":
+        """
+        Return a calendar with the same holidays and name and another weekmask.
+        Results are cached, so calling this once per calculation is cheap.
+
+        Args:
+            weekmask (Weekmask): The working days of the week, see `parse_weekmask`.
+
+        Returns:
+            BusinessCalendar: The calendar with the given weekmask.
+        """
+        mask = parse_weekmask(weekmask)
+        if mask == self._table.mask:
+            return self
+        return _derived_calendar(self._all_holidays, self._name, mask)
+
+    def business_days_before(self, ordinal: int) -> int:
+        """
+        Count the business days before the given ordinal, starting from ordinal 1.
+
+        Args:
+            ordinal (int): A proleptic Gregorian ordinal.
+
+        Returns:
+            int: The number of business days with a smaller ordinal.
+        """
+        return self._table.days_before(ordinal) - bisect_left(self._holidays, ordinal)
+
+    def nth_business_day(self, index: int) -> int:
+        """
+        Return the ordinal of the business day preceded by exactly `index` business days,
+        the inverse of `business_days_before`.
+
+        Args:
+            index (int): The zero-based business-day number.
+
+        Returns:
+            int: The ordinal of that business day.
+        """
+        return self._table.nth_day(index + bisect_right(self._holiday_ranks, index))
+
+    def is_business_day(self, day: date) -> bool:
+        """
+        Check whether a date is a business day in this calendar.
+
+        Args:
+            day (date): The date to check.
+
+        Returns:
+            bool: True for a working weekday that is not a holiday.
+        """
+        ordinal = day.toordinal()
+        i = bisect_left(self._holidays, ordinal)
+        is_holiday = i < len(self._holidays) and self._holidays[i] == ordinal
+        return self._table.is_working(day.weekday()) and not is_holiday
+
+
+@lru_cache(maxsize=64)
+def _derived_calendar(holiday_ordinals: tuple[int, ...], name: str, mask: int) -> BusinessCalendar:
+    """Cached constructor behind `BusinessCalendar.with_weekmask`."""
+    return BusinessCalendar((date.fromordinal(o) for o in holiday_ordinals), name=name, weekmask=mask)
+
+
+DEFAULT_CALENDAR = BusinessCalendar()
+"""Weekend-only calendar: Monday to Friday are business days, no holidays."""
+
+__all__ = [
+    'BaseBusinessCalendar', 'BusinessCalendar', 'DEFAULT_CALENDAR',
+    'MONDAY_TO_FRIDAY', 'ROLL_CONVENTIONS', 'RollConvention', 'Weekmask', 'WeekTable',
+    'parse_weekmask', 'week_table',
+]
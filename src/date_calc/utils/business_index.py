@@ -0,0 +1,351 @@
+"""
+This module provides the BusinessDayIndex class: a precomputed table of cumulative
+business-day numbers for every date of a range, built from a `BusinessCalendar`.
+
+With the table, counting business days between two dates is the difference of two
+lookups, and a business-day offset is a lookup in the list of business days, both O(1).
+The index can be saved to a flat binary file and memory-mapped back, so that CLI and
+worker processes share the same pages instead of rebuilding it at every start.
+
+File layout (little-endian):
+    header:  magic (8s), version (uint32), first ordinal, day count, base,
+             business-day count, holiday count, weekmask, name length (int32 each)
+    bytes[name length]     UTF-8 name of the source calendar, padded with NULs to a multiple of 4
+    int32[holiday count]   holiday ordinals of the source calendar, weekend holidays included
+    int32[day count + 1]   business days before each date, relative to `base`
+    int32[business count]  position of each business day from the first date
+"""
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from datetime import date
+from pathlib import Path
+from typing import TypeAlias, final
+
+from date_calc.utils.business_calendar import (
+    BaseBusinessCalendar, BusinessCalendar, DEFAULT_CALENDAR, Weekmask, parse_weekmask
+)
+
+StrOrPath: TypeAlias = Path | str
+Int32Buffer: TypeAlias = array | memoryview
+
+_MAGIC = b"DTCBDIX\x00"
+_VERSION = 3
+_HEADER = struct.Struct("<8sIiiiiiii")
+
+
+def _to_little_endian(values: array) -> bytes:
+    """Return the raw bytes of an int32 array in little-endian order."""
+    if sys.byteorder == "little":
+        return values.tobytes()
+    swapped = array("i", values)
+    swapped.byteswap()
+    return swapped.tobytes()
+
+
+def _int32_view(buffer: mmap.mmap, offset: int, length: int) -> Int32Buffer:
+    """Return `length` little-endian int32 values of `buffer`, without copying when possible."""
+    raw = memoryview(buffer)[offset:offset + 4 * length]
+    if sys.byteorder == "little":
+        return raw.cast("i")
+    values = array("i", raw.tobytes())
+    values.byteswap()
+    return values
+
+
+@final
+class BusinessDayIndex(BaseBusinessCalendar):
+    """
+    Cumulative business-day numbers of a `BusinessCalendar` over a range of dates.
+
+    Inside the range every query is an array lookup; outside of it the index falls back
+    to the arithmetic of the source calendar, so results never depend on the range chosen.
+    Use `build` to compute an index, `save`/`load` to persist it, or `load_or_build`.
+
+    Args:
+        calendar (BusinessCalendar): The calendar the index was built from.
+        first_ordinal (int): The ordinal of the first date of the range.
+        base (int): The business days of the calendar before the first date.
+        cumulative (Int32Buffer): Business days before each date of the range, relative
+            to `base`; one extra entry for the day after the range.
+        business (Int32Buffer): The position of each business day of the range,
+            counted from the first date.
+        path (Path, optional): The file the index was loaded from, if any.
+    """
+
+    __slots__ = ("_calendar", "_first", "_base", "_cumulative", "_business", "_path")
+
+    def __init__(
+            self,
+            calendar: BusinessCalendar,
+            first_ordinal: int,
+            base: int,
+            cumulative: Int32Buffer,
+            business: Int32Buffer,
+            path: Path | None = None
+        ) -> None:
+        self._calendar = calendar
+        self._first = first_ordinal
+        self._base = base
+        self._cumulative = cumulative
+        self._business = business
+        self._path = path
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(calendar={self._calendar!r}, "
+            f"first_date={self.first_date.isoformat()}, last_date={self.last_date.isoformat()})"
+        )
+
+    def __reduce__(self):
+        # a file-backed index is re-mapped by the receiving process instead of copied
+        if self._path is not None:
+            return (BusinessDayIndex.load, (self._path,))
+        return (BusinessDayIndex.build, (self._calendar, self.first_date, self.last_date))
+
+    @classmethod
+    def build(
+            cls,
+            calendar: BusinessCalendar = DEFAULT_CALENDAR,
+            first_date: date = date(1900, 1, 1),
+            last_date: date = date(2200, 12, 31)
+        ) -> "BusinessDayIndex":
+        """
+        Compute the index of a calendar over a range of dates.
+
+        Args:
+            calendar (BusinessCalendar, optional): The calendar to index. Defaults to Monday to Friday.
+            first_date (date, optional): The first date of the range. Defaults to 1900-01-01.
+            last_date (date, optional): The last date of the range (inclusive). Defaults to 2200-12-31.
+
+        Returns:
+            BusinessDayIndex: The index, held in memory.
+
+        Raises:
+            ValueError: If `last_date` is before `first_date`.
+        """
+        first = first_date.toordinal()
+        day_count = last_date.toordinal() - first + 1
+        if day_count <= 0:
+            raise ValueError(f"Invalid range: {first_date.isoformat()} is after {last_date.isoformat()}.")
+
+        cumulative = array("i", bytes(4 * (day_count + 1)))
+        business = array("i")
+        for position in range(day_count):
+            if calendar.is_business_day(date.fromordinal(first + position)):
+                business.append(position)
+            cumulative[position + 1] = len(business)
+
+        return cls(calendar, first, calendar.business_days_before(first), cumulative, business)
+
+    @classmethod
+    def load(cls, path: StrOrPath) -> "BusinessDayIndex":
+        """
+        Memory-map an index saved with `save`.
+
+        Args:
+            path (StrOrPath): The index file.
+
+        Returns:
+            BusinessDayIndex: The index, backed by the mapped file.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            ValueError: If the file is not a valid index file.
+        """
+        path = Path(path)
+        invalid = ValueError(f"Invalid business-day index file: '{path.as_posix()}'.")
+        with open(path, "rb") as file:
+            if os.fstat(file.fileno()).st_size < _HEADER.size:
+                raise invalid
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            magic, version, first, day_count, base, business_count, holiday_count, weekmask, name_length = _HEADER.unpack_from(buffer)
+            name_size = -(-name_length // 4) * 4
+            expected_size = _HEADER.size + name_size + 4 * (holiday_count + day_count + 1 + business_count)
+            if magic != _MAGIC or version != _VERSION or len(buffer) != expected_size or not 0 < weekmask < 0b10000000:
+                raise invalid
+            name = buffer[_HEADER.size:_HEADER.size + name_length].decode("utf-8")
+        except (struct.error, ValueError):  # a bad header, or a name that is not UTF-8
+            buffer.close()
+            raise invalid from None
+
+        offset = _HEADER.size + name_size
+        holidays = _int32_view(buffer, offset, holiday_count)
+        offset += 4 * holiday_count
+        cumulative = _int32_view(buffer, offset, day_count + 1)
+        offset += 4 * (day_count + 1)
+        business = _int32_view(buffer, offset, business_count)
+
+        calendar = BusinessCalendar((date.fromordinal(o) for o in holidays), name=name, weekmask=weekmask)
+        return cls(calendar, first, base, cumulative, business, path)
+
+    @classmethod
+    def load_or_build(
+            cls,
+            path: StrOrPath,
+            calendar: BusinessCalendar = DEFAULT_CALENDAR,
+            first_date: date = date(1900, 1, 1),
+            last_date: date = date(2200, 12, 31)
+        ) -> "BusinessDayIndex":
+        """
+        Load the index saved at `path`, or build and save it when the file is missing,
+        invalid, built from other holidays (weekend holidays included) or does not cover the requested range.
+
+        Args:
+            path (StrOrPath): The index file.
+            calendar (BusinessCalendar, optional): The calendar to index.
+            first_date (date, optional): The first date the index must cover.
+            last_date (date, optional): The last date the index must cover.
+
+        Returns:
+            BusinessDayIndex: The memory-mapped index.
+        """
+        try:
+            index = cls.load(path)
+            if (index.calendar == calendar
+                    and index.calendar.all_holiday_ordinals == calendar.all_holiday_ordinals
+                    and index.first_date <= first_date and last_date <= index.last_date):
+                return index
+        except (FileNotFoundError, ValueError):
+            pass
+        cls.build(calendar, first_date, last_date).save(path)
+        return cls.load(path)
+
+    def save(self, path: StrOrPath) -> None:
+        """
+        Write the index to a flat binary file that `load` can memory-map.
+
+        The file is written next to its destination and then renamed over it,
+        so processes loading it concurrently never see a partial file.
+
+        Args:
+            path (StrOrPath): The destination file.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        holidays = array("i", self._calendar.all_holiday_ordinals)
+        name = self._calendar.name.encode("utf-8")
+        header = _HEADER.pack(
+            _MAGIC, _VERSION, self._first, self.day_count, self._base,
+            len(self._business), len(holidays), self._calendar.weekmask, len(name),
+        )
+        temporary = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(temporary, "wb") as file:
+            file.write(header)
+            file.write(name.ljust(-(-len(name) // 4) * 4, b"\0"))
+            for values in (holidays, array("i", self._cumulative), array("i", self._business)):
+                file.write(_to_little_endian(values))
+        os.replace(temporary, path)
+
+    @property
+    def calendar(self) -> BusinessCalendar:
+        """The calendar the index was built from."""
+        return self._calendar
+
+    @property
+    def weekmask(self) -> int:
+        """The integer weekmask of the indexed calendar."""
+        return self._calendar.weekmask
+
+    @property
+    def first_date(self) -> date:
+        """The first date covered by the index."""
+        return date.fromordinal(self._first)
+
+    @property
+    def last_date(self) -> date:
+        """The last date covered by the index."""
+        return date.fromordinal(self._first + self.day_count - 1)
+
+    @property
+    def first_ordinal(self) -> int:
+        """The ordinal of the first date covered by the index."""
+        return self._first
+
+    @property
+    def day_count(self) -> int:
+        """The number of dates covered by the index."""
+        return len(self._cumulative) - 1
+
+    @property
+    def base(self) -> int:
+        """The business days of the calendar before the first date."""
+        return self._base
+
+    @property
+    def cumulative_counts(self) -> Int32Buffer:
+        """Business days before each date of the range (and the day after it), relative to `base`."""
+        return self._cumulative
+
+    @property
+    def business_positions(self) -> Int32Buffer:
+        """The position of each business day of the range, counted from the first date."""
+        return self._business
+
+    def with_weekmask(self, weekmask: Weekmask) -> BaseBusinessCalendar:
+        """
+        Return this index when `weekmask` is the indexed one, otherwise the source
+        calendar with the other weekmask (without the index lookups).
+
+        Args:
+            weekmask (Weekmask): The working days of the week.
+
+        Returns:
+            BaseBusinessCalendar: A calendar with the given weekmask.
+        """
+        if parse_weekmask(weekmask) == self.weekmask:
+            return self
+        return self._calendar.with_weekmask(weekmask)
+
+    def business_days_before(self, ordinal: int) -> int:
+        """
+        Count the business days before the given ordinal, starting from ordinal 1.
+
+        Args:
+            ordinal (int): A proleptic Gregorian ordinal.
+
+        Returns:
+            int: The number of business days with a smaller ordinal.
+        """
+        position = ordinal - self._first
+        if 0 <= position < len(self._cumulative):
+            return self._base + self._cumulative[position]
+        return self._calendar.business_days_before(ordinal)
+
+    def nth_business_day(self, index: int) -> int:
+        """
+        Return the ordinal of the business day preceded by exactly `index` business days.
+
+        Args:
+            index (int): The zero-based business-day number.
+
+        Returns:
+            int: The ordinal of that business day.
+        """
+        position = index - self._base
+        if 0 <= position < len(self._business):
+            return self._first + self._business[position]
+        return self._calendar.nth_business_day(index)
+
+    def is_business_day(self, day: date) -> bool:
+        """
+        Check whether a date is a business day in the indexed calendar.
+
+        Args:
+            day (date): The date to check.
+
+        Returns:
+            bool: True for a business day.
+        """
+        position = day.toordinal() - self._first
+        if 0 <= position < len(self._cumulative) - 1:
+            return self._cumulative[position + 1] != self._cumulative[position]
+        return self._calendar.is_business_day(day)
+
+
+__all__ = ['BusinessDayIndex']
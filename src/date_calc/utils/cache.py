@@ -0,0 +1,206 @@
+"""
+This module provides an opt-in memoization layer for the calendar methods of `DateCalculator`:
+a thread-safe, bounded LRU cache with hit, miss and eviction counters, and the
+CachedDateCalculator front that uses it.
+"""
+
+from collections import OrderedDict
+from datetime import date
+from threading import Lock
+from typing import Any, Callable, Generic, Hashable, Literal, NamedTuple, TypeVar
+
+from date_calc.utils.business_calendar import BaseBusinessCalendar, DEFAULT_CALENDAR, Weekmask, parse_weekmask
+from date_calc.utils.date_calculator import DateCalculator, PositiveOrNegativeInt
+
+V = TypeVar("V")
+D = TypeVar("D")
+
+_MISSING: Any = object()
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of an `LRUCache`."""
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+    @property
+    def hit_ratio(self) -> float:
+        """The fraction of lookups answered from the cache (0.0 before the first lookup)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class LRUCache(Generic[V]):
+    """
+    A bounded mapping that evicts the least recently used entry when full.
+
+    All operations take an internal lock, so one instance can be shared between threads.
+    Values are computed outside of the lock: two threads missing the same key at the
+    same time may both compute it, and the last one stored wins.
+
+    Args:
+        maxsize (int, optional): The maximum number of entries. Defaults to 4096.
+
+    Raises:
+        ValueError: If `maxsize` is not positive.
+    """
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        if maxsize <= 0:
+            raise ValueError(f"The cache size must be positive, got {maxsize}.")
+        self._maxsize = maxsize
+        self._data: OrderedDict[Hashable, V] = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable, default: D = None) -> V | D:  # type: ignore[assignment]
+        """
+        Return the value cached for `key`, marking it as the most recently used, or `default`.
+        Counts a hit or a miss.
+
+        Args:
+            key (Hashable): The cache key.
+            default (optional): Returned when `key` is not cached. Defaults to None.
+
+        Returns:
+            The cached value, or `default`.
+        """
+        # acquire/release rather than `with`: this is the hit path, and it is cheaper
+        self._lock.acquire()
+        try:
+            value = self._data.get(key, _MISSING)
+            if value is _MISSING:
+                self._misses += 1
+                return default
+            self._data.move_to_end(key)
+            self._hits += 1
+            return value
+        finally:
+            self._lock.release()
+
+    def put(self, key: Hashable, value: V) -> None:
+        """
+        Store `value` for `key` as the most recently used entry, evicting the least recently used one when full.
+
+        Args:
+            key (Hashable): The cache key.
+            value (V): The value.
+        """
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+                self._evictions += 1
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], V]) -> V:
+        """
+        Return the value cached for `key`, computing and storing it on a miss.
+
+        Args:
+            key (Hashable): The cache key.
+            compute (Callable[[], V]): Computes the value on a miss.
+
+        Returns:
+            V: The cached or computed value.
+        """
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def info(self) -> CacheInfo:
+        """Return the hit, miss and eviction counters and the current size."""
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._evictions, self._maxsize, len(self._data))
+
+    def clear(self) -> None:
+        """Remove every entry and reset the counters."""
+        with self._lock:
+            self._data.clear()
+            self._hits = self._misses = self._evictions = 0
+
+
+class CachedDateCalculator:
+    """
+    `DateCalculator` calendar methods behind a shared LRU cache.
+
+    Useful when the same (start, end, calendar) queries repeat, e.g. monthly reports
+    computed for every account. Results are identical to the `DateCalculator` methods;
+    calendars are part of the key, so one instance can serve several calendars.
+
+    Args:
+        maxsize (int, optional): The maximum number of cached results. Defaults to 4096.
+
+    Example:
+        >>> calculator = CachedDateCalculator(maxsize=10_000)
+        >>> calculator.business_days(initial_date=date(2025, 1, 1), final_date=date(2025, 2, 1))
+        23
+        >>> calculator.cache_info().misses
+        1
+    """
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        self._cache: LRUCache[int | date] = LRUCache(maxsize)
+
+    def business_days(
+            self,
+            *,
+            initial_date: date,
+            final_date: date,
+            calendar: BaseBusinessCalendar = DEFAULT_CALENDAR,
+            weekmask: Weekmask | None = None
+        ) -> int:
+        """Cached `DateCalculator.business_days`."""
+        mask = None if weekmask is None else parse_weekmask(weekmask)
+        key = ("business_days", initial_date, final_date, calendar, mask)
+        # get/put rather than get_or_compute: no closure is created on a hit
+        result = self._cache.get(key, _MISSING)
+        if result is _MISSING:
+            result = DateCalculator.business_days(
+                initial_date=initial_date, final_date=final_date, calendar=calendar, weekmask=mask
+            )
+            self._cache.put(key, result)
+        return result  # type: ignore[return-value]
+
+    def new_date_with_interval_of_days(
+            self,
+            *,
+            initial_date: date,
+            interval: PositiveOrNegativeInt,
+            type_of_days: Literal["business", "consecutive"],
+            calendar: BaseBusinessCalendar = DEFAULT_CALENDAR,
+            weekmask: Weekmask | None = None
+        ) -> date:
+        """Cached `DateCalculator.new_date_with_interval_of_days`."""
+        mask = None if weekmask is None else parse_weekmask(weekmask)
+        key = ("new_date_with_interval_of_days", initial_date, interval, type_of_days, calendar, mask)
+        result = self._cache.get(key, _MISSING)
+        if result is _MISSING:
+            result = DateCalculator.new_date_with_interval_of_days(
+                initial_date=initial_date, interval=interval, type_of_days=type_of_days,
+                calendar=calendar, weekmask=mask,
+            )
+            self._cache.put(key, result)
+        return result  # type: ignore[return-value]
+
+    def cache_info(self) -> CacheInfo:
+        """Return the hit, miss and eviction counters of the cache."""
+        return self._cache.info()
+
+    def cache_clear(self) -> None:
+        """Empty the cache and reset its counters."""
+        self._cache.clear()
+
+
+__all__ = ['CacheInfo', 'LRUCache', 'CachedDateCalculator']
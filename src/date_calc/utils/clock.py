@@ -0,0 +1,103 @@
+"""
+This module provides the clock of the application: the current date and time in the
+configured time zone (the `TIMEZONE` setting, "America/Recife" by default) rather than in
+the time zone of the host, so that "today" is the same wherever the program runs.
+
+`ZoneInfo` objects are created once per name and shared (`get_zone`); an unknown name is an
+error, with no fallback to other time zone databases. `date_calc.utils.vectorized.local_dates`
+converts whole arrays of UTC timestamps to local dates with the same zones.
+"""
+
+import logging
+import time
+from datetime import date, datetime, timezone, tzinfo
+from functools import lru_cache
+from typing import Callable
+
+DEFAULT_TIMEZONE: str = "America/Recife"
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=64)
+def get_zone(name: str) -> tzinfo:
+    """
+    The time zone of an IANA name, e.g. "America/Recife"; cached.
+
+    Args:
+        name (str): The name of the time zone, or "UTC".
+
+    Returns:
+        tzinfo: The time zone.
+
+    Raises:
+        ValueError: If the name is not a known time zone.
+    """
+    if name.upper() == "UTC":
+        return timezone.utc
+    import zoneinfo
+    try:
+        return zoneinfo.ZoneInfo(name)
+    except (zoneinfo.ZoneInfoNotFoundError, ValueError) as e:
+        raise ValueError(f"Invalid timezone: '{name}'.") from e
+
+
+class Clock:
+    """
+    The current date and time in a time zone.
+
+    Args:
+        zone (str | tzinfo, optional): The time zone, or its name. Defaults to "America/Recife".
+        time_source (Callable[[], float], optional): The current UTC time, in seconds since
+            the epoch. Defaults to `time.time`; tests may pass a fixed time.
+
+    Raises:
+        ValueError: If `zone` is not a known time zone.
+
+    Example:
+        >>> Clock("America/Recife", time_source=lambda: 1760659200.0).today()  # 2025-10-17 00:00 UTC
+        datetime.date(2025, 10, 16)
+    """
+
+    __slots__ = ("zone", "_time")
+
+    def __init__(self, zone: str | tzinfo = DEFAULT_TIMEZONE, time_source: Callable[[], float] = time.time) -> None:
+        self.zone: tzinfo = get_zone(zone) if isinstance(zone, str) else zone
+        self._time = time_source
+
+    def now(self) -> datetime:
+        """The current time, as an aware datetime in the clock's time zone."""
+        return datetime.fromtimestamp(self._time(), self.zone)
+
+    def today(self) -> date:
+        """The current date in the clock's time zone."""
+        return self.now().date()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({str(self.zone)!r})"
+
+
+@lru_cache(maxsize=1)
+def default_clock() -> Clock:
+    """
+    The clock of the `TIMEZONE` setting, created on first use.
+
+    The settings are loaded quietly: when they cannot be loaded the default time zone is used,
+    without a traceback, and the failure is recorded in the settings snapshot so that later
+    processes do not load them again. The time zone of the host is used when the time zone
+    database has no entry for the setting.
+    """
+    name = DEFAULT_TIMEZONE
+    try:
+        from date_calc.config import get_settings
+        name = get_settings(quiet=True).get("TIMEZONE") or DEFAULT_TIMEZONE
+    except Exception:  # dynaconf missing, or invalid settings
+        pass
+    try:
+        return Clock(name)
+    except ValueError as e:
+        logger.warning("%s Using the timezone of the host.", e)
+        return Clock(datetime.now().astimezone().tzinfo or timezone.utc)
+
+
+__all__ = ['Clock', 'DEFAULT_TIMEZONE', 'default_clock', 'get_zone']
@@ -3,11 +3,29 @@ This module provides a specialized class, for the purposes of this application,
 that inherits(?)/encapsulates(?) functionality from datetime.datetime, the native library.
 """
 
-from datetime import date, datetime, timedelta
-from typing import TypeAlias, Literal
+from datetime import date, datetime, timedelta, tzinfo
+from itertools import islice
+from typing import TYPE_CHECKING, Iterator, TypeAlias, Literal
+
+from date_calc.utils.business_calendar import BaseBusinessCalendar, DEFAULT_CALENDAR, RollConvention, Weekmask
+from date_calc.utils.date_column import DateColumn
+
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike, NDArray
+    from date_calc.utils.clock import Clock
 
 PositiveOrNegativeInt: TypeAlias = int
 
+_MONTH_DAYS: tuple[int, ...] = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _days_in_month(year: int, month: int) -> int:
+    """The number of days of a month (`calendar.monthrange` without importing `calendar`)."""
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        return 29
+    return _MONTH_DAYS[month - 1]
+
+
 class DateCalculator:
     """
     A class to perform date calculations.
@@ -43,37 +61,55 @@ class DateCalculator:
         return (end_date - start_date).days
 
     @staticmethod
-    def days_until(date: date) -> int:
+    def days_until(date: date, clock: "Clock | None" = None) -> int:
         """
         Calculate the number of days until a given date.
 
         Args:
             date (date): The target date.
+            clock (Clock, optional): The clock giving today's date. Defaults to `default_clock()`,
+                in the time zone of the `TIMEZONE` setting.
 
         Returns:
             int: The number of days until the target date.
         """
-        today = date.today()
+        if clock is None:
+            from date_calc.utils.clock import default_clock
+            clock = default_clock()
+        today = clock.today()
         return (date - today).days
     
     @staticmethod
-    def business_days(*, initial_date: date, final_date: date) -> int:
+    def business_days(
+            *,
+            initial_date: date,
+            final_date: date,
+            calendar: BaseBusinessCalendar = DEFAULT_CALENDAR,
+            weekmask: Weekmask | None = None
+        ) -> int:
         """
-        Calculate the number of business days until a given date.
+        Calculate the number of business days from `initial_date`
+        up to, but not including, `final_date`.
+
+        The count is taken from the calendar's precomputed index (whole weeks plus a
+        remainder, minus the holidays found by bisection), so the cost does not depend
+        on the span.
 
         Args:
-            date (date): The target date.
+            initial_date (date): The starting date (inclusive).
+            final_date (date): The ending date (exclusive).
+            calendar (BaseBusinessCalendar, optional): The business-day calendar.
+                Defaults to Monday to Friday without holidays.
+            weekmask (Weekmask, optional): Working days of the week for this calculation only,
+                overriding the calendar's (e.g. "Sun Mon Tue Wed Thu" or "1111110").
 
         Returns:
-            int: The number of business days until the target date.
+            int: The number of business days in the range, or 0 when
+                `initial_date` is not before `final_date`.
         """
-
-        business_days = 0
-        while initial_date < final_date:
-            if initial_date.weekday() < 5:  # Monday to Friday are business days
-                business_days += 1
-            initial_date += timedelta(days=1)
-        return business_days
+        if weekmask is not None:
+            calendar = calendar.with_weekmask(weekmask)
+        return calendar.business_days_between(initial_date, final_date)
 
     @staticmethod
     def consecutive_days(*, initial_date: date, final_date: date) -> int:
@@ -96,36 +132,403 @@ class DateCalculator:
             *,
             initial_date: date,
             interval: PositiveOrNegativeInt,
-            type_of_days: Literal["business", "consecutive"]
+            type_of_days: Literal["business", "consecutive"],
+            calendar: BaseBusinessCalendar = DEFAULT_CALENDAR,
+            weekmask: Weekmask | None = None
         ) -> date:
         """
         Calculate the date after adding a certain number of business days to an initial date.
 
+        Business-day offsets are computed arithmetically from the calendar's index, so the
+        cost does not depend on the size of `interval`. A start on a non-business day is
+        first normalised to the business day before it (moving forward) or after it
+        (moving backward); a Sunday start also costs one extra step, as it always has.
+
         Args:
             initial_date (date): The starting date.
             interval (int): The number of business days to add.
             type_of_days (str): The type of days to consider ("business" or "consecutive").
+            calendar (BaseBusinessCalendar, optional): The business-day calendar used for
+                "business" days. Defaults to Monday to Friday without holidays.
+            weekmask (Weekmask, optional): Working days of the week for this calculation only,
+                overriding the calendar's (e.g. "Sun Mon Tue Wed Thu" or "1111110").
 
         Returns:
             date: The new date after adding the business days.
         """
-        current_date = initial_date
-        days_added = 0
-        step = 1 if interval > 0 else -1
-        
         if type_of_days == "consecutive":
-            return current_date + timedelta(days=interval)
-        
-        # import pdb; pdb.set_trace()
-        while days_added < abs(interval):
-            if current_date.weekday() <= 5:  # Monday to Friday are business days
-                days_added += 1
-            current_date += timedelta(days=step)
-            
-            while current_date.weekday() >= 5:  # Skip weekends
-                current_date += timedelta(days=step)
-        return current_date
+            return initial_date + timedelta(days=interval)
+
+        if weekmask is not None:
+            calendar = calendar.with_weekmask(weekmask)
+        return calendar.add_business_days(initial_date, interval)
     
+    @staticmethod
+    def add_months(
+            initial_date: date,
+            months: PositiveOrNegativeInt,
+            *,
+            roll: RollConvention | None = None,
+            end_of_month: bool = False,
+            calendar: BaseBusinessCalendar = DEFAULT_CALENDAR
+        ) -> date:
+        """
+        Add a number of calendar months to a date, optionally rolling the result to a business day.
+
+        The day of the month is kept and clamped to the length of the target month
+        (31-01 + 1 month is 28-02 or 29-02). With `end_of_month`, a date on the last day
+        of its month moves to the last day of the target month (28-02 + 1 month is 31-03).
+        The month is computed arithmetically and the roll from the calendar's business-day
+        numbers, so the cost does not depend on `months`.
+
+        Args:
+            initial_date (date): The starting date.
+            months (int): The number of months to add (negative to subtract).
+            roll (RollConvention, optional): How to adjust a result that is not a business day:
+                "following", "modified_following", "preceding" or "modified_preceding".
+                Defaults to no adjustment.
+            end_of_month (bool, optional): Keep month-end dates on the month end. Defaults to False.
+            calendar (BaseBusinessCalendar, optional): The business-day calendar used by `roll`.
+
+        Returns:
+            date: The new date, of the same type as `initial_date`.
+
+        Raises:
+            ValueError: If the result is out of the supported range of years or `roll` is unknown.
+        """
+        year, month = divmod(initial_date.year * 12 + initial_date.month - 1 + months, 12)
+        if not 1 <= year <= 9999:
+            raise ValueError(f"Year {year} is out of range.")
+        last_day = _days_in_month(year, month + 1)
+        if end_of_month and initial_date.day == _days_in_month(initial_date.year, initial_date.month):
+            day = last_day
+        else:
+            day = min(initial_date.day, last_day)
+
+        # arithmetic rather than `replace`, so any date type with `toordinal` and timedelta addition (e.g. OrdinalDate) works
+        result = initial_date + timedelta(days=date(year, month + 1, day).toordinal() - initial_date.toordinal())
+        return result if roll is None else calendar.roll(result, roll)
+
+    @staticmethod
+    def add_years(
+            initial_date: date,
+            years: PositiveOrNegativeInt,
+            *,
+            roll: RollConvention | None = None,
+            end_of_month: bool = False,
+            calendar: BaseBusinessCalendar = DEFAULT_CALENDAR
+        ) -> date:
+        """
+        Add a number of years to a date; see `add_months` (29-02 + 1 year is 28-02).
+
+        Args:
+            initial_date (date): The starting date.
+            years (int): The number of years to add (negative to subtract).
+            roll (RollConvention, optional): How to adjust a result that is not a business day.
+            end_of_month (bool, optional): Keep month-end dates on the month end. Defaults to False.
+            calendar (BaseBusinessCalendar, optional): The business-day calendar used by `roll`.
+
+        Returns:
+            date: The new date, of the same type as `initial_date`.
+        """
+        return DateCalculator.add_months(
+            initial_date, 12 * years, roll=roll, end_of_month=end_of_month, calendar=calendar
+        )
+
+    @staticmethod
+    def iter_business_days(
+            initial_date: date,
+            final_date: date,
+            step: int = 1,
+            *,
+            calendar: BaseBusinessCalendar = DEFAULT_CALENDAR
+        ) -> Iterator[date]:
+        """
+        Lazily yield the business days between two dates.
+
+        The dates are located from their business-day numbers, jumping directly over
+        weekends and holidays: memory use is constant and the cost grows with the number
+        of dates produced, not with the span.
+
+        Args:
+            initial_date (date): The starting date (inclusive).
+            final_date (date): The ending date (exclusive).
+            step (int, optional): Yield every `step`-th business day; a negative step walks
+                backward from `initial_date` down to `final_date`, as with `range`. Defaults to 1.
+            calendar (BaseBusinessCalendar, optional): The business-day calendar.
+
+        Yields:
+            date: The business days, in order.
+
+        Raises:
+            ValueError: If `step` is zero.
+        """
+        numbers = calendar.business_day_numbers(initial_date, final_date, step)
+        nth_business_day = calendar.nth_business_day
+        return (date.fromordinal(nth_business_day(n)) for n in numbers)
+
+    @staticmethod
+    def iter_business_day_chunks(
+            initial_date: date,
+            final_date: date,
+            size: int,
+            step: int = 1,
+            *,
+            calendar: BaseBusinessCalendar = DEFAULT_CALENDAR
+        ) -> Iterator[DateColumn]:
+        """
+        Lazily yield the business days between two dates in chunks of `size` dates, as
+        `DateColumn` arrays, so that no `date` object is created; see `iter_business_days`.
+
+        Args:
+            initial_date (date): The starting date (inclusive).
+            final_date (date): The ending date (exclusive).
+            size (int): The number of dates per chunk; the last chunk may be shorter.
+            step (int, optional): Take every `step`-th business day. Defaults to 1.
+            calendar (BaseBusinessCalendar, optional): The business-day calendar.
+
+        Yields:
+            DateColumn: The next chunk of business days.
+
+        Raises:
+            ValueError: If `size` is not positive or `step` is zero.
+        """
+        if size <= 0:
+            raise ValueError(f"The chunk size must be positive, got {size}.")
+        ordinals = map(calendar.nth_business_day, calendar.business_day_numbers(initial_date, final_date, step))
+        return iter(lambda: DateColumn(islice(ordinals, size)), DateColumn())
+
+    # Batch variants: NumPy arrays of dates (datetime64 or integer ordinals) or a DateColumn,
+    # see `date_calc.utils.vectorized`.
+
+    @staticmethod
+    def add_days_batch(start_dates: "ArrayLike", days: "ArrayLike") -> "NDArray":
+        """
+        Add a number of days to each date of an array.
+
+        Args:
+            start_dates (ArrayLike): `datetime64` dates, integer ordinals or a `DateColumn`.
+            days (ArrayLike): The number of days to add, broadcast against `start_dates`.
+
+        Returns:
+            NDArray: The new dates, in the same representation as `start_dates`.
+        """
+        from date_calc.utils import vectorized
+        return vectorized.add_days(start_dates, days)
+
+    @staticmethod
+    def local_dates_batch(timestamps: "ArrayLike", zone: "str | tzinfo | None" = None, unit: str = "s") -> "NDArray":
+        """
+        Convert UTC timestamps to the dates they fall on in a time zone.
+
+        Args:
+            timestamps (ArrayLike): Numbers of `unit`s since the epoch, or `datetime64` values in UTC.
+            zone (str | tzinfo, optional): The time zone. Defaults to the zone of `default_clock()`.
+            unit (str, optional): "s", "ms", "us" or "ns", for numeric timestamps. Defaults to "s".
+
+        Returns:
+            NDArray: The local dates (`datetime64[D]`), ready for the other batch methods.
+        """
+        from date_calc.utils import vectorized
+        return vectorized.local_dates(timestamps, zone, unit)  # type: ignore[arg-type]
+
+    @staticmethod
+    def date_difference_batch(start_dates: "ArrayLike", end_dates: "ArrayLike") -> "NDArray":
+        """
+        Calculate the difference in days between two arrays of dates, element by element.
+
+        Args:
+            start_dates (ArrayLike): `datetime64` dates, integer ordinals or a `DateColumn`.
+            end_dates (ArrayLike): `datetime64` dates or integer ordinals.
+
+        Returns:
+            NDArray: The number of days between each pair of dates (int64).
+        """
+        from date_calc.utils import vectorized
+        return vectorized.date_difference(start_dates, end_dates)
+
+    @staticmethod
+    def business_days_batch(
+            *,
+            initial_dates: "ArrayLike",
+            final_dates: "ArrayLike",
+            calendar: BaseBusinessCalendar = DEFAULT_CALENDAR,
+            weekmask: Weekmask | None = None
+        ) -> "NDArray":
+        """
+        Calculate the number of business days of each range, element by element.
+
+        Args:
+            initial_dates (ArrayLike): The starting dates (inclusive).
+            final_dates (ArrayLike): The ending dates (exclusive).
+            calendar (BaseBusinessCalendar, optional): The business-day calendar.
+            weekmask (Weekmask, optional): Working days of the week for this calculation only,
+                overriding the calendar's (e.g. "Sun Mon Tue Wed Thu" or "1111110").
+
+        Returns:
+            NDArray: The number of business days of each range (int64).
+        """
+        from date_calc.utils import vectorized
+        if weekmask is not None:
+            calendar = calendar.with_weekmask(weekmask)
+        return vectorized.business_days(initial_dates, final_dates, calendar)
+
+    @staticmethod
+    def new_date_with_interval_of_days_batch(
+            *,
+            initial_dates: "ArrayLike",
+            intervals: "ArrayLike",
+            type_of_days: Literal["business", "consecutive"],
+            calendar: BaseBusinessCalendar = DEFAULT_CALENDAR,
+            weekmask: Weekmask | None = None
+        ) -> "NDArray":
+        """
+        Calculate the date after adding an interval of days to each date of an array.
+
+        Args:
+            initial_dates (ArrayLike): `datetime64` dates, integer ordinals or a `DateColumn`.
+            intervals (ArrayLike): The number of days to add, broadcast against `initial_dates`.
+            type_of_days (str): The type of days to consider ("business" or "consecutive").
+            calendar (BaseBusinessCalendar, optional): The business-day calendar used for "business" days.
+            weekmask (Weekmask, optional): Working days of the week for this calculation only,
+                overriding the calendar's (e.g. "Sun Mon Tue Wed Thu" or "1111110").
+
+        Returns:
+            NDArray: The new dates, in the same representation as `initial_dates`.
+        """
+        from date_calc.utils import vectorized
+        if weekmask is not None:
+            calendar = calendar.with_weekmask(weekmask)
+        return vectorized.new_date_with_interval_of_days(initial_dates, intervals, type_of_days, calendar)
+
+    @staticmethod
+    def add_months_batch(
+            start_dates: "ArrayLike",
+            months: "ArrayLike",
+            *,
+            roll: RollConvention | None = None,
+            end_of_month: bool = False,
+            calendar: BaseBusinessCalendar = DEFAULT_CALENDAR
+        ) -> "NDArray":
+        """
+        Add a number of months to each date of an array; see `add_months`.
+
+        A whole schedule is one call: a single start date with `months=numpy.arange(1, 361)`
+        gives 30 years of monthly payment dates, rolled to business days.
+
+        Args:
+            start_dates (ArrayLike): `datetime64` dates, integer ordinals or a `DateColumn`.
+            months (ArrayLike): The number of months to add, broadcast against `start_dates`.
+            roll (RollConvention, optional): How to adjust results that are not business days.
+            end_of_month (bool, optional): Keep month-end dates on the month end. Defaults to False.
+            calendar (BaseBusinessCalendar, optional): The business-day calendar used by `roll`.
+
+        Returns:
+            NDArray: The new dates, in the same representation as `start_dates`.
+        """
+        from date_calc.utils import vectorized
+        return vectorized.add_months(start_dates, months, roll, end_of_month, calendar)
+
+    @staticmethod
+    def add_years_batch(
+            start_dates: "ArrayLike",
+            years: "ArrayLike",
+            *,
+            roll: RollConvention | None = None,
+            end_of_month: bool = False,
+            calendar: BaseBusinessCalendar = DEFAULT_CALENDAR
+        ) -> "NDArray":
+        """
+        Add a number of years to each date of an array; see `add_months_batch`.
+
+        Args:
+            start_dates (ArrayLike): `datetime64` dates, integer ordinals or a `DateColumn`.
+            years (ArrayLike): The number of years to add, broadcast against `start_dates`.
+            roll (RollConvention, optional): How to adjust results that are not business days.
+            end_of_month (bool, optional): Keep month-end dates on the month end. Defaults to False.
+            calendar (BaseBusinessCalendar, optional): The business-day calendar used by `roll`.
+
+        Returns:
+            NDArray: The new dates, in the same representation as `start_dates`.
+        """
+        from date_calc.utils import vectorized
+        import numpy as np
+        return vectorized.add_months(start_dates, 12 * np.asarray(years), roll, end_of_month, calendar)
+
+    @staticmethod
+    def difference_matrix(
+            start_dates: "ArrayLike",
+            end_dates: "ArrayLike",
+            type_of_days: Literal["business", "consecutive"] = "consecutive",
+            *,
+            calendar: BaseBusinessCalendar = DEFAULT_CALENDAR,
+            weekmask: Weekmask | None = None
+        ) -> "NDArray":
+        """
+        Calculate the difference between every start date and every end date, e.g. invoice
+        dates against payment dates.
+
+        `result[i, j]` is `date_difference(start_dates[i], end_dates[j])` for "consecutive"
+        days, `business_days(initial_date=start_dates[i], final_date=end_dates[j])` for
+        "business" days. The whole matrix is computed with broadcast arithmetic; for large
+        N x M, `iter_difference_matrix` yields it by blocks of rows.
+
+        Args:
+            start_dates (ArrayLike): The N starting dates: `datetime64`, integer ordinals or a `DateColumn`.
+            end_dates (ArrayLike): The M ending dates.
+            type_of_days (str, optional): "consecutive" or "business". Defaults to "consecutive".
+            calendar (BaseBusinessCalendar, optional): The business-day calendar used for "business" days.
+            weekmask (Weekmask, optional): Working days of the week for this calculation only,
+                overriding the calendar's (e.g. "Sun Mon Tue Wed Thu" or "1111110").
+
+        Returns:
+            NDArray: The N x M matrix of differences (int64).
+
+        Raises:
+            ValueError: If `type_of_days` is invalid.
+        """
+        from date_calc.utils import vectorized
+        if type_of_days == "business":
+            if weekmask is not None:
+                calendar = calendar.with_weekmask(weekmask)
+            return vectorized.business_days_matrix(start_dates, end_dates, calendar)
+        if type_of_days == "consecutive":
+            return vectorized.date_difference_matrix(start_dates, end_dates)
+        raise ValueError(f"Invalid type of days: '{type_of_days}'. Use 'consecutive' or 'business'.")
+
+    @staticmethod
+    def iter_difference_matrix(
+            start_dates: "ArrayLike",
+            end_dates: "ArrayLike",
+            type_of_days: Literal["business", "consecutive"] = "consecutive",
+            *,
+            block_rows: int = 1024,
+            calendar: BaseBusinessCalendar = DEFAULT_CALENDAR,
+            weekmask: Weekmask | None = None
+        ) -> Iterator["NDArray"]:
+        """
+        Lazily yield the rows of `difference_matrix` in blocks of `block_rows` rows, so that
+        memory use depends on M and the block size, not on N x M.
+
+        Args:
+            start_dates (ArrayLike): The N starting dates.
+            end_dates (ArrayLike): The M ending dates.
+            type_of_days (str, optional): "consecutive" or "business". Defaults to "consecutive".
+            block_rows (int, optional): The number of rows per block. Defaults to 1024.
+            calendar (BaseBusinessCalendar, optional): The business-day calendar used for "business" days.
+            weekmask (Weekmask, optional): Working days of the week for this calculation only.
+
+        Yields:
+            NDArray: The next block of rows, of shape (<= block_rows, M).
+
+        Raises:
+            ValueError: If `type_of_days` is invalid or `block_rows` is not positive.
+        """
+        from date_calc.utils import vectorized
+        if weekmask is not None:
+            calendar = calendar.with_weekmask(weekmask)
+        return vectorized.iter_difference_matrix(start_dates, end_dates, type_of_days, calendar, block_rows)
+
 if __name__ == "__main__":
 
     initial_date, interval, expected_date = (datetime(2025, 10, 6).date(), 25, datetime(2025, 11, 10).date())
@@ -0,0 +1,242 @@
+"""
+This module provides DateColumn, a compact column of dates stored as an `array` of int32
+proleptic Gregorian ordinals (4 bytes per date, against ~32 bytes for each `date` object
+plus its list slot), and OrdinalDate, the `__slots__` view returned for a single element.
+
+`OrdinalDate` implements the part of the `date` API that `DateCalculator` relies on
+(`toordinal`, `weekday`, comparisons and `timedelta` arithmetic), so the scalar methods
+accept it directly; the `*_batch` methods accept a whole `DateColumn`, read through its
+buffer, and return date results as a `DateColumn`.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+from array import array
+from typing import Iterable, Iterator, Protocol, Sequence, overload
+
+
+class SupportsToOrdinal(Protocol):
+    """Anything with a proleptic Gregorian ordinal, such as `date` or `OrdinalDate`."""
+
+    def toordinal(self) -> int: ...
+
+
+def _comparable_ordinal(other: object) -> int | None:
+    """The ordinal of a date operand (`OrdinalDate` or `date`, not `datetime`), else None."""
+    if isinstance(other, OrdinalDate):
+        return other._ordinal
+    if isinstance(other, dt.date) and not isinstance(other, dt.datetime):
+        return other.toordinal()
+    return None
+
+
+class OrdinalDate:
+    """
+    A lightweight, immutable date held as a proleptic Gregorian ordinal.
+
+    Args:
+        ordinal (int): The ordinal of the date (`date.toordinal()`).
+    """
+
+    __slots__ = ("_ordinal",)
+
+    def __init__(self, ordinal: int) -> None:
+        self._ordinal = ordinal
+
+    @classmethod
+    def from_date(cls, value: SupportsToOrdinal) -> OrdinalDate:
+        """Create a view of a `date` (or of anything with `toordinal`)."""
+        return cls(value.toordinal())
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.isoformat()!r})"
+
+    def __hash__(self) -> int:
+        # equal to an equal `date`, so both can share the keys of a dict or set
+        return hash(self.date())
+
+    def __eq__(self, other: object) -> bool:
+        ordinal = _comparable_ordinal(other)
+        return NotImplemented if ordinal is None else self._ordinal == ordinal
+
+    def __lt__(self, other: SupportsToOrdinal) -> bool:
+        ordinal = _comparable_ordinal(other)
+        return NotImplemented if ordinal is None else self._ordinal < ordinal
+
+    def __le__(self, other: SupportsToOrdinal) -> bool:
+        ordinal = _comparable_ordinal(other)
+        return NotImplemented if ordinal is None else self._ordinal <= ordinal
+
+    def __gt__(self, other: SupportsToOrdinal) -> bool:
+        ordinal = _comparable_ordinal(other)
+        return NotImplemented if ordinal is None else self._ordinal > ordinal
+
+    def __ge__(self, other: SupportsToOrdinal) -> bool:
+        ordinal = _comparable_ordinal(other)
+        return NotImplemented if ordinal is None else self._ordinal >= ordinal
+
+    def __add__(self, other: dt.timedelta) -> OrdinalDate:
+        if isinstance(other, dt.timedelta):
+            return OrdinalDate(self._ordinal + other.days)
+        return NotImplemented
+
+    __radd__ = __add__
+
+    @overload
+    def __sub__(self, other: dt.timedelta) -> OrdinalDate: ...
+    @overload
+    def __sub__(self, other: SupportsToOrdinal) -> dt.timedelta: ...
+    def __sub__(self, other):
+        if isinstance(other, dt.timedelta):
+            return OrdinalDate(self._ordinal - other.days)
+        if hasattr(other, "toordinal"):
+            return dt.timedelta(days=self._ordinal - other.toordinal())
+        return NotImplemented
+
+    def __rsub__(self, other: SupportsToOrdinal) -> dt.timedelta:
+        if hasattr(other, "toordinal"):
+            return dt.timedelta(days=other.toordinal() - self._ordinal)
+        return NotImplemented
+
+    def toordinal(self) -> int:
+        """Return the proleptic Gregorian ordinal of the date."""
+        return self._ordinal
+
+    def weekday(self) -> int:
+        """Return the day of the week, Monday = 0."""
+        return (self._ordinal - 1) % 7
+
+    def date(self) -> dt.date:
+        """Return the date as a `datetime.date`."""
+        return dt.date.fromordinal(self._ordinal)
+
+    def isoformat(self) -> str:
+        """Return the date formatted as YYYY-MM-DD."""
+        return self.date().isoformat()
+
+    @property
+    def year(self) -> int:
+        return self.date().year
+
+    @property
+    def month(self) -> int:
+        return self.date().month
+
+    @property
+    def day(self) -> int:
+        return self.date().day
+
+
+class DateColumn(Sequence[OrdinalDate]):
+    """
+    A column of dates stored as an `array('i')` of proleptic Gregorian ordinals.
+
+    Indexing returns `OrdinalDate` views, created on demand; slicing returns a new column.
+    The raw ordinals are exposed as a `memoryview` by `ordinals`, which `numpy.asarray`
+    and the `DateCalculator` batch methods read directly, without per-element objects.
+
+    Args:
+        ordinals (Iterable[int], optional): The ordinals of the dates.
+    """
+
+    __slots__ = ("_ordinals",)
+
+    def __init__(self, ordinals: Iterable[int] = ()) -> None:
+        self._ordinals = ordinals if isinstance(ordinals, array) and ordinals.typecode == "i" else array("i", ordinals)
+
+    @classmethod
+    def from_dates(cls, dates: Iterable[SupportsToOrdinal]) -> DateColumn:
+        """
+        Create a column from `date` objects (or anything with `toordinal`).
+
+        Args:
+            dates (Iterable[SupportsToOrdinal]): The dates; consumed lazily.
+
+        Returns:
+            DateColumn: The new column.
+        """
+        return cls(array("i", (value.toordinal() for value in dates)))
+
+    @classmethod
+    def range(cls, start: SupportsToOrdinal, stop: SupportsToOrdinal, step: int = 1) -> DateColumn:
+        """
+        Create a column with the dates from `start` up to, but not including, `stop`.
+
+        Args:
+            start (SupportsToOrdinal): The first date.
+            stop (SupportsToOrdinal): The date after the last one.
+            step (int, optional): The distance in days between dates. Defaults to 1.
+
+        Returns:
+            DateColumn: The new column.
+        """
+        return cls(array("i", range(start.toordinal(), stop.toordinal(), step)))
+
+    @classmethod
+    def from_buffer(cls, buffer: bytes | bytearray | memoryview) -> DateColumn:
+        """
+        Create a column from raw native int32 ordinals, e.g. the bytes of another column
+        or of a NumPy `int32` array.
+
+        Args:
+            buffer (bytes | bytearray | memoryview): The raw ordinals.
+
+        Returns:
+            DateColumn: The new column, holding a copy of the buffer.
+        """
+        ordinals = array("i")
+        ordinals.frombytes(memoryview(buffer).cast("B"))
+        return cls(ordinals)
+
+    def __len__(self) -> int:
+        return len(self._ordinals)
+
+    @overload
+    def __getitem__(self, index: int) -> OrdinalDate: ...
+    @overload
+    def __getitem__(self, index: slice) -> DateColumn: ...
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return DateColumn(self._ordinals[index])
+        return OrdinalDate(self._ordinals[index])
+
+    def __iter__(self) -> Iterator[OrdinalDate]:
+        return map(OrdinalDate, self._ordinals)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, DateColumn):
+            return self._ordinals == other._ordinals
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        if len(self) > 6:
+            shown = [view.isoformat() for view in self[:3]] + ["..."] + [view.isoformat() for view in self[-3:]]
+        else:
+            shown = [view.isoformat() for view in self]
+        return f"{type(self).__name__}([{', '.join(shown)}], length={len(self)})"
+
+    @property
+    def ordinals(self) -> memoryview:
+        """A read-only view of the raw int32 ordinals."""
+        return memoryview(self._ordinals).toreadonly()
+
+    @property
+    def nbytes(self) -> int:
+        """The memory used by the ordinals, in bytes."""
+        return len(self._ordinals) * self._ordinals.itemsize
+
+    def append(self, value: SupportsToOrdinal) -> None:
+        """Add a date at the end of the column."""
+        self._ordinals.append(value.toordinal())
+
+    def extend(self, values: Iterable[SupportsToOrdinal]) -> None:
+        """Add dates at the end of the column."""
+        self._ordinals.extend(value.toordinal() for value in values)
+
+    def to_dates(self) -> list[dt.date]:
+        """Return the column as a list of `datetime.date`."""
+        return [dt.date.fromordinal(o) for o in self._ordinals]
+
+
+__all__ = ['DateColumn', 'OrdinalDate', 'SupportsToOrdinal']
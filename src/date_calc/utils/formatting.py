@@ -0,0 +1,185 @@
+"""
+This module provides locale-aware date formatting that does not depend on `locale.setlocale`.
+
+The weekday and month names of each supported language are kept in tables, and
+`DateFormatter` compiles a `strftime`-style pattern once into its literal text and small
+functions that look the names up, and joins them for each date. The output is the same as
+`strftime` under the corresponding system locale, whatever the process locale is, in a
+fraction of the time.
+
+Supported directives: %d, %m, %Y, %y, %j, %A, %a, %B, %b and %%.
+"""
+
+from datetime import date
+from functools import lru_cache
+from typing import Callable, Literal, NamedTuple, TypeAlias
+
+Language: TypeAlias = Literal["pt_BR", "en_US"]
+
+DEFAULT_LANGUAGE: Language = "pt_BR"
+
+
+class LocaleNames(NamedTuple):
+    """The weekday names (Monday first) and month names (January first) of a language."""
+
+    weekdays: tuple[str, ...]
+    short_weekdays: tuple[str, ...]
+    months: tuple[str, ...]
+    short_months: tuple[str, ...]
+
+
+LOCALES: dict[str, LocaleNames] = {
+    "pt_BR": LocaleNames(
+        weekdays=("segunda-feira", "terça-feira", "quarta-feira", "quinta-feira", "sexta-feira", "sábado", "domingo"),
+        short_weekdays=("seg", "ter", "qua", "qui", "sex", "sáb", "dom"),
+        months=(
+            "janeiro", "fevereiro", "março", "abril", "maio", "junho",
+            "julho", "agosto", "setembro", "outubro", "novembro", "dezembro",
+        ),
+        short_months=("jan", "fev", "mar", "abr", "mai", "jun", "jul", "ago", "set", "out", "nov", "dez"),
+    ),
+    "en_US": LocaleNames(
+        weekdays=("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"),
+        short_weekdays=("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"),
+        months=(
+            "January", "February", "March", "April", "May", "June",
+            "July", "August", "September", "October", "November", "December",
+        ),
+        short_months=("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"),
+    ),
+}
+
+_TWO_DIGITS: tuple[str, ...] = tuple(f"{n:02d}" for n in range(100))
+
+Part: TypeAlias = str | Callable[[date], str]
+"""A piece of a compiled pattern: literal text, or a function rendering a directive from a date."""
+
+@lru_cache(maxsize=None)
+def _getters(language: Language) -> dict[str, Callable[[date], str]]:
+    """The functions rendering each directive from a date, in a language."""
+    weekdays, short_weekdays, months, short_months = LOCALES[language]
+    return {
+        "d": lambda v: _TWO_DIGITS[v.day],
+        "m": lambda v: _TWO_DIGITS[v.month],
+        "Y": lambda v: str(v.year).zfill(4),
+        "y": lambda v: _TWO_DIGITS[v.year % 100],
+        "j": lambda v: f"{v.timetuple().tm_yday:03d}",
+        "A": lambda v: weekdays[v.weekday()],
+        "a": lambda v: short_weekdays[v.weekday()],
+        "B": lambda v: months[v.month - 1],
+        "b": lambda v: short_months[v.month - 1],
+    }
+
+
+def compile_pattern(pattern: str, language: Language = DEFAULT_LANGUAGE) -> tuple[Part, ...]:
+    """
+    Split a `strftime` pattern into its literal text and the functions rendering its directives.
+
+    Args:
+        pattern (str): The pattern, e.g. "%d-%m-%Y -> %A".
+        language (Language, optional): "pt_BR" or "en_US". Defaults to "pt_BR".
+
+    Returns:
+        tuple[Part, ...]: The parts, in order; adjacent literal text is merged into one string.
+
+    Raises:
+        ValueError: If the language or a directive of the pattern is not supported.
+    """
+    if language not in LOCALES:
+        raise ValueError(f"Unsupported language: '{language}'. Use one of {', '.join(LOCALES)}.")
+    getters = _getters(language)
+    parts: list[Part] = []
+    literal = []
+    position = 0
+    while (start := pattern.find("%", position)) != -1:
+        literal.append(pattern[position:start])
+        directive = pattern[start + 1:start + 2]
+        if directive == "%":
+            literal.append("%")
+        elif directive in getters:
+            if "".join(literal):
+                parts.append("".join(literal))
+            literal = []
+            parts.append(getters[directive])
+        else:
+            raise ValueError(f"Unsupported directive: '%{directive}' in '{pattern}'.")
+        position = start + 2
+    literal.append(pattern[position:])
+    if "".join(literal):
+        parts.append("".join(literal))
+    return tuple(parts)
+
+
+class DateFormatter:
+    """
+    Render dates with a `strftime`-style pattern in a given language.
+
+    The pattern is compiled once into its literal text and the functions rendering its
+    directives (lookups in the name tables), so formatting a date costs a few indexing
+    operations and a join.
+
+    Args:
+        pattern (str): The pattern, e.g. "%d-%m-%Y -> %A".
+        language (Language, optional): "pt_BR" or "en_US". Defaults to "pt_BR".
+
+    Raises:
+        ValueError: If the language or a directive of the pattern is not supported.
+
+    Example:
+        >>> DateFormatter("%A, %d de %B de %Y")(date(2025, 10, 17))
+        'sexta-feira, 17 de outubro de 2025'
+    """
+
+    __slots__ = ("_pattern", "_language", "_parts")
+
+    def __init__(self, pattern: str, language: Language = DEFAULT_LANGUAGE) -> None:
+        self._parts = compile_pattern(pattern, language)
+        self._pattern = pattern
+        self._language = language
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._pattern!r}, {self._language!r})"
+
+    @property
+    def pattern(self) -> str:
+        """The `strftime` pattern of the formatter."""
+        return self._pattern
+
+    def __call__(self, value: date) -> str:
+        """
+        Format a date (or a datetime, of which only the date is used).
+
+        Args:
+            value (date): The date.
+
+        Returns:
+            str: The formatted date.
+        """
+        return "".join([part if part.__class__ is str else part(value) for part in self._parts])
+
+
+@lru_cache(maxsize=64)
+def get_formatter(pattern: str, language: Language = DEFAULT_LANGUAGE) -> DateFormatter:
+    """Return a shared `DateFormatter` for a pattern and a language."""
+    return DateFormatter(pattern, language)
+
+
+def format_date(value: date, pattern: str, language: Language = DEFAULT_LANGUAGE) -> str:
+    """
+    Format a date with a `strftime`-style pattern in a given language; see `DateFormatter`.
+
+    Args:
+        value (date): The date.
+        pattern (str): The pattern, e.g. "%A, %d de %B de %Y".
+        language (Language, optional): "pt_BR" or "en_US". Defaults to "pt_BR".
+
+    Returns:
+        str: The formatted date.
+    """
+    return get_formatter(pattern, language)(value)
+
+
+__all__ = [
+    'DEFAULT_LANGUAGE', 'LOCALES', 'DateFormatter', 'Language', 'LocaleNames', 'Part',
+    'compile_pattern', 'format_date', 'get_formatter',
+]
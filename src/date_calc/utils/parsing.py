@@ -0,0 +1,179 @@
+"""
+This module provides fast date parsing for the fixed formats used by the application:
+DD-MM-YYYY (the CLI format), DD/MM/YYYY and ISO (YYYY-MM-DD).
+
+Each format has a specialised parser that slices the string at fixed positions instead of
+interpreting a format string, as `datetime.strptime` does. `DateParser` detects the format
+of a stream from its first value and reuses that parser, with a memo of the strings already
+seen, for the following ones. The keywords "today", "now", "hoje" and "." stand for the
+current date, in the time zone of `date_calc.utils.clock.default_clock()`.
+"""
+
+import re
+from datetime import date
+from functools import lru_cache
+from typing import Callable, Literal, TypeAlias
+
+DateFormat: TypeAlias = Literal["DD-MM-YYYY", "DD/MM/YYYY", "YYYY-MM-DD"]
+
+TODAY_KEYWORDS: frozenset[str] = frozenset({"today", "now", "hoje", "."})
+
+_LOOSE_DMY = re.compile(r"(\d{1,2})([-/])(\d{1,2})\2(\d{4})")
+_LOOSE_ISO = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})")
+
+
+def _invalid(value: str) -> ValueError:
+    return ValueError(f"Invalid date: '{value}'. Use DD-MM-YYYY, DD/MM/YYYY or YYYY-MM-DD.")
+
+
+def _parse_dmy_dash(value: str) -> date:
+    day, month, year = value[:2], value[3:5], value[6:]
+    if len(value) != 10 or value[2] != "-" or value[5] != "-" or not (day.isdigit() and month.isdigit() and year.isdigit()):
+        raise _invalid(value)
+    return date(int(year), int(month), int(day))
+
+
+def _parse_dmy_slash(value: str) -> date:
+    day, month, year = value[:2], value[3:5], value[6:]
+    if len(value) != 10 or value[2] != "/" or value[5] != "/" or not (day.isdigit() and month.isdigit() and year.isdigit()):
+        raise _invalid(value)
+    return date(int(year), int(month), int(day))
+
+
+def _parse_iso(value: str) -> date:
+    if len(value) != 10 or value[4] != "-" or value[7] != "-":
+        raise _invalid(value)
+    return date.fromisoformat(value)
+
+
+PARSERS: dict[DateFormat, Callable[[str], date]] = {
+    "DD-MM-YYYY": _parse_dmy_dash,
+    "DD/MM/YYYY": _parse_dmy_slash,
+    "YYYY-MM-DD": _parse_iso,
+}
+
+
+def detect_format(value: str) -> DateFormat:
+    """
+    Detect the format of a zero-padded date from the position of its separators.
+
+    Args:
+        value (str): A date, e.g. "17-10-2025", "17/10/2025" or "2025-10-17".
+
+    Returns:
+        DateFormat: The format of the date.
+
+    Raises:
+        ValueError: If the value is in none of the supported formats.
+    """
+    if len(value) == 10:
+        if value[2] == value[5] == "-":
+            return "DD-MM-YYYY"
+        if value[2] == value[5] == "/":
+            return "DD/MM/YYYY"
+        if value[4] == value[7] == "-":
+            return "YYYY-MM-DD"
+    raise _invalid(value)
+
+
+@lru_cache(maxsize=4096)
+def _parse_any(value: str) -> date:
+    """Parse a date in any supported format, zero-padded or not."""
+    try:
+        return PARSERS[detect_format(value)](value)
+    except ValueError:
+        pass
+    try:
+        if match := _LOOSE_DMY.fullmatch(value):
+            return date(int(match[4]), int(match[3]), int(match[1]))
+        if match := _LOOSE_ISO.fullmatch(value):
+            return date(int(match[1]), int(match[2]), int(match[3]))
+    except ValueError:
+        pass
+    raise _invalid(value)
+
+
+def parse_date(value: str) -> date:
+    """
+    Parse a date in any supported format, or a keyword for the current date.
+
+    Day and month may omit the leading zero ("1-2-2025"). Results are memoized.
+
+    Args:
+        value (str): The date, or "today", "now", "hoje" or ".".
+
+    Returns:
+        date: The parsed date.
+
+    Raises:
+        ValueError: If the value is not a valid date in a supported format.
+    """
+    value = value.strip()
+    if value.lower() in TODAY_KEYWORDS:
+        from date_calc.utils.clock import default_clock
+        return default_clock().today()
+    return _parse_any(value)
+
+
+class DateParser:
+    """
+    A date parser for a stream of values in one format.
+
+    The format is detected from the first date parsed (unless given) and its specialised
+    parser is used from then on, behind a memo of up to `cache_size` strings. A value in
+    another format is still accepted, through `parse_date`.
+
+    Args:
+        date_format (DateFormat, optional): The format of the stream. Defaults to detection.
+        cache_size (int, optional): The number of memoized strings. Defaults to 4096.
+
+    Example:
+        >>> parse = DateParser()
+        >>> [parse(value) for value in ("17/10/2025", "18/10/2025")]
+        [datetime.date(2025, 10, 17), datetime.date(2025, 10, 18)]
+        >>> parse.date_format
+        'DD/MM/YYYY'
+    """
+
+    __slots__ = ("_format", "_parse", "_cache_size")
+
+    def __init__(self, date_format: DateFormat | None = None, cache_size: int = 4096) -> None:
+        self._cache_size = cache_size
+        self._format: DateFormat | None = None
+        self._parse: Callable[[str], date] = self._detect
+        if date_format is not None:
+            self._use(date_format)
+
+    @property
+    def date_format(self) -> DateFormat | None:
+        """The format of the stream; None until the first date is parsed."""
+        return self._format
+
+    def __call__(self, value: str) -> date:
+        """
+        Parse a date of the stream, or a keyword for the current date.
+
+        Args:
+            value (str): The date.
+
+        Returns:
+            date: The parsed date.
+
+        Raises:
+            ValueError: If the value is not a valid date in a supported format.
+        """
+        try:
+            return self._parse(value)
+        except ValueError:
+            return parse_date(value)
+
+    def _use(self, date_format: DateFormat) -> None:
+        self._format = date_format
+        self._parse = lru_cache(maxsize=self._cache_size)(PARSERS[date_format])
+
+    def _detect(self, value: str) -> date:
+        self._use(detect_format(value))
+        return self._parse(value)
+
+
+__all__ = ['DateFormat', 'DateParser', 'PARSERS', 'TODAY_KEYWORDS', 'detect_format', 'parse_date']
@@ -0,0 +1,472 @@
+"""
+This module provides NumPy implementations of the `DateCalculator` operations for whole
+arrays of dates, used by the `*_batch` methods of `DateCalculator`.
+
+Dates are accepted as `datetime64` arrays, as integer arrays of proleptic Gregorian
+ordinals (`date.toordinal()`) or as a `DateColumn`. Dates are returned in the same
+representation as the input dates, counts as `int64` arrays. All the work is done with array arithmetic and
+`numpy.searchsorted` over the calendar's holiday index (or lookups in the arrays of a
+`BusinessDayIndex`), without per-element Python objects.
+"""
+
+from datetime import date, datetime, tzinfo
+from functools import lru_cache
+from typing import Iterator, Literal, TypeAlias
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover - depends on the environment
+    raise ImportError(
+        "The batch API of date_calc requires NumPy. Install it with: pip install 'date-calc[batch]'"
+    ) from e
+
+from numpy.typing import ArrayLike, NDArray
+
+from date_calc.utils.business_calendar import (
+    BaseBusinessCalendar, DEFAULT_CALENDAR, ROLL_CONVENTIONS, RollConvention, week_table
+)
+from date_calc.utils.business_index import BusinessDayIndex
+from date_calc.utils.clock import default_clock, get_zone
+from date_calc.utils.date_column import DateColumn
+
+DateArrayLike: TypeAlias = ArrayLike | DateColumn
+TimestampUnit: TypeAlias = Literal["s", "ms", "us", "ns"]
+
+_EPOCH_ORDINAL: int = date(1970, 1, 1).toordinal()
+_DAY_SECONDS = 86_400
+_UNIT_SECONDS: dict[str, int] = {"s": 1, "ms": 1_000, "us": 1_000_000, "ns": 1_000_000_000}
+_NO_TRANSITION = np.iinfo(np.int64).max
+
+
+def to_ordinals(dates: DateArrayLike) -> NDArray[np.int64]:
+    """
+    Convert an array of dates to proleptic Gregorian ordinals.
+
+    Args:
+        dates (DateArrayLike): A `datetime64` array, an integer array of ordinals or a `DateColumn`.
+
+    Returns:
+        NDArray[np.int64]: The ordinals of the dates.
+    """
+    return _as_ordinals(dates)[0]
+
+
+def from_ordinals(ordinals: ArrayLike) -> NDArray[np.datetime64]:
+    """
+    Convert an array of proleptic Gregorian ordinals to a `datetime64[D]` array.
+
+    Args:
+        ordinals (ArrayLike): Integer ordinals.
+
+    Returns:
+        NDArray[np.datetime64]: The corresponding dates.
+    """
+    return (np.asarray(ordinals, dtype=np.int64) - _EPOCH_ORDINAL).astype("datetime64[D]")
+
+
+def local_dates(
+        timestamps: ArrayLike,
+        zone: str | tzinfo | None = None,
+        unit: TimestampUnit = "s"
+    ) -> NDArray[np.datetime64]:
+    """
+    Convert an array of UTC timestamps to the dates they fall on in a time zone.
+
+    The UTC offset is looked up once per UTC day of the input's span (and located to the
+    second on the days of a transition, e.g. the start of daylight saving time), then applied
+    to all the timestamps with array arithmetic, so the cost depends on the time span of
+    the input rather than on its size.
+
+    Args:
+        timestamps (ArrayLike): Numbers of `unit`s since the epoch, or `datetime64` values in UTC.
+        zone (str | tzinfo, optional): The time zone. Defaults to the zone of `default_clock()`.
+        unit (TimestampUnit, optional): "s", "ms", "us" or "ns", for numeric timestamps. Defaults to "s".
+
+    Returns:
+        NDArray[np.datetime64]: The local dates (`datetime64[D]`).
+
+    Raises:
+        ValueError: If the unit or the time zone is invalid, or a timestamp is out of range.
+    """
+    if zone is None:
+        zone = default_clock().zone
+    elif isinstance(zone, str):
+        zone = get_zone(zone)
+    values = np.asarray(timestamps)
+    if np.issubdtype(values.dtype, np.datetime64):
+        seconds = values.astype("datetime64[s]").astype(np.int64)
+    elif unit not in _UNIT_SECONDS:
+        raise ValueError(f"Invalid unit: '{unit}'. Use one of {', '.join(_UNIT_SECONDS)}.")
+    elif np.issubdtype(values.dtype, np.integer):
+        seconds = values.astype(np.int64) // _UNIT_SECONDS[unit]
+    else:
+        seconds = np.floor(values / _UNIT_SECONDS[unit]).astype(np.int64)
+    if seconds.size == 0:
+        return seconds.astype("datetime64[D]")
+
+    days = seconds // _DAY_SECONDS
+    first, last = int(days.min()), int(days.max())
+    if last - first < max(seconds.size, 1024):  # a dense span: index the days directly, without sorting
+        day_list, index = list(range(first, last + 1)), days - first
+    else:
+        unique, index = np.unique(days, return_inverse=True)
+        day_list, index = unique.tolist(), index.reshape(seconds.shape)
+    start_offsets, end_offsets, transitions = _day_offsets(day_list, zone)
+    offsets = np.where(seconds >= transitions[index], end_offsets[index], start_offsets[index])
+    return ((seconds + offsets) // _DAY_SECONDS).astype("datetime64[D]")
+
+
+def _day_offsets(days: list[int], zone: tzinfo) -> tuple[NDArray[np.int64], NDArray[np.int64], NDArray[np.int64]]:
+    """The UTC offsets at the start and end of each UTC day, and the second of the transition between them."""
+    def offset(second: int) -> int:
+        try:
+            return int(datetime.fromtimestamp(second, zone).utcoffset().total_seconds())
+        except (OverflowError, OSError) as e:
+            raise ValueError(f"Timestamp out of range: {second}.") from e
+
+    starts = [offset(day * _DAY_SECONDS) for day in days]
+    ends = [offset((day + 1) * _DAY_SECONDS) for day in days]
+    transitions = []
+    for day, start, end in zip(days, starts, ends):
+        if start == end:  # no transition on this day (at most one per day is assumed)
+            transitions.append(_NO_TRANSITION)
+            continue
+        low, high = day * _DAY_SECONDS, (day + 1) * _DAY_SECONDS  # offset(low) == start, offset(high) == end
+        while high - low > 1:
+            middle = (low + high) // 2
+            if offset(middle) == start:
+                low = middle
+            else:
+                high = middle
+        transitions.append(high)
+    return np.array(starts, dtype=np.int64), np.array(ends, dtype=np.int64), np.array(transitions, dtype=np.int64)
+
+
+def _as_ordinals(dates: DateArrayLike) -> tuple[NDArray[np.int64], str]:
+    """Return the ordinals of `dates` and their representation: "datetime64", "ordinal" or "column"."""
+    if isinstance(dates, DateColumn):
+        return np.frombuffer(dates.ordinals, dtype=np.int32).astype(np.int64), "column"
+    array = np.asarray(dates)
+    if array.dtype.kind == "M":
+        return array.astype("datetime64[D]").astype(np.int64) + _EPOCH_ORDINAL, "datetime64"
+    if array.dtype.kind in "iu":
+        return array.astype(np.int64, copy=False), "ordinal"
+    raise TypeError(f"Expected a datetime64 or integer ordinal array, got dtype '{array.dtype}'.")
+
+
+def _restore(ordinals: NDArray[np.int64], kind: str) -> NDArray | DateColumn:
+    """Return ordinals in the representation the input dates were given in."""
+    if kind == "datetime64":
+        return from_ordinals(ordinals)
+    if kind == "column":
+        return DateColumn.from_buffer(np.ascontiguousarray(ordinals, dtype=np.int32).ravel())
+    return ordinals
+
+
+@lru_cache(maxsize=128)
+def _week_arrays(mask: int) -> tuple[int, NDArray[np.int64], NDArray[np.int64], NDArray[np.bool_]]:
+    """Return the `WeekTable` of a weekmask as arrays: per-week count, prefix, working weekdays and flags."""
+    table = week_table(mask)
+    working = np.array([table.is_working(weekday) for weekday in range(7)])
+    return (
+        table.per_week,
+        np.array(table.before[:7], dtype=np.int64),
+        np.array(table.weekdays, dtype=np.int64),
+        working,
+    )
+
+
+def _business_days_before(ordinals: NDArray[np.int64], calendar: BaseBusinessCalendar) -> NDArray[np.int64]:
+    """Vectorized `BaseBusinessCalendar.business_days_before`."""
+    if isinstance(calendar, BusinessDayIndex):
+        positions = ordinals - calendar.first_ordinal
+        if positions.size == 0 or (positions.min() >= 0 and positions.max() <= calendar.day_count):
+            cumulative = np.frombuffer(calendar.cumulative_counts, dtype=np.int32)
+            return cumulative[positions].astype(np.int64) + calendar.base
+        calendar = calendar.calendar
+
+    per_week, before, _, _ = _week_arrays(calendar.weekmask)
+    weeks, weekday = np.divmod(ordinals - 1, 7)
+    counts = weeks * per_week + before[weekday]
+    if calendar.holiday_ordinals:
+        counts -= np.searchsorted(np.asarray(calendar.holiday_ordinals), ordinals, side="left")
+    return counts
+
+
+def _nth_business_day(indexes: NDArray[np.int64], calendar: BaseBusinessCalendar) -> NDArray[np.int64]:
+    """Vectorized `BaseBusinessCalendar.nth_business_day`."""
+    if isinstance(calendar, BusinessDayIndex):
+        positions = indexes - calendar.base
+        business = np.frombuffer(calendar.business_positions, dtype=np.int32)
+        if positions.size == 0 or (positions.min() >= 0 and positions.max() < business.size):
+            return business[positions].astype(np.int64) + calendar.first_ordinal
+        calendar = calendar.calendar
+
+    if calendar.holiday_ranks:
+        indexes = indexes + np.searchsorted(np.asarray(calendar.holiday_ranks), indexes, side="right")
+    per_week, _, weekdays, _ = _week_arrays(calendar.weekmask)
+    weeks, position = np.divmod(indexes, per_week)
+    return weeks * 7 + weekdays[position] + 1
+
+
+def add_days(start_dates: DateArrayLike, days: ArrayLike) -> NDArray | DateColumn:
+    """
+    Vectorized `DateCalculator.add_days`.
+
+    Args:
+        start_dates (DateArrayLike): The starting dates.
+        days (ArrayLike): The number of days to add, broadcast against `start_dates`.
+
+    Returns:
+        NDArray: The new dates.
+    """
+    ordinals, kind = _as_ordinals(start_dates)
+    return _restore(ordinals + np.asarray(days, dtype=np.int64), kind)
+
+
+def date_difference(start_dates: DateArrayLike, end_dates: DateArrayLike) -> NDArray[np.int64]:
+    """
+    Vectorized `DateCalculator.date_difference`.
+
+    Args:
+        start_dates (DateArrayLike): The starting dates.
+        end_dates (DateArrayLike): The ending dates.
+
+    Returns:
+        NDArray[np.int64]: The number of days from each start to each end.
+    """
+    return to_ordinals(end_dates) - to_ordinals(start_dates)
+
+
+def business_days(
+        initial_dates: DateArrayLike,
+        final_dates: DateArrayLike,
+        calendar: BaseBusinessCalendar = DEFAULT_CALENDAR
+    ) -> NDArray[np.int64]:
+    """
+    Vectorized `DateCalculator.business_days`.
+
+    Args:
+        initial_dates (DateArrayLike): The starting dates (inclusive).
+        final_dates (DateArrayLike): The ending dates (exclusive).
+        calendar (BaseBusinessCalendar, optional): The business-day calendar.
+
+    Returns:
+        NDArray[np.int64]: The business days in each range, 0 where the initial
+            date is not before the final date.
+    """
+    initial = to_ordinals(initial_dates)
+    final = to_ordinals(final_dates)
+    counts = _business_days_before(final, calendar) - _business_days_before(initial, calendar)
+    return np.where(initial < final, counts, 0)
+
+
+def date_difference_matrix(start_dates: DateArrayLike, end_dates: DateArrayLike) -> NDArray[np.int64]:
+    """
+    The days from every start date to every end date: `result[i, j]` is
+    `DateCalculator.date_difference(start_dates[i], end_dates[j])`.
+
+    Args:
+        start_dates (DateArrayLike): The N starting dates (one-dimensional).
+        end_dates (DateArrayLike): The M ending dates (one-dimensional).
+
+    Returns:
+        NDArray[np.int64]: The N x M matrix of differences.
+    """
+    return to_ordinals(end_dates).ravel()[np.newaxis, :] - to_ordinals(start_dates).ravel()[:, np.newaxis]
+
+
+def business_days_matrix(
+        initial_dates: DateArrayLike,
+        final_dates: DateArrayLike,
+        calendar: BaseBusinessCalendar = DEFAULT_CALENDAR
+    ) -> NDArray[np.int64]:
+    """
+    The business days from every initial date to every final date: `result[i, j]` is
+    `DateCalculator.business_days(initial_dates[i], final_dates[j])`.
+
+    The business-day counts are computed once per date (N + M lookups); the matrix is
+    then a single broadcast subtraction.
+
+    Args:
+        initial_dates (DateArrayLike): The N starting dates (inclusive, one-dimensional).
+        final_dates (DateArrayLike): The M ending dates (exclusive, one-dimensional).
+        calendar (BaseBusinessCalendar, optional): The business-day calendar.
+
+    Returns:
+        NDArray[np.int64]: The N x M matrix of counts, 0 where the initial date is not
+            before the final date.
+    """
+    initial = _business_days_before(to_ordinals(initial_dates).ravel(), calendar)
+    final = _business_days_before(to_ordinals(final_dates).ravel(), calendar)
+    # the count is monotonic: a final date not after the initial one gives a difference <= 0
+    return np.maximum(final[np.newaxis, :] - initial[:, np.newaxis], 0)
+
+
+def iter_difference_matrix(
+        start_dates: DateArrayLike,
+        end_dates: DateArrayLike,
+        type_of_days: Literal["business", "consecutive"] = "consecutive",
+        calendar: BaseBusinessCalendar = DEFAULT_CALENDAR,
+        block_rows: int = 1024
+    ) -> Iterator[NDArray[np.int64]]:
+    """
+    Yield the rows of `date_difference_matrix` ("consecutive") or `business_days_matrix`
+    ("business") in blocks of `block_rows` rows, so that only one block is in memory.
+
+    Args:
+        start_dates (DateArrayLike): The N starting dates (one-dimensional).
+        end_dates (DateArrayLike): The M ending dates (one-dimensional).
+        type_of_days (str, optional): "consecutive" or "business". Defaults to "consecutive".
+        calendar (BaseBusinessCalendar, optional): The calendar for "business" days.
+        block_rows (int, optional): The number of rows per block. Defaults to 1024.
+
+    Yields:
+        NDArray[np.int64]: The next block of rows, of shape (<= block_rows, M).
+
+    Raises:
+        ValueError: If `type_of_days` is invalid or `block_rows` is not positive.
+    """
+    if type_of_days not in ("consecutive", "business"):
+        raise ValueError(f"Invalid type of days: '{type_of_days}'. Use 'consecutive' or 'business'.")
+    if block_rows <= 0:
+        raise ValueError(f"The number of rows per block must be positive, got {block_rows}.")
+    starts, ends = to_ordinals(start_dates).ravel(), to_ordinals(end_dates).ravel()
+    if type_of_days == "business":
+        starts, ends = _business_days_before(starts, calendar), _business_days_before(ends, calendar)
+    return _difference_blocks(starts, ends, type_of_days == "business", block_rows)
+
+
+def _difference_blocks(starts: NDArray[np.int64], ends: NDArray[np.int64], clip: bool, block_rows: int) -> Iterator[NDArray[np.int64]]:
+    ends = ends[np.newaxis, :]
+    for first in range(0, len(starts), block_rows):
+        block = ends - starts[first:first + block_rows, np.newaxis]
+        yield np.maximum(block, 0, out=block) if clip else block
+
+
+def new_date_with_interval_of_days(
+        initial_dates: DateArrayLike,
+        intervals: ArrayLike,
+        type_of_days: Literal["business", "consecutive"],
+        calendar: BaseBusinessCalendar = DEFAULT_CALENDAR
+    ) -> NDArray | DateColumn:
+    """
+    Vectorized `DateCalculator.new_date_with_interval_of_days`.
+
+    Args:
+        initial_dates (DateArrayLike): The starting dates.
+        intervals (ArrayLike): The number of days to move, broadcast against `initial_dates`.
+        type_of_days (str): The type of days to consider ("business" or "consecutive").
+        calendar (BaseBusinessCalendar, optional): The business-day calendar used for "business" days.
+
+    Returns:
+        NDArray: The new dates.
+    """
+    ordinals, kind = _as_ordinals(initial_dates)
+    intervals = np.asarray(intervals, dtype=np.int64)
+
+    if type_of_days == "consecutive":
+        return _restore(ordinals + intervals, kind)
+
+    ordinals, intervals = np.broadcast_arrays(ordinals, intervals)
+    # see BaseBusinessCalendar.add_business_days: a start that is neither a working
+    # weekday nor the day right after one costs one extra step
+    working = _week_arrays(calendar.weekmask)[3]
+    weekday = (ordinals - 1) % 7
+    steps = np.abs(intervals) + (~working[weekday] & ~working[(weekday - 1) % 7])
+    indexes = np.where(
+        intervals > 0,
+        _business_days_before(ordinals + 1, calendar) - 1 + steps,
+        _business_days_before(ordinals, calendar) - steps,
+    )
+    result = np.where(intervals == 0, ordinals, _nth_business_day(indexes, calendar))
+    return _restore(result, kind)
+
+
+def roll(dates: DateArrayLike, convention: RollConvention, calendar: BaseBusinessCalendar = DEFAULT_CALENDAR) -> NDArray | DateColumn:
+    """
+    Vectorized `BaseBusinessCalendar.roll`.
+
+    Args:
+        dates (DateArrayLike): The dates to adjust.
+        convention (RollConvention): The roll convention.
+        calendar (BaseBusinessCalendar, optional): The business-day calendar.
+
+    Returns:
+        NDArray: The adjusted dates.
+
+    Raises:
+        ValueError: If the convention is unknown.
+    """
+    ordinals, kind = _as_ordinals(dates)
+    return _restore(_roll(ordinals, convention, calendar), kind)
+
+
+def _roll(ordinals: NDArray[np.int64], convention: str, calendar: BaseBusinessCalendar) -> NDArray[np.int64]:
+    """Roll ordinals to business days; see `roll`."""
+    if convention not in ROLL_CONVENTIONS:
+        raise ValueError(f"Invalid roll convention: {convention!r}. Use one of {', '.join(ROLL_CONVENTIONS)}.")
+
+    following = _nth_business_day(_business_days_before(ordinals, calendar), calendar)
+    preceding = _nth_business_day(_business_days_before(ordinals + 1, calendar) - 1, calendar)
+    if convention == "following":
+        return following
+    if convention == "preceding":
+        return preceding
+
+    month = _months(ordinals)
+    if convention == "modified_following":
+        return np.where(_months(following) == month, following, preceding)
+    return np.where(_months(preceding) == month, preceding, following)
+
+
+def _months(ordinals: NDArray[np.int64]) -> NDArray[np.datetime64]:
+    """Return the `datetime64[M]` month of each ordinal."""
+    return from_ordinals(ordinals).astype("datetime64[M]")
+
+
+def add_months(
+        start_dates: DateArrayLike,
+        months: ArrayLike,
+        roll: RollConvention | None = None,
+        end_of_month: bool = False,
+        calendar: BaseBusinessCalendar = DEFAULT_CALENDAR
+    ) -> NDArray | DateColumn:
+    """
+    Vectorized `DateCalculator.add_months`.
+
+    Args:
+        start_dates (DateArrayLike): The starting dates.
+        months (ArrayLike): The number of months to add, broadcast against `start_dates`.
+        roll (RollConvention, optional): How to adjust results that are not business days.
+        end_of_month (bool, optional): Keep month-end dates on the month end. Defaults to False.
+        calendar (BaseBusinessCalendar, optional): The business-day calendar used by `roll`.
+
+    Returns:
+        NDArray: The new dates.
+    """
+    ordinals, kind = _as_ordinals(start_dates)
+    days = from_ordinals(ordinals)
+    month = days.astype("datetime64[M]")
+    day = (days - month.astype("datetime64[D]")).astype(np.int64)
+    one_month = np.timedelta64(1, "M")
+    month_length = ((month + one_month).astype("datetime64[D]") - month.astype("datetime64[D]")).astype(np.int64)
+
+    target = month + np.asarray(months, dtype=np.int64).astype("timedelta64[M]")
+    first_day = target.astype("datetime64[D]")
+    target_length = ((target + one_month).astype("datetime64[D]") - first_day).astype(np.int64)
+    if end_of_month:
+        day = np.where(day == month_length - 1, target_length - 1, np.minimum(day, target_length - 1))
+    else:
+        day = np.minimum(day, target_length - 1)
+    result = (first_day + day).astype(np.int64) + _EPOCH_ORDINAL
+
+    if roll is not None:
+        result = _roll(result, roll, calendar)
+    return _restore(result, kind)
+
+
+__all__ = [
+    'to_ordinals', 'from_ordinals', 'local_dates', 'add_days', 'date_difference', 'date_difference_matrix', 'iter_difference_matrix',
+    'business_days', 'business_days_matrix', 'new_date_with_interval_of_days', 'roll', 'add_months',
+]
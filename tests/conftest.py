@@ -0,0 +1,7 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def settings_cache_dir(tmp_path_factory, monkeypatch: pytest.MonkeyPatch):
+    """Keep the settings snapshot of the tests out of the user's cache directory."""
+    monkeypatch.setenv("DTCALC_CACHE_DIR", str(tmp_path_factory.getbasetemp() / "cache"))
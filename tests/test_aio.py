@@ -0,0 +1,98 @@
+import asyncio
+import time
+import pytest
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+
+from date_calc.aio import AsyncDateCalculator
+from date_calc.utils.business_calendar import BusinessCalendar
+from date_calc.utils.date_calculator import DateCalculator
+from date_calc.utils.date_column import DateColumn
+
+CALENDAR = BusinessCalendar([date(2025, 1, 1), date(2025, 3, 3), date(2025, 4, 18)])
+
+def test_scalar_calls_match_date_calculator():
+    calculator = AsyncDateCalculator()
+
+    async def main():
+        return (
+            await calculator.business_days(initial_date=date(2025, 1, 1), final_date=date(2025, 2, 1), calendar=CALENDAR),
+            await calculator.add_months(date(2025, 1, 31), 1),
+            await calculator.date_difference(date(2025, 1, 1), date(2025, 2, 1)),
+        )
+
+    assert asyncio.run(main()) == (
+        DateCalculator.business_days(initial_date=date(2025, 1, 1), final_date=date(2025, 2, 1), calendar=CALENDAR),
+        date(2025, 2, 28), 31,
+    )
+
+def test_business_day_list_by_chunks():
+    calculator = AsyncDateCalculator(chunk_size=7)
+    result = asyncio.run(calculator.business_day_list(date(2025, 1, 1), date(2025, 6, 1), calendar=CALENDAR))
+    assert result == list(DateCalculator.iter_business_days(date(2025, 1, 1), date(2025, 6, 1), calendar=CALENDAR))
+
+def test_invalid_limits():
+    with pytest.raises(ValueError):
+        AsyncDateCalculator(chunk_size=0)
+
+class TestBatch:
+    np = pytest.importorskip("numpy")
+
+    def test_chunked_results_match_one_call(self):
+        np = self.np
+        starts = np.arange(date(2000, 1, 1).toordinal(), date(2030, 1, 1).toordinal())
+        intervals = np.arange(len(starts)) % 90 - 45
+        calculator = AsyncDateCalculator(max_pending=2, chunk_size=1000)
+
+        async def main():
+            return await asyncio.gather(
+                calculator.new_date_with_interval_of_days_batch(initial_dates=starts, intervals=intervals, type_of_days="business", calendar=CALENDAR),
+                calculator.business_days_batch(initial_dates=starts, final_dates=starts + 40, calendar=CALENDAR),
+                calculator.add_months_batch(np.datetime64("2025-01-31"), np.arange(1, 2401)),
+                calculator.add_days_batch(DateColumn(starts.tolist()), 3),
+            )
+
+        business, counts, schedule, column = asyncio.run(main())
+        np.testing.assert_array_equal(business, DateCalculator.new_date_with_interval_of_days_batch(
+            initial_dates=starts, intervals=intervals, type_of_days="business", calendar=CALENDAR))
+        np.testing.assert_array_equal(counts, DateCalculator.business_days_batch(initial_dates=starts, final_dates=starts + 40, calendar=CALENDAR))
+        np.testing.assert_array_equal(schedule, DateCalculator.add_months_batch(np.datetime64("2025-01-31"), np.arange(1, 2401)))
+        assert column == DateColumn((starts + 3).tolist())
+
+    def test_process_executor(self):
+        np = self.np
+        starts = np.arange(738000, 740000)
+        with ProcessPoolExecutor(2) as executor:
+            calculator = AsyncDateCalculator(executor, chunk_size=500)
+            result = asyncio.run(calculator.business_days_batch(initial_dates=starts, final_dates=starts + 10, calendar=CALENDAR))
+        np.testing.assert_array_equal(result, DateCalculator.business_days_batch(initial_dates=starts, final_dates=starts + 10, calendar=CALENDAR))
+
+    def test_event_loop_latency_under_bulk_load(self):
+        np = self.np
+        starts = np.arange(2_000_000) % 700_000 + 100_000
+        calculator = AsyncDateCalculator(max_pending=2)
+
+        async def main():
+            lags = []
+
+            async def ticker():
+                while True:
+                    start = time.perf_counter()
+                    await asyncio.sleep(0.001)
+                    lags.append(time.perf_counter() - start - 0.001)
+
+            task = asyncio.create_task(ticker())
+            await asyncio.gather(*(
+                calculator.new_date_with_interval_of_days_batch(initial_dates=starts, intervals=5, type_of_days="business", calendar=CALENDAR)
+                for _ in range(3)
+            ))
+            # scalar calls keep being answered inline meanwhile
+            assert await calculator.date_difference(date(2025, 1, 1), date(2025, 1, 2)) == 1
+            await asyncio.sleep(0.005)
+            task.cancel()
+            return sorted(lags)
+
+        lags = asyncio.run(main())
+        assert len(lags) > 10
+        # generous bound for shared CI machines; see benchmarks/bench_async.py for the figures
+        assert lags[int(len(lags) * 0.99)] < 0.1
@@ -0,0 +1,165 @@
+import csv
+import io
+import json
+import pytest
+import sys
+from datetime import date
+
+from date_calc.batch import detect_format, run_batch, run_batch_parallel
+from date_calc.utils.business_calendar import BusinessCalendar
+from date_calc.runner import DefaultRunner
+
+CSV_INPUT = """operation,date,end_date,interval,type_of_days
+calc,06-10-2025,,25,business
+calc,31-12-2025,,1,
+diff,01-01-2025,01-02-2025,,
+diff,01-01-2025,01-02-2025,,business
+calc,32-01-2025,,1,
+sum,01-01-2025,,1,
+"""
+
+def test_run_batch_csv():
+    output = io.StringIO()
+    summary = run_batch(io.StringIO(CSV_INPUT), output)
+    assert summary == (6, 2)
+    lines = output.getvalue().splitlines()
+    assert lines[0] == 'operation,date,end_date,interval,type_of_days,result,error_code,error_message'
+    assert [line.split(',')[5] for line in lines[1:5]] == ['10-11-2025', '01-01-2026', '31', '23']
+    assert lines[5].endswith(',,invalid_value,"Invalid date: \'32-01-2025\'. Use DD-MM-YYYY, DD/MM/YYYY or YYYY-MM-DD."')
+    assert "invalid_value,Invalid operation: 'sum'" in lines[6]
+
+def test_run_batch_ndjson():
+    rows = [
+        {"operation": "calc", "date": "06-10-2025", "interval": 25, "type_of_days": "business"},
+        {"operation": "diff", "date": "01-02-2025", "end_date": "01-01-2025"},
+        {"operation": "calc", "date": "06-10-2025"},
+    ]
+    source = io.StringIO("\n".join(json.dumps(row) for row in rows) + "\n\nnot json\n")
+    output = io.StringIO()
+    assert run_batch(source, output, 'ndjson') == (4, 2)
+    results = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert [(r['result'], r['error'] is None) for r in results] == [('10-11-2025', True), (-31, True), (None, False), (None, False)]
+    assert results[0]['interval'] == 25
+    assert results[2]['error'] == {"code": "invalid_value", "message": "'calc' needs a date and an interval."}
+
+def test_run_batch_csv_keeps_the_input_columns():
+    output = io.StringIO()
+    assert run_batch(io.StringIO('interval,date,operation,note\n5,01-01-2025,calc,x\n\n'), output) == (1, 0)
+    assert output.getvalue() == 'interval,date,operation,note,result,error_code,error_message\n5,01-01-2025,calc,x,06-01-2025,,\n'
+
+def test_run_batch_json_keeps_the_result_types():
+    output = io.StringIO()
+    assert run_batch(io.StringIO(CSV_INPUT), output, output_format='json') == (6, 2)
+    results = [r['result'] for r in json.loads(output.getvalue())]
+    assert results == ['10-11-2025', '01-01-2026', 31, 23, None, None]
+    assert [type(result) for result in results[:4]] == [str, str, int, int]
+
+def test_detect_format():
+    assert detect_format('rows.jsonl') == detect_format('rows.NDJSON') == 'ndjson'
+    assert detect_format('rows.csv') == detect_format('-') == 'csv'
+
+def test_runner_batch_files(tmp_path):
+    source, output = tmp_path / 'rows.csv', tmp_path / 'out.csv'
+    source.write_text(CSV_INPUT, encoding='utf-8')
+    assert DefaultRunner().batch(source, output) == (6, 2)
+    assert output.read_text(encoding='utf-8').count('\n') == 7
+
+@pytest.mark.parametrize("output_format", ["csv", "json"])
+def test_run_batch_converts_the_output_format(output_format):
+    output = io.StringIO()
+    source = io.StringIO('{"operation": "calc", "date": "01-01-2025", "interval": 5, "note": "x"}\n{"operation": "diff"}\n')
+    assert run_batch(source, output, 'ndjson', output_format=output_format) == (2, 1)
+    if output_format == "csv":
+        assert output.getvalue().splitlines() == [
+            'operation,date,end_date,interval,type_of_days,result,error_code,error_message',
+            'calc,01-01-2025,,5,,06-01-2025,,',
+            "diff,,,,,,invalid_value,'diff' needs a date and an end date.",
+        ]
+    else:
+        results = json.loads(output.getvalue())
+        assert [r['result'] for r in results] == ['06-01-2025', None]
+        assert results[0]['note'] == 'x' and results[1]['error']['code'] == 'invalid_value'
+
+@pytest.mark.parametrize("input_format, output_format", [("csv", None), ("ndjson", None), ("csv", "json"), ("ndjson", "csv")])
+def test_run_batch_parallel_matches_run_batch(input_format, output_format):
+    if input_format == "csv":
+        text = CSV_INPUT + CSV_INPUT.split('\n', 1)[1] * 200
+    else:
+        text = "".join(
+            json.dumps({"operation": "calc", "date": f"{day:02d}-03-2025", "interval": day - 10, "type_of_days": "business"}) + "\n"
+            for day in range(1, 32)
+        ) * 20 + "{}\n"
+    expected, output = io.StringIO(), io.StringIO()
+    summary = run_batch(io.StringIO(text), expected, input_format, output_format=output_format)
+    assert run_batch_parallel(io.StringIO(text), output, input_format, workers=2, chunk_size=512, output_format=output_format) == summary
+    assert output.getvalue() == expected.getvalue()
+
+@pytest.mark.parametrize("input_format", ["csv", "ndjson"])
+def test_run_batch_parallel_keeps_unicode_line_separators_in_values(input_format):
+    note = "a\u2028b\u2029c\x85d\x1ee"
+    if input_format == "csv":
+        text = "operation,date,interval,note\n" + f"calc,01-01-2025,5,{note}\n" * 50
+    else:
+        text = (json.dumps({"operation": "calc", "date": "01-01-2025", "interval": 5, "note": note}, ensure_ascii=False) + "\n") * 50
+    expected, output = io.StringIO(), io.StringIO()
+    summary = run_batch(io.StringIO(text), expected, input_format)
+    assert summary == (50, 0)
+    assert run_batch_parallel(io.StringIO(text), output, input_format, workers=2, chunk_size=256) == summary
+    assert output.getvalue() == expected.getvalue()
+    if input_format == "csv":
+        notes = [row[3] for row in csv.reader(io.StringIO(output.getvalue(), newline="\n"))][1:]
+    else:
+        notes = [json.loads(line)["note"] for line in output.getvalue().split("\n") if line]
+    assert notes == [note] * 50
+
+def test_run_batch_parallel_uses_the_calendar_in_workers():
+    calendar = BusinessCalendar([date(2025, 3, 3)])
+    output = io.StringIO()
+    run_batch_parallel(io.StringIO('operation,date,interval,type_of_days\ncalc,28-02-2025,1,business\n'), output, calendar=calendar, workers=2)
+    assert output.getvalue().splitlines()[1] == 'calc,28-02-2025,1,business,04-03-2025,,'
+    with pytest.raises(ValueError):
+        run_batch_parallel(io.StringIO(''), output, workers=-1)
+
+def test_diff_matrix_files(tmp_path):
+    pytest.importorskip("numpy")
+    starts, ends = tmp_path / 'invoices.csv', tmp_path / 'payments.txt'
+    starts.write_text('invoice,amount\n01-01-2025,10\n\n15/01/2025,20\n2025-02-01,30\n', encoding='utf-8')
+    ends.write_text('10-01-2025\n01-03-2025\n', encoding='utf-8')
+    output = io.StringIO()
+    assert DefaultRunner().diff_matrix(starts, ends, 'csv', 'business', output) == (3, 2)
+    assert output.getvalue().splitlines() == ['date,10-01-2025,01-03-2025', '01-01-2025,7,43', '15-01-2025,0,33', '01-02-2025,0,20']
+    output = io.StringIO()
+    DefaultRunner().diff_matrix(starts, ends, 'json', destination=output)
+    assert json.loads(output.getvalue())[1] == {"date": "15-01-2025", "differences": [-5, 45]}
+    ends.write_text('10-01-2025\n32-01-2025\n', encoding='utf-8')
+    with pytest.raises(ValueError, match='line 2'):
+        DefaultRunner().diff_matrix(starts, ends)
+
+def test_diff_matrix_reports_the_header(tmp_path, capsys):
+    pytest.importorskip("numpy")
+    from date_calc.matrix import read_dates
+
+    headers = []
+    assert read_dates(['"date",amount\n', '01-01-2025,10\n'], on_header=headers.append) == [date(2025, 1, 1)]
+    assert headers == ['"date",amount']
+    with pytest.raises(ValueError, match='line 1'):  # a mistyped date is not a header
+        read_dates(['32-01-2025\n', '01-02-2025\n'])
+
+    starts, ends = tmp_path / 'invoices.csv', tmp_path / 'payments.txt'
+    starts.write_text('invoice\n01-01-2025\n', encoding='utf-8')
+    ends.write_text('10-01-2025\n', encoding='utf-8')
+    DefaultRunner().diff_matrix(starts, ends, destination=io.StringIO())
+    assert capsys.readouterr().err == f"{starts}: skipped the header line 'invoice'\n"
+
+def test_diff_matrix_without_numpy(tmp_path, capsys, monkeypatch):
+    from date_calc.__main__ import main
+
+    monkeypatch.setitem(sys.modules, 'numpy', None)
+    monkeypatch.delitem(sys.modules, 'date_calc.utils.vectorized', raising=False)
+    dates = tmp_path / 'dates.txt'
+    dates.write_text('01-01-2025\n', encoding='utf-8')
+    monkeypatch.setattr(sys, 'argv', ['dtcalc', 'diff', '--matrix', str(dates), str(dates)])
+    with pytest.raises(SystemExit) as exit_info:
+        main()
+    assert exit_info.value.code == 1
+    assert "pip install 'date-calc[batch]'" in capsys.readouterr().err
@@ -0,0 +1,151 @@
+import pytest
+from datetime import date, timedelta
+
+from date_calc.utils.business_calendar import BusinessCalendar, DEFAULT_CALENDAR, parse_weekmask
+from date_calc.utils.date_calculator import DateCalculator
+
+HOLIDAYS = [
+    date(2025, 1, 1), date(2025, 3, 3), date(2025, 3, 4), date(2025, 4, 18),
+    date(2025, 4, 21), date(2025, 5, 1), date(2025, 6, 19), date(2025, 9, 7),
+    date(2025, 10, 12), date(2025, 11, 2), date(2025, 11, 15), date(2025, 11, 20),
+    date(2025, 12, 25),
+]
+
+@pytest.fixture(scope='module')
+def calendar() -> BusinessCalendar:
+    return BusinessCalendar(HOLIDAYS, name='BR-2025')
+
+def _is_business_day(day: date) -> bool:
+    return day.weekday() < 5 and day not in HOLIDAYS
+
+def _business_days_by_loop(initial_date: date, final_date: date) -> int:
+    count = 0
+    while initial_date < final_date:
+        count += _is_business_day(initial_date)
+        initial_date += timedelta(days=1)
+    return count
+
+def _add_business_days_by_loop(initial_date: date, interval: int) -> date:
+    current_date = initial_date
+    days_added = 0
+    step = 1 if interval > 0 else -1
+    while days_added < abs(interval):
+        if current_date.weekday() <= 5:
+            days_added += 1
+        current_date += timedelta(days=step)
+        while not _is_business_day(current_date):
+            current_date += timedelta(days=step)
+    return current_date
+
+def test_default_calendar_has_no_holidays():
+    assert DEFAULT_CALENDAR.holidays == ()
+    assert DEFAULT_CALENDAR.is_business_day(date(2025, 1, 1))
+    assert not DEFAULT_CALENDAR.is_business_day(date(2025, 1, 4))
+
+def test_calendar_is_immutable(calendar: BusinessCalendar):
+    with pytest.raises(AttributeError):
+        calendar.name = 'other'  # type: ignore
+
+def test_weekend_holidays_are_ignored(calendar: BusinessCalendar):
+    assert date(2025, 9, 7) not in calendar.holidays  # Sunday
+    assert calendar == BusinessCalendar(reversed(HOLIDAYS + HOLIDAYS))
+
+def test_with_holidays(calendar: BusinessCalendar):
+    local = calendar.with_holidays([date(2025, 12, 8)], name='BR-PE-2025')
+    assert local.name == 'BR-PE-2025'
+    assert not local.is_business_day(date(2025, 12, 8))
+    assert calendar.is_business_day(date(2025, 12, 8))
+
+def test_business_days_with_holidays(calendar: BusinessCalendar):
+    for start in (date(2024, 12, 20), date(2025, 2, 28), date(2025, 4, 17), date(2025, 11, 14)):
+        for span in (-3, 0, 1, 3, 7, 12, 40, 400):
+            end = start + timedelta(days=span)
+            expected = _business_days_by_loop(start, end)
+            assert DateCalculator.business_days(initial_date=start, final_date=end, calendar=calendar) == expected
+
+def test_new_date_with_business_days_and_holidays(calendar: BusinessCalendar):
+    for offset in range(21):
+        start = date(2025, 2, 24) + timedelta(days=offset)
+        for interval in (-30, -7, -1, 1, 2, 5, 9, 250):
+            result = DateCalculator.new_date_with_interval_of_days(
+                initial_date=start,
+                interval=interval,
+                type_of_days="business",
+                calendar=calendar
+            )
+            assert result == _add_business_days_by_loop(start, interval), (start, interval)
+
+@pytest.mark.parametrize("weekmask,expected", [
+    (0b0011111, 0b0011111),
+    ("1111110", 0b0111111),
+    ("Sun Mon Tue Wed Thu", 0b1001111),
+    (["sunday", "monday", "tuesday", "wednesday", "thursday"], 0b1001111),
+    ("mon,tue,wed", 0b0000111),
+])
+def test_parse_weekmask(weekmask, expected):
+    assert parse_weekmask(weekmask) == expected
+
+@pytest.mark.parametrize("weekmask", [0, 128, "0000000", "Mon Funday", True])
+def test_parse_weekmask_rejects_invalid(weekmask):
+    with pytest.raises(ValueError):
+        parse_weekmask(weekmask)
+
+@pytest.mark.parametrize("weekmask", ["1111110", "Sun Mon Tue Wed Thu", "1010101", "1111111", "0000001"])
+def test_weekmask_matches_day_by_day_loop(weekmask):
+    calendar = BusinessCalendar(HOLIDAYS, weekmask=weekmask)
+    working = parse_weekmask(weekmask)
+    is_business_day = lambda day: bool(working >> day.weekday() & 1) and day not in HOLIDAYS
+
+    for offset in range(14):
+        start = date(2025, 2, 24) + timedelta(days=offset)
+        for delta in (-30, -8, -1, 1, 2, 6, 9, 100):
+            end = start + timedelta(days=delta)
+            expected = sum(is_business_day(start + timedelta(days=i)) for i in range(max(delta, 0)))
+            assert DateCalculator.business_days(initial_date=start, final_date=end, calendar=calendar) == expected
+
+            # a start that is neither a working day nor right after one costs an extra step
+            weekday = start.weekday()
+            steps = abs(delta) + (not working >> weekday & 1 and not working >> (weekday - 1) % 7 & 1)
+            step = 1 if delta > 0 else -1
+            current = start
+            while not is_business_day(current) and step < 0:
+                current += timedelta(days=1)
+            while not is_business_day(current) and step > 0:
+                current -= timedelta(days=1)
+            for _ in range(steps):
+                current += timedelta(days=step)
+                while not is_business_day(current):
+                    current += timedelta(days=step)
+            assert calendar.add_business_days(start, delta) == current, (weekmask, start, delta)
+
+def test_weekmask_per_calculation():
+    start, end = date(2025, 10, 5), date(2025, 10, 12)  # Sunday to Sunday
+    assert DateCalculator.business_days(initial_date=start, final_date=end) == 5
+    assert DateCalculator.business_days(initial_date=start, final_date=end, weekmask="1111110") == 6
+    result = DateCalculator.new_date_with_interval_of_days(
+        initial_date=date(2025, 10, 9), interval=1, type_of_days="business", weekmask="Sun Mon Tue Wed Thu"
+    )
+    assert result == date(2025, 10, 12)  # Thursday + 1 = Sunday
+
+def test_with_weekmask_keeps_holidays_on_new_working_days():
+    saturday = date(2025, 11, 15)
+    calendar = BusinessCalendar([saturday])
+    assert calendar.holidays == ()
+    six_days = calendar.with_weekmask("1111110")
+    assert six_days.holidays == (saturday,)
+    assert six_days is calendar.with_weekmask(0b0111111)
+
+def test_iter_business_days_skips_holidays(calendar: BusinessCalendar):
+    start, end = date(2025, 2, 20), date(2025, 5, 10)
+    expected = [start + timedelta(days=i) for i in range((end - start).days) if _is_business_day(start + timedelta(days=i))]
+    assert list(DateCalculator.iter_business_days(start, end, calendar=calendar)) == expected
+    assert list(DateCalculator.iter_business_days(end, start, -3, calendar=calendar)) == expected[:0:-1][::3]
+
+def test_roll_conventions_with_holidays():
+    # 2025-03-01 is a Saturday; Monday 03-03 and Tuesday 03-04 are holidays
+    calendar = BusinessCalendar([date(2025, 3, 3), date(2025, 3, 4)])
+    assert calendar.roll(date(2025, 3, 1), "following") == date(2025, 3, 5)
+    assert calendar.roll(date(2025, 3, 1), "preceding") == date(2025, 2, 28)
+    assert calendar.roll(date(2025, 3, 1), "modified_preceding") == date(2025, 3, 5)
+    assert calendar.roll(date(2025, 3, 3), "modified_following") == date(2025, 3, 5)
+    assert calendar.roll(date(2025, 3, 5), "preceding") == date(2025, 3, 5)
@@ -0,0 +1,89 @@
+import pickle
+import pytest
+from datetime import date, timedelta
+
+from date_calc.utils.business_calendar import BusinessCalendar
+from date_calc.utils.business_index import BusinessDayIndex
+from date_calc.utils.date_calculator import DateCalculator
+
+CALENDAR = BusinessCalendar([date(2025, 1, 1), date(2025, 3, 3), date(2025, 3, 4), date(2025, 4, 18)], name='BR')
+
+@pytest.fixture(scope='module')
+def index() -> BusinessDayIndex:
+    return BusinessDayIndex.build(CALENDAR, date(2024, 1, 1), date(2026, 12, 31))
+
+def test_build_covers_range(index: BusinessDayIndex):
+    assert index.first_date == date(2024, 1, 1)
+    assert index.last_date == date(2026, 12, 31)
+    assert index.calendar == CALENDAR
+
+def test_index_matches_calendar(index: BusinessDayIndex):
+    # ranges inside, across and outside the indexed range
+    for start in (date(2023, 12, 20), date(2024, 12, 28), date(2025, 2, 27), date(2026, 12, 30)):
+        for delta in (-40, -3, -1, 1, 2, 5, 30, 800):
+            end = start + timedelta(days=delta)
+            assert index.business_days_between(start, end) == CALENDAR.business_days_between(start, end)
+            assert index.add_business_days(start, delta) == CALENDAR.add_business_days(start, delta)
+            assert index.is_business_day(end) == CALENDAR.is_business_day(end)
+
+def test_calculator_accepts_index(index: BusinessDayIndex):
+    result = DateCalculator.new_date_with_interval_of_days(
+        initial_date=date(2025, 2, 28), interval=1, type_of_days="business", calendar=index
+    )
+    assert result == date(2025, 3, 5)
+    assert DateCalculator.business_days(initial_date=date(2025, 2, 28), final_date=date(2025, 3, 6), calendar=index) == 2
+
+def test_save_and_load(index: BusinessDayIndex, tmp_path):
+    path = tmp_path / 'feriados-2025.bdix'
+    index.save(path)
+    loaded = BusinessDayIndex.load(path)
+    assert loaded.calendar == CALENDAR
+    assert loaded.calendar.name == 'BR'
+    assert (loaded.first_date, loaded.last_date) == (index.first_date, index.last_date)
+    assert list(loaded.cumulative_counts) == list(index.cumulative_counts)
+    assert list(loaded.business_positions) == list(index.business_positions)
+    assert pickle.loads(pickle.dumps(loaded)).business_days_before(739_000) == index.business_days_before(739_000)
+
+def test_load_rejects_invalid_file(tmp_path):
+    path = tmp_path / 'broken.bdix'
+    path.write_bytes(b'not an index file at all, definitely not')
+    with pytest.raises(ValueError):
+        BusinessDayIndex.load(path)
+
+def test_load_rejects_truncated_file(index: BusinessDayIndex, tmp_path):
+    path = tmp_path / 'br.bdix'
+    index.save(path)
+    path.write_bytes(path.read_bytes()[:-4])
+    with pytest.raises(ValueError):
+        BusinessDayIndex.load(path)
+    path.unlink()  # the file is not held open by a leaked mapping
+
+def test_load_or_build_rebuilds_stale_index(index: BusinessDayIndex, tmp_path):
+    path = tmp_path / 'br.bdix'
+    index.save(path)
+    wider = BusinessDayIndex.load_or_build(path, CALENDAR, date(2020, 1, 1), date(2026, 12, 31))
+    assert wider.first_date == date(2020, 1, 1)
+    other = BusinessDayIndex.load_or_build(path, BusinessCalendar(), date(2024, 1, 1), date(2024, 12, 31))
+    assert other.calendar == BusinessCalendar()
+
+def test_index_keeps_weekmask(tmp_path):
+    calendar = CALENDAR.with_weekmask("Sun Mon Tue Wed Thu")
+    path = tmp_path / 'sun-thu.bdix'
+    BusinessDayIndex.build(calendar, date(2025, 1, 1), date(2025, 12, 31)).save(path)
+    loaded = BusinessDayIndex.load(path)
+    assert loaded.weekmask == calendar.weekmask
+    assert loaded.business_days_between(date(2025, 10, 5), date(2025, 10, 12)) == 5
+    assert loaded.add_business_days(date(2025, 10, 9), 1) == date(2025, 10, 12)
+
+def test_index_keeps_weekend_holidays(tmp_path):
+    calendar = BusinessCalendar([date(2025, 10, 11), date(2025, 10, 13)], name="weekend")  # Saturday, Monday
+    path = tmp_path / 'weekend.bdix'
+    BusinessDayIndex.build(calendar, date(2025, 1, 1), date(2025, 12, 31)).save(path)
+    loaded = BusinessDayIndex.load(path)
+    assert loaded.calendar.all_holiday_ordinals == calendar.all_holiday_ordinals
+    six_days = loaded.with_weekmask("1111110")
+    assert not six_days.is_business_day(date(2025, 10, 11))
+    assert six_days.business_days_between(date(2025, 10, 10), date(2025, 10, 14)) == 1
+    weekdays_only = BusinessCalendar([date(2025, 10, 13)])
+    rebuilt = BusinessDayIndex.load_or_build(path, weekdays_only, date(2025, 1, 1), date(2025, 12, 31))
+    assert rebuilt.calendar.all_holiday_ordinals == weekdays_only.all_holiday_ordinals
@@ -0,0 +1,77 @@
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+from date_calc.utils.business_calendar import BusinessCalendar
+from date_calc.utils.cache import CachedDateCalculator, LRUCache
+from date_calc.utils.date_calculator import DateCalculator
+
+def test_lru_cache_counts_hits_misses_and_evictions():
+    cache: LRUCache[int] = LRUCache(maxsize=2)
+    assert cache.get_or_compute('a', lambda: 1) == 1
+    assert cache.get_or_compute('a', lambda: 2) == 1
+    cache.get_or_compute('b', lambda: 2)
+    cache.get_or_compute('a', lambda: 0)  # 'a' becomes the most recently used
+    cache.get_or_compute('c', lambda: 3)  # evicts 'b'
+    assert cache.get_or_compute('b', lambda: 4) == 4
+
+    info = cache.info()
+    assert (info.hits, info.misses, info.evictions, info.currsize) == (2, 4, 2, 2)
+    assert info.hit_ratio == pytest.approx(2 / 6)
+
+    cache.clear()
+    assert cache.info() == (0, 0, 0, 2, 0)
+
+def test_lru_cache_get_and_put():
+    cache: LRUCache[int] = LRUCache(maxsize=1)
+    assert cache.get('a') is None and cache.get('a', -1) == -1
+    cache.put('a', 1)
+    assert cache.get('a') == 1
+    cache.put('b', 2)  # evicts 'a'
+    assert cache.get('a') is None
+    assert cache.info() == (1, 3, 1, 1, 1)
+
+def test_equal_calendars_share_cache_entries():
+    holidays = [date(2020, 1, 6) + timedelta(days=7 * week) for week in range(400)]
+    first, second = BusinessCalendar(holidays), BusinessCalendar(reversed(holidays), name="copy")
+    assert first == second and hash(first) == hash(second)
+    calculator = CachedDateCalculator()
+    for calendar in (first, second):
+        calculator.business_days(initial_date=date(2025, 1, 1), final_date=date(2026, 1, 1), calendar=calendar)
+    assert (calculator.cache_info().hits, calculator.cache_info().misses) == (1, 1)
+
+def test_lru_cache_rejects_invalid_size():
+    with pytest.raises(ValueError):
+        LRUCache(maxsize=0)
+
+def test_cached_calculator_matches_date_calculator():
+    calendar = BusinessCalendar([date(2025, 1, 1)])
+    calculator = CachedDateCalculator(maxsize=128)
+    for _ in range(3):
+        for offset in range(10):
+            start = date(2024, 12, 28) + timedelta(days=offset)
+            assert calculator.business_days(initial_date=start, final_date=date(2025, 3, 1), calendar=calendar) == \
+                DateCalculator.business_days(initial_date=start, final_date=date(2025, 3, 1), calendar=calendar)
+            assert calculator.new_date_with_interval_of_days(
+                initial_date=start, interval=7, type_of_days="business", weekmask="1111110"
+            ) == DateCalculator.new_date_with_interval_of_days(
+                initial_date=start, interval=7, type_of_days="business", weekmask="1111110"
+            )
+    info = calculator.cache_info()
+    assert (info.hits, info.misses) == (40, 20)
+
+def test_cached_calculator_is_thread_safe():
+    calculator = CachedDateCalculator(maxsize=50)
+    starts = [date(2025, 1, 1) + timedelta(days=i % 80) for i in range(4000)]
+
+    def query(start: date) -> int:
+        return calculator.business_days(initial_date=start, final_date=date(2025, 12, 31))
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(query, starts))
+
+    assert results == [DateCalculator.business_days(initial_date=s, final_date=date(2025, 12, 31)) for s in starts]
+    info = calculator.cache_info()
+    assert info.hits + info.misses == len(starts)
+    assert info.currsize == 50
+    assert 0 < info.evictions <= info.misses - 50
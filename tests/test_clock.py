@@ -0,0 +1,102 @@
+from datetime import date, datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from date_calc.utils.clock import Clock, DEFAULT_TIMEZONE, default_clock, get_zone
+from date_calc.utils.date_calculator import DateCalculator
+from date_calc.utils.vectorized import local_dates
+
+MIDNIGHT_UTC = datetime(2025, 10, 17, tzinfo=timezone.utc).timestamp()
+
+
+def test_zones_are_cached():
+    assert get_zone("America/Recife") is get_zone("America/Recife")
+    assert get_zone("utc") is timezone.utc
+    with pytest.raises(ValueError, match="Invalid timezone"):
+        get_zone("Mars/Olympus_Mons")
+
+
+def test_clock_uses_its_timezone_not_the_host():
+    fixed = lambda: MIDNIGHT_UTC
+    assert Clock("America/Recife", fixed).today() == date(2025, 10, 16)
+    assert Clock("Asia/Tokyo", fixed).today() == date(2025, 10, 17)
+    assert Clock("America/Recife", fixed).now().utcoffset() == timedelta(hours=-3)
+
+
+@pytest.fixture
+def fresh_default_clock(monkeypatch: pytest.MonkeyPatch):
+    config = pytest.importorskip("date_calc.config")
+    monkeypatch.setattr(config, "_SNAPSHOT", None)
+    default_clock.cache_clear()
+    yield config
+    default_clock.cache_clear()
+
+
+def _write_settings(tmp_path, timezone_name: str):
+    path = tmp_path.joinpath("settings.toml")
+    path.write_text(
+        "[default]\n"
+        f"DEFAULT_LOCALES_PATH = '{tmp_path.as_posix()}'\n"
+        f"ICON_PATH = '{tmp_path.as_posix()}'\n"
+        f"TIMEZONE = '{timezone_name}'\n",
+        encoding="utf-8",
+    )
+    return path
+
+
+def test_default_clock_follows_the_setting(fresh_default_clock, tmp_path, monkeypatch: pytest.MonkeyPatch):
+    pytest.importorskip("dynaconf")
+    monkeypatch.setattr(fresh_default_clock, "_SETTINGS_PATH", _write_settings(tmp_path, "Asia/Tokyo"))
+    assert default_clock() is default_clock()
+    assert str(default_clock().zone) == "Asia/Tokyo"
+
+
+def test_default_clock_ignores_invalid_settings_quietly(fresh_default_clock, tmp_path, monkeypatch, capsys, caplog):
+    pytest.importorskip("dynaconf")
+    monkeypatch.setattr(fresh_default_clock, "_SETTINGS_PATH", _write_settings(tmp_path, "Mars/Olympus_Mons"))
+    assert str(default_clock().zone) == DEFAULT_TIMEZONE
+    assert capsys.readouterr().err == ""
+    assert not [record for record in caplog.records if record.levelname in ("WARNING", "ERROR")]
+
+
+def test_days_until_uses_the_clock():
+    clock = Clock("America/Recife", lambda: MIDNIGHT_UTC)
+    assert DateCalculator.days_until(date(2025, 10, 20), clock) == 4
+    assert DateCalculator.days_until(date(2025, 10, 20), Clock("UTC", lambda: MIDNIGHT_UTC)) == 3
+
+
+@pytest.mark.parametrize("size", [20_000, 200])  # a dense and a sparse span of days
+@pytest.mark.parametrize("zone", ["America/Recife", "America/Sao_Paulo", "Europe/Berlin", "Australia/Lord_Howe", "UTC"])
+def test_local_dates_match_zoneinfo(zone, size):
+    rng = np.random.default_rng(7)
+    # a decade of timestamps, including the daylight saving transitions of the zones above
+    timestamps = rng.integers(946_684_800, 1_262_304_000, size=size).reshape(-1, 2)
+    tz = get_zone(zone)
+    expected = np.array([[datetime.fromtimestamp(int(t), tz).date() for t in row] for row in timestamps], dtype="datetime64[D]")
+    assert (local_dates(timestamps, zone) == expected).all()
+
+
+def test_local_dates_at_a_transition():
+    # Brazil's daylight saving time started at 00:00 local time on 2018-11-04 (03:00 UTC)
+    start = int(datetime(2018, 11, 4, 3, tzinfo=timezone.utc).timestamp())
+    result = local_dates([start - 1, start], "America/Sao_Paulo")
+    assert result.tolist() == [date(2018, 11, 3), date(2018, 11, 4)]
+
+
+def test_local_dates_units_and_datetime64():
+    seconds = np.array([MIDNIGHT_UTC - 1, MIDNIGHT_UTC + 3 * 3600])
+    expected = [date(2025, 10, 16), date(2025, 10, 17)]
+    assert local_dates(seconds, "America/Recife").tolist() == expected
+    assert local_dates((seconds * 1000).astype(np.int64), "America/Recife", unit="ms").tolist() == expected
+    assert local_dates(seconds.astype("datetime64[s]"), "America/Recife").tolist() == expected
+    assert local_dates(np.array([], dtype=np.int64), "UTC").dtype == np.dtype("datetime64[D]")
+    with pytest.raises(ValueError, match="Invalid unit"):
+        local_dates(seconds, "UTC", unit="h")  # type: ignore[arg-type]
+
+
+def test_local_dates_feed_business_days():
+    timestamps = np.array([MIDNIGHT_UTC - 1, MIDNIGHT_UTC])  # Thursday 20:59:59 and 21:00 in Recife, Friday in UTC
+    days = DateCalculator.local_dates_batch(timestamps, "America/Recife")
+    result = DateCalculator.business_days_batch(initial_dates=days, final_dates=days + np.timedelta64(7, "D"))
+    assert result.tolist() == [5, 5]
@@ -0,0 +1,93 @@
+import io
+import json
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("polib")
+
+from date_calc.runner import DefaultRunner
+from date_calc.translate import compile as compile_module
+from date_calc.translate.compile import MANIFEST_NAME, compile_po_2_mo
+from date_calc.translate.translate import CatalogRegistry, _DEFAULT_LOCALES_PATH
+
+
+@pytest.fixture
+def locales(tmp_path: Path) -> Path:
+    for lang in ("pt_BR", "es_ES", "fr_FR"):
+        folder = tmp_path.joinpath(lang, "LC_MESSAGES")
+        folder.mkdir(parents=True)
+        shutil.copy(_DEFAULT_LOCALES_PATH.joinpath("pt_BR", "LC_MESSAGES", "app.po"), folder)
+    return tmp_path
+
+
+def _touch(path: Path, seconds: int) -> None:
+    os.utime(path, ns=(seconds * 10**9, seconds * 10**9))
+
+
+def test_compiles_every_file(locales: Path):
+    summary = compile_po_2_mo(locales, workers=2)
+
+    assert (summary.compiled, summary.skipped, summary.failed) == (3, 0, 0)
+    assert all(result.seconds > 0 for result in summary.results)
+    assert CatalogRegistry(locales).gettext("fr_FR")("Calculate") == "Calcular"
+    manifest = json.loads(locales.joinpath(MANIFEST_NAME).read_text())
+    assert sorted(manifest) == [f"{lang}/LC_MESSAGES/app.po" for lang in ("es_ES", "fr_FR", "pt_BR")]
+    assert not list(locales.rglob("*.tmp"))
+
+
+def test_few_files_skip_the_process_pool(locales: Path, monkeypatch: pytest.MonkeyPatch):
+    def no_pool(*args, **kwargs):
+        raise AssertionError("a process pool was started")
+
+    monkeypatch.setattr(compile_module, "ProcessPoolExecutor", no_pool)
+    summary = compile_po_2_mo(locales)
+
+    assert (summary.compiled, summary.skipped, summary.failed) == (3, 0, 0)
+
+
+def test_unchanged_tree_is_skipped(locales: Path):
+    compile_po_2_mo(locales, workers=1)
+    summary = compile_po_2_mo(locales, workers=1)
+
+    assert (summary.compiled, summary.skipped, summary.failed) == (0, 3, 0)
+
+
+def test_only_changed_files_are_compiled(locales: Path):
+    compile_po_2_mo(locales, workers=1)
+    for po_file in locales.rglob("*.po"):
+        _touch(po_file.with_suffix(".mo"), 1_000)
+        _touch(po_file, 2_000)  # newer than its .mo, but unchanged: the manifest hash matches
+    changed = locales.joinpath("es_ES", "LC_MESSAGES", "app.po")
+    changed.write_text(changed.read_text(encoding="utf-8").replace('msgstr "Calcular"', 'msgstr "Calcula"'), encoding="utf-8")
+
+    summary = compile_po_2_mo(locales, workers=1)
+
+    assert [result.status for result in summary.results] == ["compiled", "skipped", "skipped"]
+    assert CatalogRegistry(locales).gettext("es_ES")("Calculate") == "Calcula"
+
+
+def test_force_and_failures(locales: Path):
+    compile_po_2_mo(locales, workers=1)
+    locales.joinpath("pt_BR", "LC_MESSAGES", "broken.po").write_text("not a po file\n", encoding="utf-8")
+
+    summary = compile_po_2_mo(locales, workers=2, force=True)
+
+    assert (summary.compiled, summary.skipped, summary.failed) == (3, 0, 1)
+    failed = next(result for result in summary.results if result.status == "failed")
+    assert failed.po_file.name == "broken.po" and failed.error
+    assert "pt_BR/LC_MESSAGES/broken.po" not in json.loads(locales.joinpath(MANIFEST_NAME).read_text())
+
+
+def test_runner_reports_timings_and_summary(locales: Path):
+    output = io.StringIO()
+    DefaultRunner().compile_translations(locales, workers=1, destination=output)
+    DefaultRunner().compile_translations(locales, workers=1, destination=output)
+    lines = output.getvalue().splitlines()
+
+    assert lines[0].startswith("compiled  es_ES/LC_MESSAGES/app.po") and lines[0].endswith(" ms")
+    assert lines[3].startswith("3 compiled, 0 skipped, 0 failed in ")
+    assert lines[4] == "skipped   es_ES/LC_MESSAGES/app.po"
+    assert lines[7].startswith("0 compiled, 3 skipped, 0 failed in ")
@@ -0,0 +1,136 @@
+import logging
+import os
+import threading
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("dynaconf")
+
+from date_calc import config
+from date_calc.config import SettingsSnapshot, load_settings_snapshot
+from date_calc.exceptions import ConfigurationError
+
+
+@pytest.fixture
+def settings_file(tmp_path: Path) -> Path:
+    folder = tmp_path.joinpath("assets")
+    folder.mkdir()
+    path = tmp_path.joinpath("settings.toml")
+    path.write_text(
+        "[default]\n"
+        f"DEFAULT_LOCALES_PATH = '{folder.as_posix()}'\n"
+        f"ICON_PATH = '{folder.as_posix()}'\n"
+        "TIMEZONE = 'America/Recife'\n"
+        "LOG_LEVEL = 'INFO'\n",
+        encoding="utf-8",
+    )
+    return path
+
+
+@pytest.fixture
+def full_loads(monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+    calls = []
+    load = config._load_dynaconf
+
+    def counting_load(settings_path, quiet=False):
+        calls.append(settings_path)
+        return load(settings_path, quiet=quiet)
+
+    monkeypatch.setattr(config, "_load_dynaconf", counting_load)
+    return calls
+
+
+def test_snapshot_is_reused(settings_file: Path, tmp_path: Path, full_loads: list[Path]):
+    cache = tmp_path.joinpath("cache", "settings.json")
+    first = load_settings_snapshot(settings_file, cache)
+    second = load_settings_snapshot(settings_file, cache)
+
+    assert len(full_loads) == 1
+    assert cache.exists()
+    assert second == first
+    assert second.log_level == "INFO" and second["TIMEZONE"] == "America/Recife"
+    assert isinstance(second.ICON_PATH, Path)
+    assert second.current_env == first.current_env
+
+
+def test_snapshot_is_stale_after_settings_change(settings_file: Path, tmp_path: Path, full_loads: list[Path]):
+    cache = tmp_path.joinpath("settings.json")
+    load_settings_snapshot(settings_file, cache)
+    settings_file.write_text(settings_file.read_text().replace("'INFO'", "'WARNING'"), encoding="utf-8")
+    os.utime(settings_file, ns=(0, 1))
+
+    assert load_settings_snapshot(settings_file, cache).LOG_LEVEL == "WARNING"
+    assert len(full_loads) == 2
+
+
+def test_snapshot_is_stale_after_environment_change(
+        settings_file: Path, tmp_path: Path, full_loads: list[Path], monkeypatch: pytest.MonkeyPatch):
+    cache = tmp_path.joinpath("settings.json")
+    load_settings_snapshot(settings_file, cache)
+    monkeypatch.setenv("DTC_LOG_LEVEL", "ERROR")
+
+    assert load_settings_snapshot(settings_file, cache).LOG_LEVEL == "ERROR"
+    assert load_settings_snapshot(settings_file, cache).LOG_LEVEL == "ERROR"
+    assert len(full_loads) == 2
+
+
+def test_corrupt_snapshot_is_replaced(settings_file: Path, tmp_path: Path, full_loads: list[Path]):
+    cache = tmp_path.joinpath("settings.json")
+    cache.write_text("{not json", encoding="utf-8")
+
+    assert load_settings_snapshot(settings_file, cache).LOG_LEVEL == "INFO"
+    assert load_settings_snapshot(settings_file, cache).LOG_LEVEL == "INFO"
+    assert len(full_loads) == 1
+
+
+def test_failure_is_recorded_for_quiet_loads(
+        settings_file: Path, tmp_path: Path, full_loads: list[Path], caplog: pytest.LogCaptureFixture):
+    cache = tmp_path.joinpath("settings.json")
+    settings_file.write_text(settings_file.read_text().replace("America/Recife", "Mars/Olympus_Mons"), encoding="utf-8")
+
+    for _ in range(2):
+        with pytest.raises(ConfigurationError):
+            load_settings_snapshot(settings_file, cache, quiet=True)
+    assert len(full_loads) == 1
+    assert not [record for record in caplog.records if record.levelno >= logging.WARNING]
+
+    with pytest.raises(ConfigurationError):  # a normal load tries again, and reports it
+        load_settings_snapshot(settings_file, cache)
+    assert len(full_loads) == 2
+    assert [record.exc_info is not None for record in caplog.records if record.levelno >= logging.ERROR] == [True]
+
+
+def test_snapshot_is_immutable():
+    snapshot = SettingsSnapshot({"log_level": "INFO"}, "DEFAULT")
+
+    assert snapshot["LOG_LEVEL"] == snapshot.log_level == snapshot.get("Log_Level") == "INFO"
+    with pytest.raises(AttributeError):
+        snapshot.LOG_LEVEL = "DEBUG"
+    with pytest.raises(TypeError):
+        snapshot["LOG_LEVEL"] = "DEBUG"  # type: ignore[index]
+    with pytest.raises(AttributeError):
+        snapshot.TIMEZONE
+
+
+def test_get_settings_loads_once_across_threads(
+        settings_file: Path, tmp_path: Path, full_loads: list[Path], monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(config, "_SNAPSHOT", None)
+    monkeypatch.setattr(config, "_SETTINGS_PATH", settings_file)
+    monkeypatch.setenv("DTCALC_CACHE_DIR", str(tmp_path))
+    barrier = threading.Barrier(8)
+    results = []
+
+    def worker():
+        barrier.wait()
+        results.append(config.get_settings())
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(full_loads) == 1
+    assert all(result is results[0] for result in results)
+    assert tmp_path.joinpath("settings.json").exists()
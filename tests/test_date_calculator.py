@@ -1,7 +1,8 @@
 import pytest
-from datetime import datetime
+from datetime import date, datetime, timedelta
 
 from date_calc.utils.date_calculator import DateCalculator
+from date_calc.utils.date_column import DateColumn, OrdinalDate
 
 def test_add_days():
     start_date = datetime(2023, 1, 1)
@@ -15,6 +16,29 @@ def test_business_days():
     result = DateCalculator.business_days(initial_date=initial_date, final_date=final_date)
     assert result == 6  # 6 business days between Jan 1 and Jan 10, 2023
 
+def _business_days_by_loop(initial_date: date, final_date: date) -> int:
+    """Day-by-day reference implementation used before the closed form."""
+    count = 0
+    while initial_date < final_date:
+        if initial_date.weekday() < 5:
+            count += 1
+        initial_date += timedelta(days=1)
+    return count
+
+@pytest.mark.parametrize("span", [-8, -1, 0, 1, 2, 5, 6, 7, 8, 13, 14, 15, 30, 365, 400])
+def test_business_days_matches_day_by_day_loop(span):
+    for offset in range(14):  # every weekday as a start, twice
+        initial_date = date(2024, 12, 23) + timedelta(days=offset)
+        final_date = initial_date + timedelta(days=span)
+        expected = _business_days_by_loop(initial_date, final_date)
+        assert DateCalculator.business_days(initial_date=initial_date, final_date=final_date) == expected
+
+def test_business_days_long_span():
+    initial_date = date(1995, 3, 15)
+    final_date = date(2025, 3, 15)
+    expected = _business_days_by_loop(initial_date, final_date)
+    assert DateCalculator.business_days(initial_date=initial_date, final_date=final_date) == expected
+
 def test_consecutive_days():
     initial_date = datetime(2023, 1, 1).date()
     final_date = datetime(2023, 1, 10).date()
@@ -56,3 +80,107 @@ def test_new_date_with_business_days_negative_interval(initial_date, interval, e
         type_of_days="business"
     )
     assert result == expected_date
+
+def _new_business_date_by_loop(initial_date: date, interval: int) -> date:
+    """Day-by-day reference implementation used before the arithmetic offset."""
+    current_date = initial_date
+    days_added = 0
+    step = 1 if interval > 0 else -1
+    while days_added < abs(interval):
+        if current_date.weekday() <= 5:
+            days_added += 1
+        current_date += timedelta(days=step)
+        while current_date.weekday() >= 5:
+            current_date += timedelta(days=step)
+    return current_date
+
+@pytest.mark.parametrize("interval", [-26, -11, -6, -5, -4, -1, 0, 1, 2, 4, 5, 6, 10, 11, 27])
+def test_new_date_with_business_days_matches_day_by_day_loop(interval):
+    for offset in range(14):  # every weekday as a start, twice
+        initial_date = date(2024, 12, 23) + timedelta(days=offset)
+        result = DateCalculator.new_date_with_interval_of_days(
+            initial_date=initial_date,
+            interval=interval,
+            type_of_days="business"
+        )
+        assert result == _new_business_date_by_loop(initial_date, interval)
+
+@pytest.mark.parametrize("interval", [-10_000, 10_000])
+def test_new_date_with_large_business_interval(interval):
+    initial_date = date(2025, 10, 12)  # Sunday
+    result = DateCalculator.new_date_with_interval_of_days(
+        initial_date=initial_date,
+        interval=interval,
+        type_of_days="business"
+    )
+    assert result == _new_business_date_by_loop(initial_date, interval)
+
+def test_iter_business_days():
+    days = list(DateCalculator.iter_business_days(date(2025, 10, 10), date(2025, 10, 21)))
+    assert days == [date(2025, 10, d) for d in (10, 13, 14, 15, 16, 17, 20)]
+    assert len(days) == DateCalculator.business_days(initial_date=date(2025, 10, 10), final_date=date(2025, 10, 21))
+
+    every_other = DateCalculator.iter_business_days(date(2025, 10, 10), date(2025, 10, 21), 2)
+    assert list(every_other) == days[::2]
+
+    backward = DateCalculator.iter_business_days(date(2025, 10, 20), date(2025, 10, 10), -1)
+    assert list(backward) == days[:0:-1]
+
+    assert list(DateCalculator.iter_business_days(date(2025, 10, 21), date(2025, 10, 10))) == []
+    with pytest.raises(ValueError):
+        DateCalculator.iter_business_days(date(2025, 10, 10), date(2025, 10, 21), 0)
+
+def test_iter_business_days_is_lazy():
+    days = DateCalculator.iter_business_days(date(2000, 1, 1), date(9999, 1, 1))
+    assert next(days) == date(2000, 1, 3)
+    assert next(days) == date(2000, 1, 4)
+
+def test_iter_business_day_chunks():
+    chunks = list(DateCalculator.iter_business_day_chunks(date(2025, 1, 1), date(2025, 2, 1), 10))
+    assert [len(chunk) for chunk in chunks] == [10, 10, 3]
+    flat = [view.date() for chunk in chunks for view in chunk]
+    assert flat == list(DateCalculator.iter_business_days(date(2025, 1, 1), date(2025, 2, 1)))
+    with pytest.raises(ValueError):
+        DateCalculator.iter_business_day_chunks(date(2025, 1, 1), date(2025, 2, 1), 0)
+
+@pytest.mark.parametrize("initial_date, months, end_of_month, expected", [
+    (date(2025, 1, 31), 1, False, date(2025, 2, 28)),
+    (date(2024, 1, 31), 1, False, date(2024, 2, 29)),
+    (date(2025, 2, 28), 1, False, date(2025, 3, 28)),
+    (date(2025, 2, 28), 1, True, date(2025, 3, 31)),
+    (date(2025, 4, 30), -2, True, date(2025, 2, 28)),
+    (date(2025, 4, 29), -2, True, date(2025, 2, 28)),
+    (date(2025, 11, 15), 14, False, date(2027, 1, 15)),
+    (date(2025, 1, 15), -13, False, date(2023, 12, 15)),
+])
+def test_add_months(initial_date, months, end_of_month, expected):
+    assert DateCalculator.add_months(initial_date, months, end_of_month=end_of_month) == expected
+
+def test_add_years():
+    assert DateCalculator.add_years(date(2024, 2, 29), 1) == date(2025, 2, 28)
+    assert DateCalculator.add_years(date(2023, 2, 28), 1, end_of_month=True) == date(2024, 2, 29)
+    assert DateCalculator.add_years(datetime(2024, 2, 29, 12), -4) == datetime(2020, 2, 29, 12)
+    with pytest.raises(ValueError):
+        DateCalculator.add_years(date(9999, 1, 1), 1)
+
+@pytest.mark.parametrize("roll, expected", [
+    ("following", date(2025, 6, 2)),
+    ("modified_following", date(2025, 5, 30)),
+    ("preceding", date(2025, 5, 30)),
+    ("modified_preceding", date(2025, 5, 30)),
+])
+def test_add_months_rolls_to_business_day(roll, expected):
+    # 2025-05-31 is a Saturday
+    assert DateCalculator.add_months(date(2025, 3, 31), 2, roll=roll) == expected
+
+def test_add_months_keeps_ordinal_dates():
+    initial = DateColumn.from_dates([date(2020, 1, 31)])[0]
+    result = DateCalculator.add_months(initial, 1)
+    assert isinstance(result, OrdinalDate) and result == date(2020, 2, 29)
+    assert DateCalculator.add_years(result, 1, end_of_month=True) == date(2021, 2, 28)
+    assert DateCalculator.add_months(DateColumn.from_dates([date(2025, 3, 31)])[0], 2, roll="following") == date(2025, 6, 2)
+
+def test_add_months_roll_keeps_business_days_and_rejects_unknown_convention():
+    assert DateCalculator.add_months(date(2025, 3, 3), 1, roll="following") == date(2025, 4, 3)
+    with pytest.raises(ValueError):
+        DateCalculator.add_months(date(2025, 3, 1), 1, roll="nearest")
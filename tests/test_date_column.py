@@ -0,0 +1,62 @@
+import pickle
+import pytest
+from datetime import date, datetime, timedelta
+
+from date_calc.utils.date_calculator import DateCalculator
+from date_calc.utils.date_column import DateColumn, OrdinalDate
+
+def test_ordinal_date_behaves_like_date():
+    view = OrdinalDate.from_date(date(2025, 10, 17))
+    assert view == date(2025, 10, 17) and date(2025, 10, 17) == view
+    assert (view.year, view.month, view.day, view.weekday()) == (2025, 10, 17, 4)
+    assert view + timedelta(days=3) == date(2025, 10, 20)
+    assert view - date(2025, 10, 1) == timedelta(days=16)
+    assert date(2025, 10, 1) < view <= date(2025, 10, 17)
+    assert view.isoformat() == '2025-10-17'
+
+def test_ordinal_date_hashes_and_compares_like_date():
+    view = OrdinalDate.from_date(date(2025, 10, 17))
+    assert hash(view) == hash(date(2025, 10, 17))
+    assert {view, date(2025, 10, 17)} == {date(2025, 10, 17)}
+    assert {date(2025, 10, 17): "friday"}[view] == "friday"
+    assert view != datetime(2025, 10, 17) and view != "2025-10-17"
+    for operand in ("2025-10-17", 739541, datetime(2025, 10, 17)):
+        with pytest.raises(TypeError):
+            view < operand  # type: ignore[operator]
+        with pytest.raises(TypeError):
+            operand >= view  # type: ignore[operator]
+
+def test_calculator_accepts_ordinal_dates():
+    start, end = OrdinalDate.from_date(date(2025, 10, 11)), OrdinalDate.from_date(date(2025, 11, 3))
+    assert DateCalculator.business_days(initial_date=start, final_date=end) == 15
+    assert DateCalculator.date_difference(start, end) == 23
+    assert DateCalculator.add_days(start, 2) == date(2025, 10, 13)
+    result = DateCalculator.new_date_with_interval_of_days(initial_date=start, interval=1, type_of_days="business")
+    assert isinstance(result, OrdinalDate) and result == date(2025, 10, 13)
+
+def test_date_column_storage_and_views():
+    column = DateColumn.range(date(2025, 1, 1), date(2026, 1, 1))
+    assert len(column) == 365
+    assert column.nbytes == 365 * 4
+    assert column[0] == date(2025, 1, 1) and column[-1] == date(2025, 12, 31)
+    assert column[1:3].to_dates() == [date(2025, 1, 2), date(2025, 1, 3)]
+    assert DateColumn.from_dates(column) == column
+    assert DateColumn.from_buffer(column.ordinals) == column
+    assert 'length=365' in repr(column)
+
+def test_date_column_append_and_extend():
+    column = DateColumn()
+    column.append(date(2025, 1, 1))
+    column.extend([datetime(2025, 1, 2), OrdinalDate(739253)])
+    assert column.to_dates() == [date(2025, 1, 1), date(2025, 1, 2), date.fromordinal(739253)]
+
+def test_date_column_in_batch_methods():
+    pytest.importorskip("numpy")
+    starts = DateColumn.range(date(2025, 1, 1), date(2025, 3, 1))
+    ends = DateColumn.from_dates(d + timedelta(days=40) for d in starts)
+    counts = DateCalculator.business_days_batch(initial_dates=starts, final_dates=ends)
+    new_dates = DateCalculator.new_date_with_interval_of_days_batch(initial_dates=starts, intervals=10, type_of_days="business")
+    assert isinstance(new_dates, DateColumn)
+    for start, end, count, new_date in zip(starts, ends, counts, new_dates):
+        assert count == DateCalculator.business_days(initial_date=start, final_date=end)
+        assert new_date == DateCalculator.new_date_with_interval_of_days(initial_date=start, interval=10, type_of_days="business")
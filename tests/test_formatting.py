@@ -0,0 +1,48 @@
+import locale
+import pytest
+from datetime import date, datetime, timedelta
+
+from date_calc.utils.formatting import DateFormatter, compile_pattern, format_date
+
+DATES = [date(2024, 1, 1) + timedelta(days=n) for n in range(0, 731, 13)]
+PATTERN = "%A, %d de %B de %Y (%a %b %y, day %j) 100%%"
+
+@pytest.fixture
+def time_locale():
+    """Switch LC_TIME for one test and restore it afterwards."""
+    previous = locale.setlocale(locale.LC_TIME)
+    def use(name: str) -> None:
+        try:
+            locale.setlocale(locale.LC_TIME, name)
+        except locale.Error:
+            pytest.skip(f"locale {name} is not installed")
+    yield use
+    locale.setlocale(locale.LC_TIME, previous)
+
+def test_en_us_matches_strftime(time_locale):
+    time_locale("C")
+    formatter = DateFormatter(PATTERN, "en_US")
+    assert [formatter(day) for day in DATES] == [day.strftime(PATTERN) for day in DATES]
+
+@pytest.mark.parametrize("name", ["pt_BR.UTF-8", "pt_BR.utf8"])
+def test_pt_br_matches_strftime(time_locale, name):
+    time_locale(name)
+    formatter = DateFormatter(PATTERN, "pt_BR")
+    assert [formatter(day) for day in DATES] == [day.strftime(PATTERN) for day in DATES]
+
+def test_pt_br_does_not_depend_on_the_process_locale(time_locale):
+    time_locale("C")
+    assert format_date(date(2025, 3, 1), "%A, %d de %B de %Y").capitalize() == "Sábado, 01 de março de 2025"
+    assert format_date(datetime(2025, 10, 17, 12), "%d-%m-%Y -> %A") == "17-10-2025 -> sexta-feira"
+
+def test_compile_pattern():
+    day, separator, month = compile_pattern("%d-%m")
+    assert (day(date(2025, 1, 2)), separator, month(date(2025, 1, 2))) == ("02", "-", "01")
+    assert compile_pattern("100%% done") == ("100% done",)
+    assert DateFormatter("{v.__class__} %d")(date(2025, 1, 2)) == "{v.__class__} 02"
+    assert DateFormatter("{%d} \\ '%%'")(date(2025, 1, 2)) == "{02} \\ '%'"
+    assert DateFormatter("")(date(2025, 1, 2)) == ""
+    with pytest.raises(ValueError, match="Unsupported directive"):
+        compile_pattern("%H:%M")
+    with pytest.raises(ValueError, match="Unsupported language"):
+        DateFormatter("%d", "fr_FR")  # type: ignore[arg-type]
@@ -0,0 +1,72 @@
+import io
+import json
+import pytest
+
+from date_calc.exceptions import CalculationError
+from date_calc.output import JsonRecordWriter, RecordWriter, error_record, open_writer
+
+FIELDS = ["date", "result", "error"]
+RECORDS = [
+    {"date": "01-01-2025", "result": "06-01-2025", "error": None},
+    {"date": "x", "result": None, "error": {"code": "invalid_value", "message": "Invalid date: 'x'."}},
+]
+
+def write(output_format, records=RECORDS, **options):
+    output = io.StringIO()
+    with open_writer(output_format, output, FIELDS, **options) as writer:
+        for record in records:
+            writer.write(record)
+    return output.getvalue()
+
+def test_error_record():
+    assert error_record(CalculationError("same_dates", "The dates are the same.")) == {"code": "same_dates", "message": "The dates are the same."}
+    assert error_record(ValueError("bad"))["code"] == "invalid_value"
+    assert error_record(OverflowError("date value out of range"))["code"] == "out_of_range"
+
+def test_csv_writer_flattens_the_error():
+    assert write("csv").splitlines() == [
+        "date,result,error_code,error_message",
+        "01-01-2025,06-01-2025,,",
+        "x,,invalid_value,Invalid date: 'x'.",
+    ]
+    assert write("csv", fragment=True).count("\n") == 2
+
+def test_ndjson_and_json_writers():
+    assert [json.loads(line) for line in write("ndjson").splitlines()] == RECORDS
+    assert json.loads(write("json")) == RECORDS
+    assert json.loads(write("json", [])) == []
+
+def test_json_fragments_join_into_one_array():
+    output = io.StringIO()
+    with open_writer("json", output, FIELDS) as writer:
+        for records in (RECORDS, [], RECORDS[:1]):
+            writer.write_fragment(write("json", records, fragment=True))
+    assert json.loads(output.getvalue()) == RECORDS + RECORDS[:1]
+
+def test_json_object_holds_a_single_record():
+    output = io.StringIO()
+    writer = JsonRecordWriter(output, FIELDS, array=False)
+    writer.write(RECORDS[0])
+    assert json.loads(output.getvalue()) == RECORDS[0]
+    with pytest.raises(ValueError):
+        writer.write(RECORDS[1])
+
+def test_open_writer_rejects_unknown_formats():
+    with pytest.raises(ValueError):
+        open_writer("xml", io.StringIO(), FIELDS)
+
+def test_runner_records():
+    from datetime import datetime, timedelta
+    from date_calc.runner import DefaultRunner
+
+    runner = DefaultRunner()
+    record = runner.sum_record(datetime(2025, 1, 30), timedelta(days=5))
+    assert (record["result"], record["weekday"], record["error"]) == ("04-02-2025", "terça-feira", None)
+    assert runner.sum_record(datetime(9999, 12, 31), timedelta(days=1))["error"]["code"] == "out_of_range"
+    assert runner.diff_record(datetime(2025, 1, 1), datetime(2025, 2, 1))["result"] == 31
+    assert runner.diff_record(datetime(2025, 1, 1), datetime(2025, 1, 1))["error"]["code"] == "same_dates"
+    assert runner.diff(datetime(2025, 1, 2), datetime(2025, 1, 1)) == "Start date must be before end date."
+
+def test_record_writer_is_abstract():
+    with pytest.raises(TypeError):
+        RecordWriter(io.StringIO(), ["result"])  # type: ignore[abstract]
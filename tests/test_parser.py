@@ -6,6 +6,7 @@ from datetime import datetime, timedelta
 
 from date_calc.cli import create_parser
 from date_calc.translate.translate import _DEFAULT_LOCALES_PATH
+from date_calc.utils.clock import default_clock
 
 @pytest.fixture(scope='module')
 def parser() -> ArgumentParser:
@@ -33,4 +34,39 @@ def test_arg_diff_parsing(parser: ArgumentParser):
 def test_arg_complile_parsing(parser: ArgumentParser):
     args: Namespace = parser.parse_args(shlex.split('compile'))
     assert args.command == 'compile'
-    assert args.path == _DEFAULT_LOCALES_PATH
\ No newline at end of file
+    assert args.path == _DEFAULT_LOCALES_PATH
+def test_arg_batch_parsing(parser: ArgumentParser):
+    args: Namespace = parser.parse_args(shlex.split('batch rows.ndjson -o out.ndjson'))
+    assert (args.command, args.input, args.output, args.input_format) == ('batch', 'rows.ndjson', 'out.ndjson', None)
+    args = parser.parse_args(shlex.split('batch --input-format ndjson'))
+    assert (args.input, args.output, args.input_format) == ('-', '-', 'ndjson')
+
+def test_arg_batch_workers(parser: ArgumentParser):
+    assert parser.parse_args(shlex.split('batch rows.csv')).workers == 1
+    assert parser.parse_args(shlex.split('batch rows.csv --workers 8')).workers == 8
+    with pytest.raises(SystemExit):
+        parser.parse_args(shlex.split('batch rows.csv --workers -2'))
+
+def test_arg_dates_formats_and_keywords(parser: ArgumentParser):
+    assert parser.parse_args(shlex.split('diff 01/01/2020 2020-01-10')).end == datetime(2020, 1, 10)
+    today = datetime.combine(default_clock().today(), datetime.min.time())
+    assert parser.parse_args(shlex.split('calc today 5')).date == today
+    assert parser.parse_args(shlex.split('calc . 5')).date == today
+
+def test_arg_output_formats(parser: ArgumentParser):
+    assert parser.parse_args(shlex.split('calc 01-01-2020 5')).format == 'text'
+    assert parser.parse_args(shlex.split('diff 01-01-2020 10-01-2020 --format ndjson')).format == 'ndjson'
+    assert parser.parse_args(shlex.split('batch rows.csv')).format is None
+    assert parser.parse_args(shlex.split('batch rows.csv -f json')).format == 'json'
+    with pytest.raises(SystemExit):
+        parser.parse_args(shlex.split('batch rows.csv -f text'))
+
+def test_arg_diff_matrix(parser: ArgumentParser):
+    args = parser.parse_args(shlex.split('diff --matrix invoices.csv payments.csv -t business'))
+    assert (args.start, args.end, args.matrix, args.type_of_days) == (None, None, ['invoices.csv', 'payments.csv'], 'business')
+
+def test_arg_compile_options(parser: ArgumentParser):
+    args = parser.parse_args(shlex.split('compile'))
+    assert (args.workers, args.force) == (0, False)
+    args = parser.parse_args(shlex.split('compile --workers 4 --force'))
+    assert (args.workers, args.force) == (4, True)
@@ -0,0 +1,45 @@
+import pytest
+from datetime import date
+
+from date_calc.utils.clock import default_clock
+from date_calc.utils.parsing import DateParser, detect_format, parse_date
+
+@pytest.mark.parametrize("value, expected_format", [
+    ("17-10-2025", "DD-MM-YYYY"),
+    ("17/10/2025", "DD/MM/YYYY"),
+    ("2025-10-17", "YYYY-MM-DD"),
+])
+def test_detect_and_parse(value, expected_format):
+    assert detect_format(value) == expected_format
+    assert parse_date(value) == date(2025, 10, 17)
+
+@pytest.mark.parametrize("value", ["1-2-2025", "01/2/2025", "2025-2-1", " 01-02-2025 "])
+def test_parse_date_accepts_unpadded_values(value):
+    assert parse_date(value) == date(2025, 2, 1)
+
+@pytest.mark.parametrize("value", ["", "32-01-2025", "29-02-2025", "2025/10/17", "17-10/2025", "+1-02-2025", "17-10-25", "abc"])
+def test_parse_date_rejects_invalid_values(value):
+    with pytest.raises(ValueError, match="Invalid date"):
+        parse_date(value)
+
+@pytest.mark.parametrize("keyword", ["today", "NOW", "hoje", "."])
+def test_today_keywords(keyword):
+    assert parse_date(keyword) == default_clock().today()
+
+def test_date_parser_detects_the_format_once():
+    parse = DateParser()
+    assert parse.date_format is None
+    assert parse("today") == default_clock().today()
+    assert parse.date_format is None
+    assert parse("17/10/2025") == date(2025, 10, 17)
+    assert parse.date_format == "DD/MM/YYYY"
+    # other formats still parse, without changing the format of the stream
+    assert parse("2025-10-18") == date(2025, 10, 18)
+    assert parse.date_format == "DD/MM/YYYY"
+    with pytest.raises(ValueError):
+        parse("31/02/2025")
+
+def test_date_parser_with_a_given_format():
+    parse = DateParser("YYYY-MM-DD", cache_size=2)
+    assert [parse(f"2025-01-{day:02d}") for day in range(1, 4)] == [date(2025, 1, day) for day in range(1, 4)]
+    assert parse.date_format == "YYYY-MM-DD"
@@ -0,0 +1,41 @@
+import io
+import time
+
+from date_calc.repl import DateCalcShell
+from date_calc.runner import DefaultRunner
+
+def run_shell(text: str) -> list[str]:
+    output = io.StringIO()
+    DefaultRunner().enter_interactive_mode(io.StringIO(text), output)
+    return output.getvalue().splitlines()
+
+def test_piped_commands():
+    lines = run_shell(
+        "calc 06-10-2025 25 business\n"
+        "\n"
+        "diff 01-01-2025 01-02-2025\n"
+        "diff 01-01-2025 01-02-2025 business\n"
+        "quit\n"
+        "diff 01-01-2025 01-02-2025\n"
+    )
+    assert lines[0].startswith("Resulting date: 10-11-2025 -> ")
+    assert lines[1:] == ["Difference in days: 31", "Difference in days: 23"]
+
+def test_errors_do_not_stop_the_shell():
+    lines = run_shell("calc 32-01-2025 1\ncalc 01-01-2025\nsum 1 2\ndiff 01-01-2025 01-02-2025 weekly\ncalc 01-01-2025 x\ndiff 02-01-2025 01-01-2025\n")
+    assert lines[0] == "Invalid date: '32-01-2025'. Use DD-MM-YYYY."
+    assert lines[1] == "Usage: calc DATE DAYS [business|consecutive]"
+    assert lines[2].startswith("Unknown command: 'sum'")
+    assert lines[3] == "Usage: diff START_DATE END_DATE [business|consecutive]"
+    assert lines[4].startswith("'Days' parameter provided(x)")
+    assert lines[5] == "Difference in days: Start date must be before end date."
+
+def test_warm_queries_are_fast():
+    output = io.StringIO()
+    shell = DateCalcShell(DefaultRunner(), io.StringIO(), output)
+    shell.onecmd("calc 06-10-2025 25 business")
+    started = time.perf_counter()
+    for _ in range(1000):
+        shell.onecmd("calc 06-10-2025 25 business")
+    # generous bound for slow CI machines; typically a few microseconds per query
+    assert (time.perf_counter() - started) / 1000 < 1e-3
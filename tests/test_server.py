@@ -0,0 +1,110 @@
+import asyncio
+import http.client
+import json
+import socket
+import threading
+import time
+import pytest
+
+from date_calc.client import DateCalcClient, RemoteRunner
+from date_calc.server import DateCalcServer, answer
+from date_calc.runner import DefaultRunner
+from date_calc.utils.parsing import DateParser
+
+@pytest.fixture(scope='module')
+def server(tmp_path_factory):
+    server = DateCalcServer(tmp_path_factory.mktemp('serve') / 'dtcalc.sock', http_port=0)
+    loop = asyncio.new_event_loop()
+    loop.run_until_complete(server.start())
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    yield server
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.run_until_complete(server.close())
+    loop.close()
+
+def test_answer():
+    runner, parse = DefaultRunner(), DateParser()
+    assert answer({"id": 7, "operation": "calc", "date": "06-10-2025", "interval": 25, "type_of_days": "business"}, runner, parse)["result"] == "10-11-2025"
+    assert answer({"operation": "is_business_day", "date": "2025-10-18"}, runner, parse)["result"] is False
+    assert answer({"operation": "diff", "date": "02-01-2025", "end_date": "01-01-2025"}, runner, parse)["error"]["code"] == "start_after_end"
+    assert answer({"operation": "sum", "date": "01-01-2025"}, runner, parse)["error"]["code"] == "invalid_value"
+    assert answer([1, 2], runner, parse)["error"]["code"] == "invalid_query"
+
+def test_socket_queries_are_pipelined_in_order(server):
+    queries = [{"id": i, "operation": "calc", "date": "01-01-2025", "interval": i} for i in range(1000)]
+    with DateCalcClient(server.socket_path) as client:
+        answers = list(client.query_many(queries + ["not a query"], window=300))
+        assert [a["id"] for a in answers[:-1]] == list(range(1000))
+        assert answers[999]["result"] == "27-09-2027"
+        assert answers[-1]["error"]["code"] == "invalid_query"
+        assert client.query({"operation": "diff", "date": "01-01-2025", "end_date": "01-02-2025", "type_of_days": "business"})["result"] == 23
+
+def test_remote_runner_matches_the_local_runner(server):
+    from datetime import datetime, timedelta
+
+    local, remote = DefaultRunner(), RemoteRunner.connect(server.socket_path)
+    for args in [(datetime(2025, 1, 30), timedelta(days=5)), (datetime(2025, 10, 6), timedelta(days=25), "business")]:
+        assert remote.sum(*args) == local.sum(*args)
+        assert remote.sum_record(*args) == local.sum_record(*args)
+    assert remote.diff(datetime(2025, 1, 2), datetime(2025, 1, 1)) == local.diff(datetime(2025, 1, 2), datetime(2025, 1, 1))
+    assert RemoteRunner.connect(server.socket_path.with_name('missing.sock')) is None
+
+def test_http(server):
+    connection = http.client.HTTPConnection(*server.http_address)
+    connection.request('GET', '/calc?date=01-01-2025&interval=5')
+    response = connection.getresponse()
+    assert (response.status, json.loads(response.read())["result"]) == (200, "06-01-2025")
+    connection.request('POST', '/', body=json.dumps({"operation": "diff", "date": "01-01-2025", "end_date": "01-01-2025"}))
+    response = connection.getresponse()
+    assert (response.status, json.loads(response.read())["error"]["code"]) == (400, "same_dates")
+    connection.request('GET', '/nothing')
+    assert connection.getresponse().status == 404
+
+def test_concurrent_clients_latency(server):
+    latencies = []
+
+    def client() -> None:
+        with DateCalcClient(server.socket_path) as connection:
+            for i in range(200):
+                start = time.perf_counter()
+                connection.query({"operation": "calc", "date": "06-10-2025", "interval": i, "type_of_days": "business"})
+                latencies.append(time.perf_counter() - start)
+
+    threads = [threading.Thread(target=client) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    latencies.sort()
+    assert len(latencies) == 800
+    # generous bound for shared CI machines; see benchmarks/bench_server.py for the figures
+    assert latencies[int(len(latencies) * 0.99)] < 0.05
+
+def test_start_refuses_a_socket_in_use(server):
+    other = DateCalcServer(server.socket_path)
+    with pytest.raises(OSError, match="already listening"):
+        asyncio.run(other.start())
+    with DateCalcClient(server.socket_path) as client:
+        assert client.query({"operation": "is_business_day", "date": "17-10-2025"})["result"] is True
+
+def test_start_replaces_a_stale_socket(tmp_path):
+    path = tmp_path / 'dtcalc.sock'
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(str(path))
+    stale.close()  # the file stays, with nobody listening
+
+    async def start_and_query():
+        server = DateCalcServer(path)
+        await server.start()
+        try:
+            reader, writer = await asyncio.open_unix_connection(str(path))
+            writer.write(b'{"operation": "is_business_day", "date": "18-10-2025"}\n')
+            result = json.loads(await reader.readline())["result"]
+            writer.close()
+            return result
+        finally:
+            await server.close()
+
+    assert asyncio.run(start_and_query()) is False
@@ -0,0 +1,76 @@
+import json
+import os
+import subprocess
+import sys
+import textwrap
+
+# Import-time budget of the CLI, in microseconds, as measured by `python -X importtime`
+# (which itself adds some overhead). The best of a few runs is compared, to filter out
+# scheduling noise. Override with DTCALC_IMPORT_BUDGET_US on slow machines.
+IMPORT_BUDGET_US = int(os.environ.get("DTCALC_IMPORT_BUDGET_US", 150_000))
+IMPORT_RUNS = 3
+
+# what `calc`/`diff` must not import: the GUI, settings, i18n compilation and rich rendering
+DEFERRED_MODULES = {"ttkbootstrap", "tkinter", "PIL", "pystray", "dynaconf", "polib", "pytz", "rich", "numpy"}
+
+def _importtime(code: str) -> dict[str, int]:
+    """Run `code` in a new interpreter; return the cumulative import time of each module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True, check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:"):
+            _, cumulative, name = line.split("|")
+            if cumulative.strip().isdigit():
+                times[name.strip()] = int(cumulative)
+    return times
+
+def test_calc_and_diff_do_not_import_deferred_modules():
+    times = _importtime(
+        "import sys\n"
+        "from date_calc.__main__ import main\n"
+        "for argv in (['calc', '01-01-2025', '5'], ['diff', '01-01-2025', '01-02-2025']):\n"
+        "    sys.argv = ['dtcalc', *argv]\n"
+        "    main()\n"
+    )
+    assert "date_calc.__main__" in times
+    imported = {name.split(".")[0] for name in times}
+    assert imported.isdisjoint(DEFERRED_MODULES), sorted(imported & DEFERRED_MODULES)
+
+def test_cli_import_time_budget():
+    best = min(_importtime("import date_calc.__main__")["date_calc.__main__"] for _ in range(IMPORT_RUNS))
+    assert best <= IMPORT_BUDGET_US, f"{best} us"
+
+def test_core_import_is_side_effect_free():
+    # an audit hook records the I/O of the import; only the module files may be read
+    result = subprocess.run(
+        [sys.executable, "-c", textwrap.dedent("""
+            import builtins, json, locale, sys
+            events = []
+            sys.addaudithook(lambda event, args: events.append([event, str(args[0]) if args else ""]) if event in (
+                "open", "os.putenv", "os.unsetenv", "locale.setlocale", "subprocess.Popen", "socket.connect") else None)
+            hook, modules, current_locale = sys.excepthook, set(sys.modules), locale.setlocale(locale.LC_ALL)
+            import date_calc.utils.date_calculator, date_calc.utils.parsing, date_calc.utils.formatting
+            print(json.dumps({
+                "modules": sorted(set(sys.modules) - modules),
+                "events": [e for e in events if not e[1].endswith((".py", ".pyc", ".so"))],
+                "excepthook": sys.excepthook is hook,
+                "gettext": hasattr(builtins, "_"),
+                "locale": locale.setlocale(locale.LC_ALL) == current_locale,
+            }))
+        """)],
+        capture_output=True, text=True, check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+    report = json.loads(result.stdout)
+    assert report["events"] == []
+    assert (report["excepthook"], report["gettext"], report["locale"]) == (True, False, True)
+    assert {name for name in report["modules"] if name.startswith("date_calc")} == {
+        "date_calc", "date_calc.utils", "date_calc.utils.business_calendar", "date_calc.utils.date_column",
+        "date_calc.utils.date_calculator", "date_calc.utils.formatting", "date_calc.utils.parsing",
+    }
+    imported = {name.split(".")[0] for name in report["modules"]}
+    assert imported.isdisjoint(DEFERRED_MODULES | {"gettext", "logging", "pathlib", "sqlite3"}), sorted(imported)
@@ -0,0 +1,92 @@
+import builtins
+import shutil
+import threading
+from pathlib import Path
+
+import pytest
+
+from date_calc.translate import translate
+from date_calc.translate.translate import CATALOGS, CatalogRegistry, _DEFAULT_LOCALES_PATH, translate_with_gettext
+
+
+@pytest.fixture
+def localedir(tmp_path: Path) -> Path:
+    for lang in ("pt_BR", "es_ES"):
+        folder = tmp_path.joinpath(lang, "LC_MESSAGES")
+        folder.mkdir(parents=True)
+        shutil.copy(_DEFAULT_LOCALES_PATH.joinpath("pt_BR", "LC_MESSAGES", "app.mo"), folder)
+    return tmp_path
+
+
+@pytest.fixture
+def loads(monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+    calls = []
+    read_catalog = translate._read_catalog
+
+    def counting_read(path):
+        calls.append(path)
+        return read_catalog(path)
+
+    monkeypatch.setattr(translate, "_read_catalog", counting_read)
+    return calls
+
+
+def test_catalogs_are_loaded_once_and_shared(localedir: Path, loads: list[Path]):
+    registry = CatalogRegistry(localedir)
+    first = registry.get("pt_BR")
+
+    assert registry.get("pt_BR") is first
+    assert registry.gettext("pt_BR")("Calculate") == "Calcular"
+    assert registry.gettext("es_ES")("Calculate") == "Calcular"
+    assert len(loads) == 2
+
+
+def test_languages_are_independent_and_not_installed(localedir: Path):
+    registry = CatalogRegistry(localedir)
+    pt_br, en_us = registry.gettext("pt_BR"), registry.gettext("en_US")
+
+    assert (pt_br("Calculate"), en_us("Calculate")) == ("Calcular", "Calculate")
+    assert not hasattr(builtins, "_")
+
+
+def test_missing_language(localedir: Path, loads: list[Path]):
+    registry = CatalogRegistry(localedir)
+
+    assert registry.gettext("en_US")("Clear") == "Clear"
+    with pytest.raises(FileNotFoundError):
+        registry.get("en_US", fallback=False)
+    assert loads == []
+
+
+def test_clear_reloads(localedir: Path, loads: list[Path]):
+    registry = CatalogRegistry(localedir)
+    first = registry.get("pt_BR")
+    registry.clear()
+
+    assert registry.get("pt_BR") is not first
+    assert len(loads) == 2
+
+
+def test_concurrent_first_use_loads_once(localedir: Path, loads: list[Path]):
+    registry = CatalogRegistry(localedir)
+    barrier = threading.Barrier(8)
+    results = []
+
+    def worker():
+        barrier.wait()
+        results.append(registry.get("pt_BR"))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(loads) == 1
+    assert all(result is results[0] for result in results)
+
+
+def test_translate_with_gettext_uses_the_shared_catalog():
+    assert translate_with_gettext("pt_BR") is CATALOGS.get("pt_BR")
+    with pytest.raises(FileNotFoundError):
+        translate_with_gettext("en_US")
@@ -0,0 +1,137 @@
+import pytest
+from datetime import date, datetime
+
+np = pytest.importorskip("numpy")
+
+from date_calc.utils.business_calendar import BusinessCalendar
+from date_calc.utils.date_calculator import DateCalculator
+from date_calc.utils.vectorized import from_ordinals, to_ordinals
+
+CALENDAR = BusinessCalendar([date(2025, 1, 1), date(2025, 3, 3), date(2025, 3, 4), date(2025, 4, 18)])
+
+@pytest.fixture(scope='module')
+def rows():
+    rng = np.random.default_rng(1234)
+    starts = rng.integers(date(2024, 10, 1).toordinal(), date(2025, 6, 1).toordinal(), size=500)
+    ends = starts + rng.integers(-30, 400, size=500)
+    intervals = rng.integers(-60, 60, size=500)
+    return starts, ends, intervals
+
+def test_ordinal_round_trip():
+    ordinals = np.array([1, date(1970, 1, 1).toordinal(), date(2025, 10, 17).toordinal()])
+    dates = from_ordinals(ordinals)
+    assert dates.dtype == np.dtype('datetime64[D]')
+    assert dates.tolist() == [date.fromordinal(int(o)) for o in ordinals]
+    assert to_ordinals(dates).tolist() == ordinals.tolist()
+    assert DateCalculator.add_days_batch(dates, 1).dtype == np.dtype('datetime64[D]')
+
+def test_add_days_batch(rows):
+    starts, _, intervals = rows
+    result = DateCalculator.add_days_batch(starts, intervals)
+    expected = [DateCalculator.add_days(datetime.fromordinal(int(s)), int(i)).toordinal() for s, i in zip(starts, intervals)]
+    assert result.tolist() == expected
+
+def test_date_difference_batch_with_datetime64(rows):
+    starts, ends, _ = rows
+    as_dt64 = lambda o: (o - date(1970, 1, 1).toordinal()).astype('datetime64[D]')
+    result = DateCalculator.date_difference_batch(as_dt64(starts), as_dt64(ends))
+    expected = [DateCalculator.date_difference(date.fromordinal(int(s)), date.fromordinal(int(e))) for s, e in zip(starts, ends)]
+    assert result.tolist() == expected
+
+@pytest.mark.parametrize("calendar", [BusinessCalendar(), CALENDAR])
+def test_business_days_batch(rows, calendar):
+    starts, ends, _ = rows
+    result = DateCalculator.business_days_batch(initial_dates=starts, final_dates=ends, calendar=calendar)
+    expected = [
+        DateCalculator.business_days(initial_date=date.fromordinal(int(s)), final_date=date.fromordinal(int(e)), calendar=calendar)
+        for s, e in zip(starts, ends)
+    ]
+    assert result.tolist() == expected
+
+@pytest.mark.parametrize("calendar", [BusinessCalendar(), CALENDAR])
+@pytest.mark.parametrize("type_of_days", ["business", "consecutive"])
+def test_new_date_with_interval_of_days_batch(rows, calendar, type_of_days):
+    starts, _, intervals = rows
+    result = DateCalculator.new_date_with_interval_of_days_batch(
+        initial_dates=starts, intervals=intervals, type_of_days=type_of_days, calendar=calendar
+    )
+    expected = [
+        DateCalculator.new_date_with_interval_of_days(
+            initial_date=date.fromordinal(int(s)), interval=int(i), type_of_days=type_of_days, calendar=calendar
+        ).toordinal()
+        for s, i in zip(starts, intervals)
+    ]
+    assert result.tolist() == expected
+
+def test_batch_rejects_other_dtypes():
+    with pytest.raises(TypeError):
+        DateCalculator.date_difference_batch(np.array(['2025-01-01']), np.array(['2025-01-02']))
+
+def test_batch_with_business_day_index(rows):
+    from date_calc.utils.business_index import BusinessDayIndex
+
+    starts, ends, intervals = rows
+    index = BusinessDayIndex.build(CALENDAR, date(2024, 1, 1), date(2026, 12, 31))
+    assert (
+        DateCalculator.business_days_batch(initial_dates=starts, final_dates=ends, calendar=index).tolist()
+        == DateCalculator.business_days_batch(initial_dates=starts, final_dates=ends, calendar=CALENDAR).tolist()
+    )
+    assert (
+        DateCalculator.new_date_with_interval_of_days_batch(
+            initial_dates=starts, intervals=intervals * 10, type_of_days="business", calendar=index
+        ).tolist()
+        == DateCalculator.new_date_with_interval_of_days_batch(
+            initial_dates=starts, intervals=intervals * 10, type_of_days="business", calendar=CALENDAR
+        ).tolist()
+    )
+
+@pytest.mark.parametrize("weekmask", ["1111110", "Sun Mon Tue Wed Thu", "1000001"])
+def test_batch_with_weekmask(rows, weekmask):
+    starts, ends, intervals = rows
+    calendar = CALENDAR.with_weekmask(weekmask)
+    counts = DateCalculator.business_days_batch(initial_dates=starts, final_dates=ends, weekmask=weekmask, calendar=CALENDAR)
+    dates = DateCalculator.new_date_with_interval_of_days_batch(
+        initial_dates=starts, intervals=intervals, type_of_days="business", calendar=CALENDAR, weekmask=weekmask
+    )
+    for s, e, i, count, new_date in zip(starts, ends, intervals, counts, dates):
+        start = date.fromordinal(int(s))
+        assert count == calendar.business_days_between(start, date.fromordinal(int(e)))
+        assert new_date == calendar.add_business_days(start, int(i)).toordinal()
+
+@pytest.mark.parametrize("roll", [None, "following", "modified_following", "preceding", "modified_preceding"])
+@pytest.mark.parametrize("end_of_month", [False, True])
+def test_add_months_batch(roll, end_of_month):
+    starts = np.arange(date(2023, 12, 1).toordinal(), date(2025, 3, 1).toordinal(), 3)
+    months = np.resize(np.arange(-15, 16), starts.size)
+    result = DateCalculator.add_months_batch(starts, months, roll=roll, end_of_month=end_of_month, calendar=CALENDAR)
+    expected = [
+        DateCalculator.add_months(date.fromordinal(int(s)), int(m), roll=roll, end_of_month=end_of_month, calendar=CALENDAR).toordinal()
+        for s, m in zip(starts, months)
+    ]
+    assert result.tolist() == expected
+
+def test_add_months_batch_builds_a_schedule():
+    schedule = DateCalculator.add_months_batch(np.datetime64('2025-01-31'), np.arange(1, 13), roll="modified_following", calendar=CALENDAR)
+    assert schedule.dtype == np.dtype('datetime64[D]')
+    assert schedule.tolist()[:3] == [date(2025, 2, 28), date(2025, 3, 31), date(2025, 4, 30)]
+    assert DateCalculator.add_years_batch(np.array([date(2024, 2, 29).toordinal()]), 1).tolist() == [date(2025, 2, 28).toordinal()]
+
+def test_difference_matrix_matches_scalar_calls(rows):
+    starts, ends, _ = rows
+    starts, ends = starts[:40], ends[:30]
+    consecutive = DateCalculator.difference_matrix(starts, from_ordinals(ends))
+    business = DateCalculator.difference_matrix(from_ordinals(starts), ends, "business", calendar=CALENDAR)
+    assert consecutive.shape == business.shape == (40, 30)
+    for i, s in enumerate(starts):
+        for j, e in enumerate(ends):
+            start, end = date.fromordinal(int(s)), date.fromordinal(int(e))
+            assert consecutive[i, j] == DateCalculator.date_difference(start, end)
+            assert business[i, j] == DateCalculator.business_days(initial_date=start, final_date=end, calendar=CALENDAR)
+
+def test_iter_difference_matrix_blocks(rows):
+    starts, ends, _ = rows
+    blocks = list(DateCalculator.iter_difference_matrix(starts, ends[:7], "business", block_rows=64, calendar=CALENDAR))
+    assert [len(block) for block in blocks] == [64] * 7 + [52]
+    np.testing.assert_array_equal(np.vstack(blocks), DateCalculator.difference_matrix(starts, ends[:7], "business", calendar=CALENDAR))
+    with pytest.raises(ValueError):
+        DateCalculator.iter_difference_matrix(starts, ends, "weekly")